@@ -0,0 +1,304 @@
+"""
+Benchmark harness comparing the paired Pandas and Polars solutions of the repository.
+
+Every solution script is executed in a fresh Python process (so the peak RSS of one engine never
+pollutes the other one) with a number of warmup runs followed by the measured repetitions.
+For each repetition the wall time and the CPU time are recorded, the peak resident set size (RSS)
+is recorded once per process.
+
+The results are written as JSON and CSV files and a comparison table is printed.
+
+Usage:
+    python run_benchmarks.py
+    python run_benchmarks.py --warmup 1 --repetitions 10 --cases joins/movies_with_genres sql_context
+    python run_benchmarks.py --cache-mode warm --output-dir /tmp/benchmark_results
+    python run_benchmarks.py --data-dir ../data/scaled/x100
+"""
+import os
+import io
+import re
+import sys
+import csv
+import json
+import time
+import runpy
+import argparse
+import resource
+import statistics
+import subprocess
+import contextlib
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+ENGINES = ("pandas", "polars")
+
+# name of the benchmark case -> the paired solutions (relative to the `src` folder)
+BENCHMARK_CASES = {
+    "joins/movies_with_genres": {
+        "pandas": "joins/pandas/movies_with_genres.py",
+        "polars": "joins/polars/movies_with_genres.py",
+    },
+    "joins/movie_cast_and_filmography": {
+        "pandas": "joins/pandas/movie_cast_and_filmography.py",
+        "polars": "joins/polars/movie_cast_and_filmography.py",
+    },
+    "shifting/seat_reservations": {
+        "pandas": "further_topics/shifting/pandas/seat_reservations.py",
+        "polars": "further_topics/shifting/polars/seat_reservations.py",
+    },
+    "file_formats/json_flattening": {
+        "pandas": "further_topics/handling_file_formats/json/pandas/json_flattening.py",
+        "polars": "further_topics/handling_file_formats/json/polars/json_flattening.py",
+    },
+    # the Polars round-trip also writes the movie_genre.parquet file queried by the Polars SQL example
+    "file_formats/parquet_round_trip": {
+        "pandas": "further_topics/handling_file_formats/parquet/pandas/writing_reading_parquet.py",
+        "polars": "further_topics/handling_file_formats/parquet/polars/writing_reading_parquet.py",
+    },
+    "file_formats/parquet_selective_read": {
+        "pandas": "further_topics/handling_file_formats/parquet/pandas/selective_read_benchmark.py",
+        "polars": "further_topics/handling_file_formats/parquet/polars/selective_read_benchmark.py",
+    },
+    "file_formats/orc_vs_parquet": {
+        "pandas": "further_topics/handling_file_formats/orc/pandas/orc_vs_parquet.py",
+        "polars": "further_topics/handling_file_formats/orc/polars/orc_vs_parquet.py",
+    },
+    "sql_context": {
+        "pandas": "sql_context/duckdb/querying_pandas_dataframes.py",
+        "polars": "sql_context/polars/running_sql_queries.py",
+    },
+}
+
+
+def get_peak_rss_bytes() -> int:
+    """
+    Return the peak resident set size of the current process in bytes.
+
+    `ru_maxrss` is reported in kilobytes on Linux and in bytes on macOS.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def reset_data_provider_caches() -> None:
+    """
+    Empty the in-process registry and the on-disk cache of the data provider (if the script imported it),
+    so every repetition has to parse the JSON files again.
+    """
+    movie_data_provider = sys.modules.get("movie_data_provider")
+    if movie_data_provider is not None:
+        movie_data_provider.dataframe_registry.clear()
+        movie_data_provider.MovieDataProvider.clear_cache()
+
+
+def run_script(path_to_script: str) -> None:
+    """
+    Execute a solution script as `__main__` from its own directory, discarding its output.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        runpy.run_path(path_to_script, run_name="__main__")
+
+
+def measure_script(path_to_script: str, warmup: int, repetitions: int, cache_mode: str) -> Dict[str, Any]:
+    """
+    Run a solution script `warmup` + `repetitions` times in the current process and measure the repetitions.
+
+    :param path_to_script: Absolute path of the solution script.
+    :param warmup: Number of unmeasured runs (imports, file system caches, ...).
+    :param repetitions: Number of measured runs.
+    :param cache_mode: `cold` empties the data provider caches before each run, `warm` keeps them.
+    :return: The wall and CPU times of the repetitions (in seconds) and the peak RSS (in bytes).
+    """
+    os.chdir(os.path.dirname(path_to_script))
+    sys.path.insert(0, os.path.dirname(path_to_script))
+
+    wall_times, cpu_times = [], []
+    for run_number in range(warmup + repetitions):
+        if cache_mode == "cold":
+            reset_data_provider_caches()
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        run_script(path_to_script)
+        wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+        if run_number >= warmup:
+            wall_times.append(wall_time)
+            cpu_times.append(cpu_time)
+
+    return {
+        "wall_times": wall_times,
+        "cpu_times": cpu_times,
+        "peak_rss_bytes": get_peak_rss_bytes()
+    }
+
+
+def run_benchmark(case_name: str, engine: str, warmup: int, repetitions: int, cache_mode: str,
+                  timeout: Optional[float] = None, data_directory: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Benchmark one solution of a case in a dedicated Python process.
+
+    :param data_directory: Directory the data provider loads the files from (e.g. a scaled dataset generated by
+        `data_generators/movie_data_scaler.py`). Defaults to the `data` folder.
+    :return: A result record (see `summarize`), containing an `error` entry if the script failed.
+    """
+    path_to_script = os.path.join(SRC_PATH, BENCHMARK_CASES[case_name][engine])
+    command = [sys.executable, os.path.abspath(__file__), "--worker", path_to_script,
+               "--warmup", str(warmup), "--repetitions", str(repetitions), "--cache-mode", cache_mode]
+
+    environment = dict(os.environ)
+    if data_directory:
+        environment["BEAR_MATCHES_DATA_DIR"] = os.path.abspath(data_directory)
+
+    record = {"case": case_name, "engine": engine, "script": BENCHMARK_CASES[case_name][engine]}
+    try:
+        completed_process = subprocess.run(command, capture_output=True, text=True, timeout=timeout, env=environment)
+    except subprocess.TimeoutExpired:
+        record["error"] = f"Timed out after {timeout} seconds"
+        return record
+
+    if completed_process.returncode != 0:
+        record["error"] = get_error_message(completed_process.stderr) or f"Exit code {completed_process.returncode}"
+        return record
+
+    record.update(summarize(json.loads(completed_process.stdout.strip().splitlines()[-1])))
+    return record
+
+
+def get_error_message(stderr: str) -> Optional[str]:
+    """
+    Extract the exception line (e.g. `TypeError: ...`) from the traceback printed by a failed worker.
+    """
+    error_lines = [line for line in stderr.strip().splitlines() if line and not line[0].isspace()]
+    exception_lines = [line for line in error_lines if re.match(r"^[\w.]+(Error|Exception|Warning)\b", line)]
+
+    if exception_lines:
+        return exception_lines[-1]
+    return error_lines[-1] if error_lines else None
+
+
+def summarize(measurements: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reduce the raw measurements of a worker process to summary statistics.
+    """
+    wall_times, cpu_times = measurements["wall_times"], measurements["cpu_times"]
+
+    return {
+        "repetitions": len(wall_times),
+        "wall_time_min_s": min(wall_times),
+        "wall_time_median_s": statistics.median(wall_times),
+        "wall_time_mean_s": statistics.mean(wall_times),
+        "wall_time_stdev_s": statistics.stdev(wall_times) if len(wall_times) > 1 else 0.0,
+        "cpu_time_median_s": statistics.median(cpu_times),
+        "peak_rss_mb": measurements["peak_rss_bytes"] / 1024 ** 2,
+        "wall_times_s": wall_times,
+        "cpu_times_s": cpu_times
+    }
+
+
+def write_results(results: List[Dict[str, Any]], output_dir: str, metadata: Dict[str, Any]) -> None:
+    """
+    Write the benchmark results to `benchmark_results.json` and `benchmark_results.csv`.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    with open(os.path.join(output_dir, "benchmark_results.json"), "w") as file:
+        json.dump({"metadata": metadata, "results": results}, file, indent=2)
+
+    csv_columns = ["case", "engine", "script", "repetitions", "wall_time_min_s", "wall_time_median_s",
+                   "wall_time_mean_s", "wall_time_stdev_s", "cpu_time_median_s", "peak_rss_mb", "error"]
+    with open(os.path.join(output_dir, "benchmark_results.csv"), "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=csv_columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def format_comparison_table(results: List[Dict[str, Any]]) -> str:
+    """
+    Format the median wall time, CPU time and peak RSS of the two engines side by side.
+    """
+    by_case = {}
+    for record in results:
+        by_case.setdefault(record["case"], {})[record["engine"]] = record
+
+    def format_cell(record: Optional[Dict[str, Any]], key: str, unit: str) -> str:
+        if record is None:
+            return "-"
+        if "error" in record:
+            return "failed"
+        return f"{record[key] * (1000 if unit == 'ms' else 1):.1f} {unit}"
+
+    header = (f"{'case':<34}{'pandas wall':>14}{'polars wall':>14}{'speedup':>10}"
+              f"{'pandas cpu':>14}{'polars cpu':>14}{'pandas rss':>14}{'polars rss':>14}")
+    lines = [header, "-" * len(header)]
+    for case_name, records in by_case.items():
+        pandas_record, polars_record = records.get("pandas"), records.get("polars")
+
+        speedup = "-"
+        if pandas_record and polars_record and "error" not in pandas_record and "error" not in polars_record:
+            speedup = f"{pandas_record['wall_time_median_s'] / polars_record['wall_time_median_s']:.2f}x"
+
+        lines.append(f"{case_name:<34}"
+                     f"{format_cell(pandas_record, 'wall_time_median_s', 'ms'):>14}"
+                     f"{format_cell(polars_record, 'wall_time_median_s', 'ms'):>14}"
+                     f"{speedup:>10}"
+                     f"{format_cell(pandas_record, 'cpu_time_median_s', 'ms'):>14}"
+                     f"{format_cell(polars_record, 'cpu_time_median_s', 'ms'):>14}"
+                     f"{format_cell(pandas_record, 'peak_rss_mb', 'MB'):>14}"
+                     f"{format_cell(polars_record, 'peak_rss_mb', 'MB'):>14}")
+
+    failures = [f"  {record['case']} ({record['engine']}): {record['error']}" for record in results if "error" in record]
+    if failures:
+        lines += ["", "Failures:"] + failures
+
+    return "\n".join(lines)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the paired Pandas and Polars solutions.")
+    parser.add_argument("--cases", nargs="+", choices=list(BENCHMARK_CASES), default=list(BENCHMARK_CASES),
+                        help="The benchmark cases to run (default: all of them).")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--warmup", type=int, default=1, help="Number of unmeasured runs per script.")
+    parser.add_argument("--repetitions", type=int, default=5, help="Number of measured runs per script.")
+    parser.add_argument("--cache-mode", choices=("cold", "warm"), default="cold",
+                        help="cold: the data provider caches are emptied before every run (default), "
+                             "warm: the cached DataFrames are reused.")
+    parser.add_argument("--data-dir", default=None,
+                        help="Load the data files from this directory, e.g. a scaled dataset (default: src/data).")
+    parser.add_argument("--timeout", type=float, default=None, help="Time limit of a single script in seconds.")
+    parser.add_argument("--output-dir", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "results"))
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+
+    if arguments.worker:
+        measurements = measure_script(arguments.worker, arguments.warmup, arguments.repetitions, arguments.cache_mode)
+        print(json.dumps(measurements))
+        sys.exit(0)
+
+    benchmark_results = []
+    for case in arguments.cases:
+        for engine_name in arguments.engines:
+            print(f"Running {case} ({engine_name})...", file=sys.stderr)
+            benchmark_results.append(run_benchmark(case, engine_name, arguments.warmup, arguments.repetitions,
+                                                   arguments.cache_mode, arguments.timeout, arguments.data_dir))
+
+    run_metadata = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "warmup": arguments.warmup,
+        "repetitions": arguments.repetitions,
+        "cache_mode": arguments.cache_mode,
+        "data_dir": os.path.abspath(arguments.data_dir) if arguments.data_dir else None
+    }
+    write_results(benchmark_results, arguments.output_dir, run_metadata)
+
+    print(format_comparison_table(benchmark_results))
+    print(f"\nResults written to {arguments.output_dir}")
@@ -0,0 +1,289 @@
+"""
+Moving DataFrames between pandas, Polars, PyArrow and DuckDB through Arrow, with accounting of the copied bytes.
+
+All the conversions go through Arrow tables, which every library can take over without copying its buffers when
+the memory layout matches:
+- pandas <-> Arrow: `pa.Table.from_pandas` reuses the NumPy buffers of numeric columns without missing values and
+  the buffers of `pd.ArrowDtype` columns, `to_pandas(types_mapper=pd.ArrowDtype)` wraps the Arrow buffers as they are,
+- Polars <-> Arrow: `pl.from_arrow` and `to_arrow(compat_level=pl.CompatLevel.newest())` share the buffers, except
+  for the Arrow types Polars stores differently (e.g. `large_string` columns are converted to string views),
+- DuckDB scans registered Arrow tables in place, the results of a query are always new buffers.
+
+`DataFrameInterchange` records a `ConversionReport` of every conversion: the bytes of the converted DataFrame and the
+bytes of them that are not shared with the source, i.e. were copied. The buffers are compared by their memory
+address, a buffer of the result lying within a buffer of the source counts as shared. Set `max_copied_bytes` to raise
+a `DataCopiedError` when a conversion copies more, to catch accidental materializations in mixed-engine pipelines.
+"""
+import duckdb
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Union
+
+Frame = Union[pd.DataFrame, pl.DataFrame, pa.Table, duckdb.DuckDBPyRelation]
+ENGINES = ('pandas', 'polars', 'arrow', 'duckdb')
+
+
+class DataCopiedError(RuntimeError):
+    """
+    Raised when a conversion copies more bytes than allowed by `DataFrameInterchange.max_copied_bytes`.
+    """
+
+
+class ConversionReport(NamedTuple):
+    source_engine: str
+    target_engine: str
+    total_bytes: int
+    copied_bytes: int
+
+    @property
+    def copied_percent(self) -> float:
+        return 100 * self.copied_bytes / self.total_bytes if self.total_bytes else 0.0
+
+
+def get_engine(frame: Frame) -> str:
+    """
+    Return the engine of a DataFrame: `pandas`, `polars`, `arrow` or `duckdb`.
+    """
+    if isinstance(frame, pd.DataFrame):
+        return 'pandas'
+    if isinstance(frame, pl.DataFrame):
+        return 'polars'
+    if isinstance(frame, (pa.Table, pa.RecordBatch)):
+        return 'arrow'
+    if isinstance(frame, duckdb.DuckDBPyRelation):
+        return 'duckdb'
+
+    raise TypeError(f"Unsupported DataFrame type: {type(frame).__name__}")
+
+
+def get_buffers(frame: Frame) -> Dict[int, int]:
+    """
+    Return the memory buffers holding the data of a DataFrame, as a mapping of their address to their size in bytes.
+
+    Arrow tables and Polars DataFrames (exported to Arrow, which does not copy) report their Arrow buffers. pandas
+    DataFrames report the NumPy arrays of their columns, the Arrow buffers of their Arrow-backed columns and, for
+    `object` columns, the pointer array with the size of the Python objects it refers to. DuckDB relations are not
+    materialized, they hold no buffers.
+    """
+    engine = get_engine(frame)
+    if engine == 'duckdb':
+        return {}
+    if engine == 'polars':
+        frame = frame.to_arrow(compat_level=pl.CompatLevel.newest())
+    if engine == 'pandas':
+        buffers = {}
+        for _, column in frame.items():
+            buffers.update(_get_pandas_column_buffers(column))
+        return buffers
+
+    return _get_arrow_buffers(frame.columns)
+
+
+def count_copied_bytes(source_buffers: Dict[int, int], target_buffers: Dict[int, int]) -> int:
+    """
+    Count the bytes of the target buffers that do not lie within one of the source buffers.
+    """
+    ranges = sorted(source_buffers.items())
+    starts = [address for address, _ in ranges]
+
+    copied_bytes = 0
+    for address, size in target_buffers.items():
+        position = bisect_right(starts, address) - 1
+        if position < 0 or address + size > ranges[position][0] + ranges[position][1]:
+            copied_bytes += size
+
+    return copied_bytes
+
+
+class DataFrameInterchange:
+    """
+    Converts DataFrames between pandas, Polars, PyArrow and DuckDB through Arrow and records the copied bytes.
+
+    Examples:
+        >>> interchange = DataFrameInterchange()
+        >>> df_movies_pl = interchange.to_polars(df_movies_pd)
+        >>> df_top_movies = interchange.query("SELECT * FROM movies ORDER BY revenue DESC LIMIT 10",
+        ...                                   engine="pandas", movies=df_movies_pl)
+        >>> interchange.get_report()
+    """
+
+    def __init__(self, connection: Optional[duckdb.DuckDBPyConnection] = None, max_copied_bytes: Optional[int] = None):
+        """
+        :param connection: The DuckDB connection the frames are registered in, a new in-memory database by default.
+        :param max_copied_bytes: Raise a `DataCopiedError` when a conversion copies more bytes, None for no limit.
+        """
+        self.connection = connection or duckdb.connect()
+        self.max_copied_bytes = max_copied_bytes
+        self.reports: List[ConversionReport] = []
+
+    def to_arrow(self, frame: Frame) -> pa.Table:
+        """
+        Convert a DataFrame to an Arrow table.
+        """
+        engine = get_engine(frame)
+        if engine == 'pandas':
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+        elif engine == 'polars':
+            table = frame.to_arrow(compat_level=pl.CompatLevel.newest())
+        elif engine == 'duckdb':
+            table = frame.to_arrow_table()
+        else:
+            table = frame if isinstance(frame, pa.Table) else pa.Table.from_batches([frame])
+
+        return self._record(frame, table)
+
+    def to_pandas(self, frame: Frame) -> pd.DataFrame:
+        """
+        Convert a DataFrame to a pandas DataFrame with `pd.ArrowDtype` columns, which keep the Arrow buffers.
+        """
+        if get_engine(frame) == 'pandas':
+            return frame
+
+        return self._record(frame, self._to_arrow_unrecorded(frame).to_pandas(types_mapper=pd.ArrowDtype))
+
+    def to_polars(self, frame: Frame) -> pl.DataFrame:
+        """
+        Convert a DataFrame to a Polars DataFrame.
+        """
+        if get_engine(frame) == 'polars':
+            return frame
+
+        return self._record(frame, pl.from_arrow(self._to_arrow_unrecorded(frame)))
+
+    def to_duckdb(self, frame: Frame, table_name: str) -> duckdb.DuckDBPyRelation:
+        """
+        Register a DataFrame as a view of the DuckDB connection, DuckDB scans its Arrow buffers in place.
+
+        :param frame: The DataFrame.
+        :param table_name: The name of the view in the SQL queries.
+        :return: The relation of the view.
+        """
+        table = self._to_arrow_unrecorded(frame)
+        self.connection.register(table_name, table)
+
+        return self._record(frame, self.connection.table(table_name), total_bytes=0)
+
+    def query(self, sql: str, engine: str = 'arrow', **frames: Frame) -> Frame:
+        """
+        Run a SQL query in DuckDB on the given DataFrames and convert the result to an engine.
+
+        :param sql: The SQL query, the DataFrames are referred to by their keyword name.
+        :param engine: The engine of the result, one of `pandas`, `polars`, `arrow` or `duckdb` (the relation).
+        :param frames: The DataFrames registered as views before running the query.
+        :return: The result of the query.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}. Supported engines: {ENGINES}")
+
+        for table_name, frame in frames.items():
+            self.to_duckdb(frame, table_name)
+        relation = self.connection.sql(sql)
+
+        return {'pandas': self.to_pandas,
+                'polars': self.to_polars,
+                'arrow': self.to_arrow,
+                'duckdb': lambda result: result}[engine](relation)
+
+    def get_report(self) -> pd.DataFrame:
+        """
+        Return the recorded conversions, with their total and copied bytes.
+        """
+        return pd.DataFrame([(*report, round(report.copied_percent, 2)) for report in self.reports],
+                            columns=[*ConversionReport._fields, 'copied_percent'])
+
+    def _to_arrow_unrecorded(self, frame: Frame) -> pa.Table:
+        """
+        Convert a DataFrame to an Arrow table as an intermediate step, recorded as a part of the whole conversion.
+        """
+        reports = self.reports
+        self.reports = []
+        try:
+            return self.to_arrow(frame)
+        finally:
+            self.reports = reports
+
+    def _record(self, source: Frame, target: Frame, total_bytes: Optional[int] = None) -> Frame:
+        target_buffers = get_buffers(target)
+        report = ConversionReport(get_engine(source),
+                                  get_engine(target),
+                                  sum(target_buffers.values()) if total_bytes is None else total_bytes,
+                                  count_copied_bytes(get_buffers(source), target_buffers))
+        self.reports.append(report)
+
+        if self.max_copied_bytes is not None and report.copied_bytes > self.max_copied_bytes:
+            raise DataCopiedError(f"The conversion from {report.source_engine} to {report.target_engine} copied "
+                                  f"{report.copied_bytes} bytes, more than the {self.max_copied_bytes} bytes allowed")
+
+        return target
+
+
+def _get_arrow_buffers(arrays: List[Union[pa.Array, pa.ChunkedArray]]) -> Dict[int, int]:
+    buffers = {}
+    for array in arrays:
+        for chunk in (array.chunks if isinstance(array, pa.ChunkedArray) else [array]):
+            for buffer in chunk.buffers():
+                if buffer is not None and buffer.size:
+                    buffers[buffer.address] = max(buffer.size, buffers.get(buffer.address, 0))
+
+    return buffers
+
+
+def _get_pandas_column_buffers(column: pd.Series) -> Dict[int, int]:
+    array = column.array
+    if isinstance(column.dtype, pd.ArrowDtype) or getattr(column.dtype, 'storage', None) == 'pyarrow':
+        # The Arrow-backed arrays hand out the Arrow data they hold, without copying it
+        return _get_arrow_buffers([array.__arrow_array__()])
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return {**_get_numpy_buffers(array.codes),
+                **_get_pandas_column_buffers(pd.Series(array.categories, copy=False))}
+    if hasattr(array, '_mask'):
+        return {**_get_numpy_buffers(array._data), **_get_numpy_buffers(array._mask)}
+
+    values = np.asarray(array)
+    if values.dtype == object:
+        # The pointer array refers to Python objects, account them along with the pointers
+        return {_get_address(values): int(column.memory_usage(deep=True, index=False))}
+
+    return _get_numpy_buffers(values)
+
+
+def _get_numpy_buffers(values: np.ndarray) -> Dict[int, int]:
+    return {_get_address(values): values.nbytes} if values.nbytes else {}
+
+
+def _get_address(values: np.ndarray) -> int:
+    return values.__array_interface__['data'][0]
+
+
+if __name__ == '__main__':
+    import os
+    import sys
+
+    data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../', 'data_providers'))
+    sys.path.insert(0, data_provider_path)
+    from movie_data_provider import MovieDataProviderForPandas
+
+    df_movies_pd = MovieDataProviderForPandas.load_json_as_dataframe(
+        json_file_name="movies.json",
+        schema_provider=MovieDataProviderForPandas.get_movies_schema,
+        index_column=None)
+
+    interchange = DataFrameInterchange()
+    df_movies_pl = interchange.to_polars(df_movies_pd)
+    table_movies = interchange.to_arrow(df_movies_pl)
+    df_movies_arrow_pd = interchange.to_pandas(table_movies)
+    df_movies_back_pl = interchange.to_polars(df_movies_arrow_pd)
+    df_movies_per_year = interchange.query("""
+        SELECT substr(release_date, 1, 4) AS release_year, count(*) AS number_of_movies
+        FROM movies
+        GROUP BY release_year
+        ORDER BY number_of_movies DESC
+        LIMIT 5
+    """, engine="polars", movies=df_movies_back_pl)
+
+    print(df_movies_per_year)
+    print(interchange.get_report())
+    assert df_movies_back_pl.equals(df_movies_pl)
@@ -0,0 +1,251 @@
+"""
+Generate scaled versions of the movie dataset (movies, genres, movie-genre pairs, actors and movie-actor pairs).
+
+The files of the `data` folder are used as distribution seeds. A dataset with scale factor N contains
+N replicas of the seed data:
+- replica 0 is the seed data itself,
+- every further replica contains the same number of movies and actors with new ids. The movies are sampled
+  (with replacement) from the seed movies and inherit their genres and their cast, so the distribution of the
+  number of genres/actors per movie, the genre co-occurrences and the skew of the genre keys are preserved.
+  The numeric columns are jittered around the sampled values.
+- the cast members are spread over the replicas of the seed actors, so a popular seed actor has popular clones
+  and the skew of the person keys is preserved as well.
+
+The ids of a replica are the seed ids shifted by `replica * (max seed id + 1)`, therefore every movie_id,
+genre_id and person_id of the pair tables refers to an existing movie, genre and actor.
+
+The generation is deterministic: the same seed and scale factor always produce the same dataset.
+
+Usage:
+    python movie_data_scaler.py --scale-factors 10 100 --formats json ndjson parquet orc --seed 42
+
+The datasets are written to `<output dir>/x<scale factor>` (by default `src/data/scaled/x10`, ...) and can be
+loaded through the data provider:
+
+    >>> MovieDataProvider.set_data_directory("../data/scaled/x10")
+    >>> df_movies = MovieDataProviderForPolars.load_json_as_dataframe("movies.json",
+    ...                                                               MovieDataProviderForPolars.get_movies_schema)
+"""
+import os
+import sys
+import argparse
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.orc as orc
+from typing import Dict, List, Tuple
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+
+SEED_DATA_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+DEFAULT_OUTPUT_DIRECTORY = os.path.join(SEED_DATA_DIRECTORY, 'scaled')
+
+SUPPORTED_FORMATS = ("json", "ndjson", "parquet", "orc")
+
+# table name -> schema provider
+TABLES = {
+    "movies": MovieDataProviderForPolars.get_movies_schema,
+    "genres": MovieDataProviderForPolars.get_genres_schema,
+    "movie_genre": MovieDataProviderForPolars.get_movie_genre_schema,
+    "actors": MovieDataProviderForPolars.get_actors_schema,
+    "movie_actor": MovieDataProviderForPolars.get_movie_actor_schema,
+}
+
+
+def load_seed_tables(seed_directory: str) -> Dict[str, pl.DataFrame]:
+    """
+    Load the seed tables with the schemas of the data provider.
+    """
+    return {
+        table_name: pl.read_json(os.path.join(seed_directory, f"{table_name}.json"), schema=schema_provider())
+        for table_name, schema_provider in TABLES.items()
+    }
+
+
+def get_adjacency(parent_ids: np.ndarray, pair_table: pl.DataFrame, key_column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a CSR-style adjacency of a pair table (e.g. movie_genre) over the rows of its parent table (e.g. movies).
+
+    :param parent_ids: The ids of the parent table, in the order of its rows.
+    :param pair_table: The pair table.
+    :param key_column: The column of the pair table referring to the parent table.
+    :return: The row positions of the pair table ordered by parent row and the offsets of every parent row,
+        the pairs of parent row i are `positions[offsets[i]:offsets[i + 1]]`.
+    """
+    parent_order = np.argsort(parent_ids, kind="stable")
+    pair_parent_positions = parent_order[np.searchsorted(parent_ids[parent_order], pair_table[key_column].to_numpy())]
+
+    positions = np.argsort(pair_parent_positions, kind="stable")
+    degrees = np.bincount(pair_parent_positions, minlength=len(parent_ids))
+    offsets = np.concatenate(([0], np.cumsum(degrees)))
+
+    return positions, offsets
+
+
+def gather_pairs(source_rows: np.ndarray, positions: np.ndarray, offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Collect the pair rows of the sampled parent rows without a Python loop.
+
+    :return: For every collected pair, the index of the sampled parent (in `source_rows`) and the pair row position.
+    """
+    degrees = offsets[source_rows + 1] - offsets[source_rows]
+    sampled_parent_indexes = np.repeat(np.arange(len(source_rows)), degrees)
+
+    # position of each collected pair within the pairs of its parent
+    pair_ranks = np.arange(degrees.sum()) - np.repeat(np.cumsum(degrees) - degrees, degrees)
+
+    return sampled_parent_indexes, positions[offsets[source_rows][sampled_parent_indexes] + pair_ranks]
+
+
+def jitter(values: np.ndarray, rng: np.random.Generator, relative_scale: float) -> np.ndarray:
+    """
+    Multiply the values by a log-normal noise centered at 1 (zero values remain zero).
+    """
+    return values * rng.lognormal(mean=0.0, sigma=relative_scale, size=len(values))
+
+
+def generate_replica(seed_tables: Dict[str, pl.DataFrame],
+                     replica: int,
+                     scale_factor: int,
+                     rng: np.random.Generator,
+                     genre_adjacency: Tuple[np.ndarray, np.ndarray],
+                     cast_adjacency: Tuple[np.ndarray, np.ndarray]) -> Dict[str, pl.DataFrame]:
+    """
+    Generate one replica of the movies, actors and pair tables (the genres are never replicated).
+    """
+    seed_movies, seed_actors = seed_tables["movies"], seed_tables["actors"]
+    seed_movie_genre, seed_movie_actor = seed_tables["movie_genre"], seed_tables["movie_actor"]
+
+    movie_id_offset = replica * (seed_movies["movie_id"].max() + 1)
+    person_id_offset = seed_actors["person_id"].max() + 1
+
+    seed_movie_ids = seed_movies["movie_id"].to_numpy()
+    movie_ids = seed_movie_ids + movie_id_offset
+
+    # Movies: sampled from the seed movies, with jittered numeric columns
+    source_rows = rng.integers(0, seed_movies.height, seed_movies.height)
+    sampled_movies = seed_movies[source_rows]
+
+    movies = sampled_movies.with_columns(
+        pl.Series("movie_id", movie_ids),
+        pl.Series("budget", np.round(jitter(sampled_movies["budget"].to_numpy(), rng, 0.2))).cast(pl.Int64),
+        pl.Series("revenue", np.round(jitter(sampled_movies["revenue"].to_numpy(), rng, 0.3))).cast(pl.Int64),
+        pl.Series("popularity", np.round(jitter(sampled_movies["popularity"].to_numpy(), rng, 0.3), 6)),
+        pl.Series("runtime", np.clip(sampled_movies["runtime"].to_numpy()
+                                     + rng.integers(-10, 11, seed_movies.height), 0, None)),
+        pl.Series("vote_average", np.round(np.clip(sampled_movies["vote_average"].to_numpy()
+                                                   + rng.normal(0, 0.3, seed_movies.height), 0, 10), 1)),
+        pl.Series("vote_count", np.round(jitter(sampled_movies["vote_count"].to_numpy(), rng, 0.3))).cast(pl.Int64),
+    ).select(seed_movies.columns)
+
+    # Movie-genre pairs: every movie inherits the genres of the seed movie it was sampled from
+    sampled_indexes, pair_rows = gather_pairs(source_rows, *genre_adjacency)
+    movie_genre = pl.DataFrame({
+        "movie_id": movie_ids[sampled_indexes],
+        "genre_id": seed_movie_genre["genre_id"].to_numpy()[pair_rows],
+    }, schema=seed_movie_genre.schema)
+
+    # Actors: one clone of every seed actor, with a name sampled from the seed names
+    actors = pl.DataFrame({
+        "person_id": seed_actors["person_id"].to_numpy() + replica * person_id_offset,
+        "person_name": seed_actors["person_name"][rng.integers(0, seed_actors.height, seed_actors.height)],
+    }, schema=seed_actors.schema)
+
+    # Movie-actor pairs: every movie inherits the cast of the seed movie it was sampled from, each cast member
+    # is one of the clones (picked uniformly) of the seed actor
+    sampled_indexes, pair_rows = gather_pairs(source_rows, *cast_adjacency)
+    sampled_cast = seed_movie_actor[pair_rows]
+    movie_actor = sampled_cast.with_columns(
+        pl.Series("movie_id", movie_ids[sampled_indexes]),
+        pl.Series("person_id", sampled_cast["person_id"].to_numpy()
+                  + rng.integers(0, scale_factor, sampled_cast.height) * person_id_offset),
+    ).select(seed_movie_actor.columns)
+
+    return {"movies": movies, "movie_genre": movie_genre, "actors": actors, "movie_actor": movie_actor}
+
+
+def generate_scaled_tables(seed_tables: Dict[str, pl.DataFrame], scale_factor: int, seed: int) -> Dict[str, pl.DataFrame]:
+    """
+    Generate a dataset with `scale_factor` times the movies and actors of the seed tables.
+
+    :param seed_tables: The seed tables, as returned by `load_seed_tables`.
+    :param scale_factor: The number of replicas (1 returns the seed tables).
+    :param seed: Seed of the random number generator.
+    :return: The scaled tables by table name.
+    """
+    rng = np.random.default_rng(seed)
+    seed_movie_ids = seed_tables["movies"]["movie_id"].to_numpy()
+
+    genre_adjacency = get_adjacency(seed_movie_ids, seed_tables["movie_genre"], "movie_id")
+    cast_adjacency = get_adjacency(seed_movie_ids, seed_tables["movie_actor"], "movie_id")
+
+    replicas = [{table_name: seed_tables[table_name] for table_name in ("movies", "movie_genre", "actors", "movie_actor")}]
+    for replica in range(1, scale_factor):
+        replicas.append(generate_replica(seed_tables, replica, scale_factor, rng, genre_adjacency, cast_adjacency))
+
+    scaled_tables = {table_name: pl.concat([replica_tables[table_name] for replica_tables in replicas])
+                     for table_name in replicas[0]}
+    scaled_tables["genres"] = seed_tables["genres"]
+
+    return scaled_tables
+
+
+def write_table(table: pl.DataFrame, path_without_extension: str, file_format: str) -> str:
+    """
+    Write a table in one of the supported formats and return the path of the written file.
+    """
+    path = f"{path_without_extension}.{file_format}"
+
+    if file_format == "json":
+        table.write_json(path)
+    elif file_format == "ndjson":
+        table.write_ndjson(path)
+    elif file_format == "parquet":
+        table.write_parquet(path, compression="zstd", statistics=True)
+    elif file_format == "orc":
+        arrow_table = table.to_arrow()
+        # the ORC writer of pyarrow does not support the large string type of Polars
+        arrow_table = arrow_table.cast(pa.schema([
+            pa.field(field.name, pa.string() if pa.types.is_large_string(field.type) else field.type)
+            for field in arrow_table.schema
+        ]))
+        orc.write_table(arrow_table, path, compression="zstd")
+    else:
+        raise ValueError(f"Unsupported file format: {file_format}. Supported formats: {SUPPORTED_FORMATS}")
+
+    return path
+
+
+def write_scaled_dataset(scaled_tables: Dict[str, pl.DataFrame], output_directory: str, formats: List[str]) -> None:
+    os.makedirs(output_directory, exist_ok=True)
+
+    for table_name, table in scaled_tables.items():
+        for file_format in formats:
+            path = write_table(table, os.path.join(output_directory, table_name), file_format)
+            print(f"  {path} ({table.height} rows)")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Generate scaled versions of the movie dataset.")
+    parser.add_argument("--scale-factors", nargs="+", type=int, default=[10],
+                        help="Scale factors of the generated datasets (default: 10).")
+    parser.add_argument("--formats", nargs="+", choices=SUPPORTED_FORMATS, default=list(SUPPORTED_FORMATS))
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the random number generator.")
+    parser.add_argument("--seed-dir", default=SEED_DATA_DIRECTORY, help="Directory of the seed JSON files.")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIRECTORY,
+                        help="The datasets are written to <output dir>/x<scale factor>.")
+
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    tables = load_seed_tables(arguments.seed_dir)
+
+    for factor in arguments.scale_factors:
+        print(f"Generating the x{factor} dataset...")
+        write_scaled_dataset(generate_scaled_tables(tables, factor, arguments.seed),
+                             os.path.join(arguments.output_dir, f"x{factor}"),
+                             arguments.formats)
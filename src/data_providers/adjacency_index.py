@@ -0,0 +1,259 @@
+"""
+A compact adjacency index of a pair table (e.g. the movie-genre pairs), in both directions.
+
+"Genres of movie X" and "movies of genre Y" are answered by a join of the whole pair table otherwise. The index
+stores the pairs in the CSR (compressed sparse row) layout, once sorted by each side:
+- the sorted distinct source ids (e.g. movie ids), the offsets of their targets, and the target ids (genre ids)
+  grouped by source id,
+- the same three arrays from the target side (genre ids, offsets, movie ids).
+
+A lookup is a binary search of the requested ids in the sorted distinct ids, then a slice of the grouped ids, so it
+neither scans the pairs nor builds a hash table. The ids are sparse (e.g. about 5,000 movie ids up to 460,000),
+so they are searched instead of being used as array positions, which would take a slot per possible id.
+
+The index is built from the cached pair table and stored in the cache directory as a single `.npy` file, keyed by
+the fingerprint of the JSON file like the other cache files (see `MovieDataProvider.get_cached_file_path`).
+Later loads map the file into memory (`np.load(mmap_mode='r')`): the arrays are views of the mapped file, shared
+by every process using the index.
+"""
+import os
+import numpy as np
+import pandas as pd
+import polars as pl
+from typing import Sequence, Tuple, Union
+
+from movie_data_provider import MovieDataProvider, MovieDataProviderForPolars
+
+# Number of values before the arrays in the stored file: the number of source ids, target ids and pairs
+HEADER_SIZE = 3
+
+
+class AdjacencyIndex:
+    """
+    The pairs of a table as CSR adjacency arrays, from the source ids to the target ids and back.
+
+    Examples:
+        >>> movie_genre_index = AdjacencyIndex.load()
+        >>> movie_genre_index.get_targets(19995)
+        array([12, 14, 28, 878], dtype=int32)
+        >>> df_movies_by_genre = movie_genre_index.lookup_sources([12, 28], engine="polars")
+    """
+
+    def __init__(self, packed_arrays: np.ndarray, source_column: str = 'movie_id', target_column: str = 'genre_id'):
+        """
+        :param packed_arrays: The header and the six arrays of the index, one after the other (see `build`).
+        :param source_column: The name of the source ids in the lookup results.
+        :param target_column: The name of the target ids in the lookup results.
+        """
+        self.packed_arrays = packed_arrays
+        self.source_column = source_column
+        self.target_column = target_column
+
+        source_count, target_count, pair_count = (int(size) for size in packed_arrays[:HEADER_SIZE])
+        sizes = [source_count, source_count + 1, pair_count, target_count, target_count + 1, pair_count]
+        bounds = np.cumsum([HEADER_SIZE] + sizes)
+        (self.source_ids, self.source_offsets, self.targets_by_source,
+         self.target_ids, self.target_offsets, self.sources_by_target) = (
+            packed_arrays[start:end] for start, end in zip(bounds[:-1], bounds[1:]))
+
+    @staticmethod
+    def build(source_ids: np.ndarray,
+              target_ids: np.ndarray,
+              source_column: str = 'movie_id',
+              target_column: str = 'genre_id') -> "AdjacencyIndex":
+        """
+        Build the index of the pairs (source_ids[i], target_ids[i]).
+
+        The ids are stored as 32-bit integers when all the ids and offsets fit, as 64-bit integers otherwise.
+
+        :param source_ids: The source id of every pair.
+        :param target_ids: The target id of every pair.
+        :param source_column: The name of the source ids in the lookup results.
+        :param target_column: The name of the target ids in the lookup results.
+        :return: The index, held in memory.
+        """
+        source_ids, target_ids = np.asarray(source_ids), np.asarray(target_ids)
+        arrays = []
+        for keys, values in ((source_ids, target_ids), (target_ids, source_ids)):
+            order = np.lexsort((values, keys))
+            distinct_keys, starts = np.unique(keys[order], return_index=True)
+            arrays.append((distinct_keys, np.append(starts, len(keys)), values[order]))
+
+        (sorted_sources, source_offsets, targets_by_source), (sorted_targets, target_offsets, sources_by_target) = arrays
+        header = np.array([len(sorted_sources), len(sorted_targets), len(source_ids)])
+        parts = [header, sorted_sources, source_offsets, targets_by_source,
+                 sorted_targets, target_offsets, sources_by_target]
+
+        int32_range = np.iinfo(np.int32)
+        dtype = (np.int32 if all(len(part) == 0 or (part.min() >= int32_range.min and part.max() <= int32_range.max)
+                                 for part in parts) else np.int64)
+
+        return AdjacencyIndex(np.concatenate(parts).astype(dtype), source_column, target_column)
+
+    @staticmethod
+    def load(table: str = 'movie_genre',
+             source_column: str = 'movie_id',
+             target_column: str = 'genre_id') -> "AdjacencyIndex":
+        """
+        Load the index of a pair table from the cache directory, building and storing it first if needed.
+
+        :param table: The pair table, a key of `MovieDataProvider.TABLE_FILES`.
+        :param source_column: The column of the source ids.
+        :param target_column: The column of the target ids.
+        :return: The index, with its arrays mapped from the stored file.
+        """
+        path_to_json_file = MovieDataProvider.get_data_file_path(MovieDataProvider.TABLE_FILES[table])
+        path_to_index_file = MovieDataProvider.get_cached_file_path(
+            path_to_json_file, {source_column: 'source', target_column: 'target'}, file_extension='npy')
+
+        if not os.path.exists(path_to_index_file):
+            df_pairs = MovieDataProviderForPolars.load_json_as_dataframe(
+                MovieDataProvider.TABLE_FILES[table],
+                getattr(MovieDataProviderForPolars, f"get_{table}_schema"))
+            index = AdjacencyIndex.build(df_pairs[source_column].to_numpy(), df_pairs[target_column].to_numpy(),
+                                         source_column, target_column)
+            MovieDataProvider.store_cached_file(path_to_index_file, index.save)
+
+            if not os.path.exists(path_to_index_file):
+                return index
+
+        packed_arrays = np.load(path_to_index_file, mmap_mode='r')
+        os.utime(path_to_index_file)
+
+        return AdjacencyIndex(packed_arrays, source_column, target_column)
+
+    def save(self, path_to_index_file: str) -> None:
+        """
+        Write the index to a `.npy` file (any path, `np.save` would append the extension to a file name).
+        """
+        with open(path_to_index_file, 'wb') as index_file:
+            np.save(index_file, np.ascontiguousarray(self.packed_arrays))
+
+    def get_targets(self, source_id: int) -> np.ndarray:
+        """
+        Return the target ids of a source id (e.g. the genre ids of a movie), a view of the index.
+        """
+        return _get_group(self.source_ids, self.source_offsets, self.targets_by_source, source_id)
+
+    def get_sources(self, target_id: int) -> np.ndarray:
+        """
+        Return the source ids of a target id (e.g. the ids of the movies of a genre), a view of the index.
+        """
+        return _get_group(self.target_ids, self.target_offsets, self.sources_by_target, target_id)
+
+    def get_target_pairs(self, source_ids: Union[Sequence[int], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up the target ids of many source ids at once.
+
+        :param source_ids: The requested source ids.
+        :return: The position of the requested source id and the target id of every pair found, in the order of
+            the requested ids. Gathering the rows of a DataFrame at the positions replaces a join with the pairs.
+        """
+        return _get_groups(self.source_ids, self.source_offsets, self.targets_by_source, source_ids)
+
+    def get_source_pairs(self, target_ids: Union[Sequence[int], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up the source ids of many target ids at once, see `get_target_pairs`.
+        """
+        return _get_groups(self.target_ids, self.target_offsets, self.sources_by_target, target_ids)
+
+    def lookup_targets(self,
+                       source_ids: Union[Sequence[int], np.ndarray],
+                       engine: str = 'pandas') -> Union[pd.DataFrame | pl.DataFrame]:
+        """
+        Return the pairs of the requested source ids, e.g. the genre ids of the movies, as a DataFrame.
+
+        :param source_ids: The requested source ids, the ids not in the index have no rows.
+        :param engine: The type of the result: `pandas` or `polars`.
+        :return: The source and target id columns, in the order of the requested ids.
+        """
+        source_ids = np.asarray(source_ids)
+        positions, target_ids = self.get_target_pairs(source_ids)
+
+        return _to_dataframe({self.source_column: source_ids[positions], self.target_column: target_ids}, engine)
+
+    def lookup_sources(self,
+                       target_ids: Union[Sequence[int], np.ndarray],
+                       engine: str = 'pandas') -> Union[pd.DataFrame | pl.DataFrame]:
+        """
+        Return the pairs of the requested target ids, e.g. the movie ids of the genres, as a DataFrame.
+
+        :param target_ids: The requested target ids, the ids not in the index have no rows.
+        :param engine: The type of the result: `pandas` or `polars`.
+        :return: The target and source id columns, in the order of the requested ids.
+        """
+        target_ids = np.asarray(target_ids)
+        positions, source_ids = self.get_source_pairs(target_ids)
+
+        return _to_dataframe({self.target_column: target_ids[positions], self.source_column: source_ids}, engine)
+
+
+def _get_group(keys: np.ndarray, offsets: np.ndarray, values: np.ndarray, key: int) -> np.ndarray:
+    position = np.searchsorted(keys, key)
+    if position == len(keys) or keys[position] != key:
+        return values[:0]
+
+    return values[offsets[position]:offsets[position + 1]]
+
+
+def _get_groups(keys: np.ndarray,
+                offsets: np.ndarray,
+                values: np.ndarray,
+                requested_keys: Union[Sequence[int], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    requested_keys = np.asarray(requested_keys)
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.intp), values[:0]
+
+    positions = np.minimum(np.searchsorted(keys, requested_keys), len(keys) - 1)
+    is_found = keys[positions] == requested_keys
+
+    starts = np.where(is_found, offsets[positions], 0)
+    counts = np.where(is_found, offsets[positions + 1] - starts, 0)
+
+    # The value positions of every group, one after the other: starts[i], starts[i] + 1, ..., starts[i] + counts[i] - 1
+    request_positions = np.repeat(np.arange(len(requested_keys)), counts)
+    value_positions = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(len(request_positions))
+
+    return request_positions, values[value_positions]
+
+
+def _to_dataframe(columns: dict, engine: str) -> Union[pd.DataFrame | pl.DataFrame]:
+    if engine == 'pandas':
+        return pd.DataFrame(columns)
+    if engine == 'polars':
+        return pl.DataFrame(columns)
+
+    raise ValueError(f"Unsupported engine: {engine}. Use 'pandas' or 'polars'.")
+
+
+
+if __name__ == '__main__':
+    import time
+    from movie_data_provider import MovieDataProviderForPandas
+
+    movie_genre_index = AdjacencyIndex.load()
+
+    # The genre ids of all the movies, from the index and from a join of the movie-genre pairs
+    dataframes = MovieDataProviderForPandas.load_all(["movies", "movie_genre"])
+    df_movies, df_movie_genre = dataframes["movies"], dataframes["movie_genre"]
+    movie_ids = df_movies['movie_id'].to_numpy()
+    df_movie_ids, df_movie_genre_pairs = pl.DataFrame({'movie_id': movie_ids}), pl.from_pandas(df_movie_genre)
+    lookups = {
+        'pandas join': lambda: pd.merge(df_movies[['movie_id']], df_movie_genre[['movie_id', 'genre_id']]),
+        'pandas index': lambda: movie_genre_index.lookup_targets(movie_ids, engine='pandas'),
+        'polars join': lambda: df_movie_ids.join(df_movie_genre_pairs.select('movie_id', 'genre_id'), on='movie_id'),
+        'polars index': lambda: movie_genre_index.lookup_targets(movie_ids, engine='polars'),
+    }
+
+    df_expected = pd.merge(df_movies[['movie_id']], df_movie_genre[['movie_id', 'genre_id']]).astype('int64')
+    df_expected = df_expected.sort_values(['movie_id', 'genre_id'], ignore_index=True)
+    for name, lookup in lookups.items():
+        start = time.perf_counter()
+        for _ in range(10):
+            df_pairs = lookup()
+        elapsed_ms = (time.perf_counter() - start) * 1000 / 10
+
+        if isinstance(df_pairs, pl.DataFrame):
+            df_pairs = df_pairs.to_pandas()
+        df_pairs = df_pairs.astype('int64').sort_values(['movie_id', 'genre_id'], ignore_index=True)
+        print(f"{name}: {elapsed_ms:.3f} ms, same pairs as the join? {df_pairs.equals(df_expected)}")
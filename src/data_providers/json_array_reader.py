@@ -0,0 +1,167 @@
+"""
+Incremental reading of JSON files holding a top-level array of records, with bounded memory.
+
+`json.load` builds the Python objects of the whole file at once, which take many times the size of the file.
+`iter_json_records` decodes the array record by record (`json.JSONDecoder.raw_decode`) from a text buffer that is
+refilled block by block, and yields the records in batches, so the peak memory depends on the batch size only.
+Newline-delimited files (`.ndjson`, `.jsonl`) are read line by line.
+
+The batches are turned into schema-aligned DataFrames by the providers (`iter_json_batches` of
+`MovieDataProviderForPandas` and `MovieDataProviderForPolars`) and can be streamed onward with the sinks of this
+module: `concat_batches`, `write_batches_to_parquet` and `write_batches_to_duckdb`.
+"""
+import json
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+NDJSON_FILE_EXTENSIONS = ('.ndjson', '.jsonl')
+WHITESPACE = ' \t\n\r'
+
+# A record still undecoded after this many blocks is taken as malformed, instead of reading the rest of the file
+MAX_RECORD_BLOCKS = 16
+
+
+def iter_json_records(path_to_json_file: str,
+                      batch_size: int = 100_000,
+                      block_size: int = 1 << 20) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield the records of a JSON array (or NDJSON) file in lists of at most `batch_size` records.
+
+    :param path_to_json_file: The JSON file, holding a top-level array of objects, or an NDJSON file.
+    :param batch_size: The number of records of a batch.
+    :param block_size: The number of characters read from the file at once.
+    :return: An iterator of record batches.
+    :raises ValueError: If the file is not a JSON array, or holds a record that cannot be decoded from
+        `MAX_RECORD_BLOCKS` blocks (a malformed record, or a single record larger than that).
+
+    Examples:
+        >>> for records in iter_json_records("actors.json", batch_size=10_000):
+        ...     print(len(records))
+    """
+    if path_to_json_file.endswith(NDJSON_FILE_EXTENSIONS):
+        yield from _iter_ndjson_records(path_to_json_file, batch_size)
+        return
+
+    decoder = json.JSONDecoder()
+    batch = []
+    with open(path_to_json_file, 'r', encoding='utf-8') as json_file:
+        buffer = json_file.read(block_size).lstrip(WHITESPACE)
+        if not buffer.startswith('['):
+            raise ValueError(f"{path_to_json_file} does not hold a top-level JSON array")
+        position = 1
+        end_of_file = False
+
+        while True:
+            # skip the separators between the records
+            while position < len(buffer) and buffer[position] in WHITESPACE + ',':
+                position += 1
+
+            if position < len(buffer) and buffer[position] == ']':
+                break
+
+            try:
+                record, end_position = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                # the record continues in the next block, unless the file ends or the record is too large
+                if end_of_file or len(buffer) - position >= MAX_RECORD_BLOCKS * block_size:
+                    raise ValueError(f"{path_to_json_file} is not a valid JSON array: {error.msg}") from error
+                block = json_file.read(block_size)
+                end_of_file = not block
+                buffer = buffer[position:] + block
+                position = 0
+                continue
+
+            batch.append(record)
+            position = end_position
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+
+    if batch:
+        yield batch
+
+
+def concat_batches(batches: Iterable[Union[pd.DataFrame | pl.DataFrame]]) -> Union[pd.DataFrame | pl.DataFrame]:
+    """
+    Concatenate the batches into one DataFrame, of the type of the batches.
+    """
+    batches = list(batches)
+    if batches and isinstance(batches[0], pl.DataFrame):
+        return pl.concat(batches, rechunk=True)
+
+    return pd.concat(batches, ignore_index=True)
+
+
+def write_batches_to_parquet(batches: Iterable[Union[pd.DataFrame | pl.DataFrame]],
+                             path_to_parquet_file: str,
+                             compression: str = 'zstd') -> int:
+    """
+    Write the batches to a Parquet file, one row group per batch, holding only one batch in memory at a time.
+
+    :param batches: The pandas or Polars DataFrames, all with the same schema.
+    :param path_to_parquet_file: The Parquet file to write.
+    :param compression: The compression codec of the Parquet file.
+    :return: The number of rows written.
+    """
+    row_count = 0
+    parquet_writer = None
+    try:
+        for batch in batches:
+            table = _to_arrow(batch)
+            if parquet_writer is None:
+                parquet_writer = pq.ParquetWriter(path_to_parquet_file, table.schema, compression=compression)
+            parquet_writer.write_table(table)
+            row_count += table.num_rows
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
+
+    return row_count
+
+
+def write_batches_to_duckdb(batches: Iterable[Union[pd.DataFrame | pl.DataFrame]],
+                            connection,
+                            table_name: str) -> int:
+    """
+    Insert the batches into a DuckDB table, created (or replaced) from the schema of the first batch.
+
+    :param batches: The pandas or Polars DataFrames, all with the same schema.
+    :param connection: The DuckDB connection.
+    :param table_name: The table to create.
+    :return: The number of rows written.
+    """
+    row_count = 0
+    for batch_number, batch in enumerate(batches):
+        connection.register('json_batch', _to_arrow(batch))
+        if batch_number == 0:
+            connection.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM json_batch")
+        else:
+            connection.execute(f"INSERT INTO {table_name} SELECT * FROM json_batch")
+        connection.unregister('json_batch')
+        row_count += len(batch)
+
+    return row_count
+
+
+def _iter_ndjson_records(path_to_ndjson_file: str, batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    with open(path_to_ndjson_file, 'r', encoding='utf-8') as ndjson_file:
+        for line in ndjson_file:
+            if line.strip():
+                batch.append(json.loads(line))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+
+    if batch:
+        yield batch
+
+
+def _to_arrow(batch: Union[pd.DataFrame | pl.DataFrame]) -> pa.Table:
+    if isinstance(batch, pl.DataFrame):
+        return batch.to_arrow()
+
+    return pa.Table.from_pandas(batch, preserve_index=False)
@@ -5,12 +5,110 @@ It defines an abstract base class MovieDataProvider with implementations for bot
 """
 
 import os
+import glob
 import json
+import hashlib
 import inspect
+import threading
+import multiprocessing
+import numpy as np
 import pandas as pd
 import polars as pl
-from typing import List, Dict, Tuple, Optional, Callable, Any, Union
+import pyarrow as pa
+from typing import List, Dict, Tuple, Optional, Callable, Any, Iterator, Union
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from json_array_reader import iter_json_records
+
+
+class DataFrameRegistry:
+    """
+        Process-level, size-bounded LRU registry of the DataFrames loaded by the data providers.
+
+        A long-running process loading the same files over and over again gets the already loaded
+        DataFrames from here instead of reading them again. When the total (estimated) size of the
+        registered DataFrames exceeds `max_size_bytes`, the least recently used ones are evicted.
+
+        The registry only stores the DataFrames, handing them out safely (sharing or copying) is the
+        responsibility of the providers.
+
+        Examples:
+            >>> registry = DataFrameRegistry(max_size_bytes=256 * 1024 ** 2)
+            >>> registry.put(("movies.json",), df_movies, df_movies.estimated_size())
+            >>> registry.get(("movies.json",)) is df_movies
+            True
+            >>> print(registry.get_statistics())
+    """
+
+    def __init__(self, max_size_bytes: int):
+        self.max_size_bytes = max_size_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._frames = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Union[pd.DataFrame | pl.DataFrame]]:
+        """
+        Return the DataFrame registered under the key (marking it as the most recently used one) or None.
+        """
+        with self._lock:
+            if key not in self._frames:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._frames.move_to_end(key)
+            return self._frames[key][0]
+
+    def put(self, key: Tuple, dataframe: Union[pd.DataFrame | pl.DataFrame], size_bytes: int) -> None:
+        """
+        Register a DataFrame and evict the least recently used ones until the size limit is respected.
+        DataFrames larger than the limit itself are not registered.
+        """
+        if size_bytes > self.max_size_bytes:
+            return
+
+        with self._lock:
+            if key in self._frames:
+                self._size_bytes -= self._frames.pop(key)[1]
+
+            self._frames[key] = (dataframe, size_bytes)
+            self._size_bytes += size_bytes
+
+            while self._size_bytes > self.max_size_bytes:
+                _, (_, evicted_size_bytes) = self._frames.popitem(last=False)
+                self._size_bytes -= evicted_size_bytes
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Remove every DataFrame from the registry and reset the counters.
+        """
+        with self._lock:
+            self._frames.clear()
+            self._size_bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Return the hit/miss/eviction counters and the current size of the registry.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._frames),
+                "size_bytes": self._size_bytes,
+                "max_size_bytes": self.max_size_bytes
+            }
+
+
+# The registry shared by every provider of the process.
+dataframe_registry = DataFrameRegistry(max_size_bytes=512 * 1024 ** 2)
 
 
 class MovieDataProvider(ABC):
@@ -21,6 +119,229 @@ class MovieDataProvider(ABC):
        and requires concrete implementations for methods to handle various data operations.
     """
 
+    NDJSON_FILE_EXTENSIONS = ('.ndjson', '.jsonl')
+
+    # The data files are looked up here. Point it to another directory (e.g. a scaled dataset generated by
+    # `data_generators/movie_data_scaler.py`) with `set_data_directory` or the BEAR_MATCHES_DATA_DIR variable.
+    DATA_DIRECTORY = os.path.abspath(os.environ.get(
+        'BEAR_MATCHES_DATA_DIR',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')))
+
+    # Columnar (Arrow IPC) copies of the schema-aligned DataFrames are stored here.
+    CACHE_DIRECTORY = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', '.cache'))
+    CACHE_MAX_SIZE_BYTES = 1024 ** 3
+
+    # The data files of the tables, by table name.
+    TABLE_FILES = {
+        "movies": "movies.json",
+        "genres": "genres.json",
+        "movie_genre": "movie_genre.json",
+        "actors": "actors.json",
+        "movie_actor": "movie_actor.json"
+    }
+
+    # Low-cardinality text columns stored dictionary-encoded by the compact schemas, with their vocabulary
+    # if it is fixed (None when new values may show up in the data).
+    LOW_CARDINALITY_COLUMNS = {
+        "movie_status": ["Released", "Rumored", "Post Production"],
+        "genre_name": None
+    }
+
+    # The key columns whose (ascending) sortedness is recorded in the metadata of the cache files.
+    KEY_COLUMNS = ("movie_id", "genre_id", "person_id")
+    SORTED_COLUMNS_METADATA_KEY = b"sorted_columns"
+
+    @staticmethod
+    def get_data_file_path(file_name: str) -> str:
+        """
+        Resolve the absolute path of a file located in the data directory (`DATA_DIRECTORY`).
+
+        :param file_name: The name of the data file (e.g. `movies.json`).
+        :return: The absolute path of the data file.
+        """
+        return os.path.abspath(os.path.join(MovieDataProvider.DATA_DIRECTORY, file_name))
+
+    @staticmethod
+    def set_data_directory(data_directory: str) -> None:
+        """
+        Load the data files from another directory, e.g. from a scaled dataset.
+
+        The environment variable BEAR_MATCHES_DATA_DIR has the same effect and is inherited by subprocesses.
+
+        :param data_directory: The directory containing the data files.
+
+        Examples:
+            >>> MovieDataProvider.set_data_directory("../data/scaled/x100")
+            >>> df = MovieDataProviderForPolars.load_json_as_dataframe("movies.json",
+            ...                                                        MovieDataProviderForPolars.get_movies_schema)
+        """
+        MovieDataProvider.DATA_DIRECTORY = os.path.abspath(data_directory)
+
+    @staticmethod
+    def get_cached_file_path(path_to_source_file: str,
+                             schema: Dict,
+                             file_extension: str = 'arrow',
+                             sorted_by: Optional[str] = None) -> str:
+        """
+        Build the path of the columnar cache file belonging to a source file and a schema.
+
+        The file name is made of three hashes: the source path, the schema (and the sort column, if any) and
+        the fingerprint (modification time and size) of the source file. A modified source file or a different
+        schema therefore always results in a different cache file.
+
+        :param path_to_source_file: Absolute path of the source (JSON) file.
+        :param schema: The schema the cached DataFrame is aligned to.
+        :param file_extension: Extension of the cache file, `arrow` (Arrow IPC) or `parquet`.
+        :param sorted_by: The column the cached DataFrame is sorted by, None for the order of the source file.
+        :return: The absolute path of the cache file (the file itself may not exist yet).
+        """
+        source_stat = os.stat(path_to_source_file)
+
+        schema_key = sorted((column, str(dtype)) for column, dtype in schema.items())
+        path_hash = hashlib.sha256(path_to_source_file.encode()).hexdigest()[:8]
+        schema_hash = hashlib.sha256(repr((schema_key, sorted_by) if sorted_by else schema_key)
+                                     .encode()).hexdigest()[:8]
+        fingerprint_hash = hashlib.sha256(f"{source_stat.st_mtime_ns}:{source_stat.st_size}"
+                                          .encode()).hexdigest()[:8]
+
+        file_stem = os.path.splitext(os.path.basename(path_to_source_file))[0]
+
+        return os.path.join(MovieDataProvider.CACHE_DIRECTORY,
+                            f"{file_stem}-{path_hash}-{schema_hash}-{fingerprint_hash}.{file_extension}")
+
+    @staticmethod
+    def get_registry_key(path_to_source_file: str,
+                         schema: Dict,
+                         index_column: Optional[str],
+                         load_options: Optional[Dict[str, Any]] = None) -> Tuple:
+        """
+        Build the `dataframe_registry` key of a loaded DataFrame.
+
+        Besides the file, the schema and the index column, the key contains the modification time and size
+        of the file, hence a modified file is never served from the registry.
+
+        :param path_to_source_file: Absolute path of the source (JSON) file.
+        :param schema: The schema the DataFrame is aligned to.
+        :param index_column: The index column of the DataFrame (if any).
+        :param load_options: Further options changing the loaded DataFrame, e.g. `{"compact": True}`.
+        :return: A hashable key.
+        """
+        source_stat = os.stat(path_to_source_file)
+
+        return (path_to_source_file,
+                source_stat.st_mtime_ns,
+                source_stat.st_size,
+                tuple((column, str(dtype)) for column, dtype in schema.items()),
+                index_column,
+                tuple(sorted((load_options or {}).items())))
+
+    @staticmethod
+    def read_sorted_columns(path_to_cached_file: str) -> Optional[List[str]]:
+        """
+        Read the key columns recorded as sorted in the metadata of an Arrow IPC cache file.
+
+        Only the footer of the file is read. The cache file name depends on the fingerprint of the source file,
+        so the recorded sortedness is always the one of the cached data.
+
+        :param path_to_cached_file: The Arrow IPC cache file.
+        :return: The sorted key columns, None if the file has no sort metadata (e.g. written by an older version).
+        """
+        metadata = pa.ipc.open_file(pa.memory_map(path_to_cached_file, 'r')).schema.metadata or {}
+        if MovieDataProvider.SORTED_COLUMNS_METADATA_KEY not in metadata:
+            return None
+
+        return json.loads(metadata[MovieDataProvider.SORTED_COLUMNS_METADATA_KEY])
+
+    @staticmethod
+    def get_table_with_sorted_columns(table: pa.Table, sorted_columns: List[str]) -> pa.Table:
+        """
+        Record the sorted key columns in the schema metadata of an Arrow table, before writing it to the cache.
+        """
+        return table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                              MovieDataProvider.SORTED_COLUMNS_METADATA_KEY:
+                                                  json.dumps(sorted_columns).encode()})
+
+    @staticmethod
+    def invalidate_cached_files(path_to_cached_file: str) -> None:
+        """
+        Remove the cache files that were created for an earlier version of the same source file and schema.
+
+        :param path_to_cached_file: The up-to-date cache file, as returned by `get_cached_file_path`.
+        """
+        cache_file_prefix = path_to_cached_file.rsplit('-', 1)[0]
+        file_extension = os.path.splitext(path_to_cached_file)[1]
+
+        for stale_file in glob.glob(f"{glob.escape(cache_file_prefix)}-*{file_extension}"):
+            if stale_file != path_to_cached_file:
+                try:
+                    os.remove(stale_file)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def store_cached_file(path_to_cached_file: str, writer: Callable[[str], None]) -> None:
+        """
+        Write a cache file atomically, then drop its stale versions and enforce the cache size limit.
+
+        Failing to write the cache is never fatal, the DataFrame has already been loaded at this point: a file
+        system error or a DataFrame the Arrow writer cannot convert leaves the DataFrame uncached.
+
+        :param path_to_cached_file: The cache file to create, as returned by `get_cached_file_path`.
+        :param writer: A callable writing the DataFrame to the path it receives.
+        """
+        temporary_file_path = f"{path_to_cached_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(MovieDataProvider.CACHE_DIRECTORY, exist_ok=True)
+            writer(temporary_file_path)
+            os.replace(temporary_file_path, path_to_cached_file)
+        except (OSError, ValueError, pa.ArrowException, pl.exceptions.PolarsError):
+            if os.path.exists(temporary_file_path):
+                os.remove(temporary_file_path)
+            return
+
+        MovieDataProvider.invalidate_cached_files(path_to_cached_file)
+        MovieDataProvider.evict_cached_files()
+
+    @staticmethod
+    def evict_cached_files(max_size_bytes: Optional[int] = None) -> List[str]:
+        """
+        Keep the cache directory under a size limit by removing the least recently used files first.
+
+        Cache hits refresh the access/modification time of the file, hence the order of removal follows
+        the last use of the cached DataFrames.
+
+        :param max_size_bytes: Size limit of the cache directory. Defaults to `CACHE_MAX_SIZE_BYTES`.
+        :return: The list of removed files.
+        """
+        if max_size_bytes is None:
+            max_size_bytes = MovieDataProvider.CACHE_MAX_SIZE_BYTES
+
+        cached_files = [entry for entry in os.scandir(MovieDataProvider.CACHE_DIRECTORY)
+                        if entry.is_file() and not entry.name.startswith('.')] \
+            if os.path.isdir(MovieDataProvider.CACHE_DIRECTORY) else []
+        cached_files.sort(key=lambda entry: entry.stat().st_mtime)
+
+        total_size = sum(entry.stat().st_size for entry in cached_files)
+        evicted_files = []
+        for entry in cached_files:
+            if total_size <= max_size_bytes:
+                break
+            try:
+                os.remove(entry.path)
+            except OSError:
+                continue
+            total_size -= entry.stat().st_size
+            evicted_files.append(entry.path)
+
+        return evicted_files
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Remove every file from the cache directory.
+        """
+        MovieDataProvider.evict_cached_files(max_size_bytes=-1)
+
     @staticmethod
     @abstractmethod
     def load_json_as_dataframe(json_file_name: str,
@@ -36,6 +357,56 @@ class MovieDataProvider(ABC):
         """
         pass
 
+    @staticmethod
+    def get_worker_count(task_count: int, max_workers: Optional[int] = None) -> int:
+        """
+        Return the number of workers running `task_count` tasks: at most one per task and one per usable CPU.
+
+        :param task_count: The number of tasks.
+        :param max_workers: A further limit of the number of workers.
+        :return: The number of workers, at least 1.
+        """
+        cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count() or 1
+
+        return max(1, min(task_count, cpu_count, max_workers or cpu_count))
+
+    @staticmethod
+    @abstractmethod
+    def load_all(tables: Optional[List[str]] = None,
+                 index_columns: Optional[Dict[str, str]] = None,
+                 max_workers: Optional[int] = None,
+                 **load_options) -> Dict[str, Union[pd.DataFrame | pl.DataFrame]]:
+        """
+        Load several tables at once, parsing their JSON files in parallel.
+
+        :param tables: The tables to load (keys of `TABLE_FILES`). Defaults to all of them.
+        :param index_columns: The index column of the tables, by table name.
+        :param max_workers: The maximum number of tables parsed at once. Defaults to the number of CPUs.
+        :param load_options: Further keyword arguments of `load_json_as_dataframe`, e.g. `compact=True`.
+            `sorted_by` only applies to the tables having that column.
+        :return: The DataFrames by table name.
+        """
+        pass
+
+    @staticmethod
+    def get_table_load_options(schema_provider: Callable, load_options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the `load_all` options of a table: `sorted_by` is dropped for the tables without that column
+        (e.g. the genres when loading the movie tables sorted by `movie_id`).
+        """
+        if "sorted_by" in load_options and load_options["sorted_by"] not in schema_provider():
+            return {option: value for option, value in load_options.items() if option != "sorted_by"}
+
+        return load_options
+
+    @staticmethod
+    @abstractmethod
+    def get_sorted_columns(dataframe) -> List[str]:
+        """
+        Return the key columns (`KEY_COLUMNS`) of a DataFrame sorted in ascending order, without missing values.
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def get_schema_aligned_dataframe(dataframe, schema) -> Union[pd.DataFrame | pl.DataFrame]:
@@ -52,6 +423,30 @@ class MovieDataProvider(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def get_compact_schema(schema: Dict) -> Dict[str, Any]:
+        """
+        Map the low-cardinality text columns of a schema (`LOW_CARDINALITY_COLUMNS`) to dictionary-encoded dtypes.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def get_downcast_dataframe(dataframe) -> Union[pd.DataFrame | pl.DataFrame]:
+        """
+        Downcast the integer columns of a DataFrame to the narrowest width holding all of their values.
+        """
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def get_memory_usage_report(table_names: Optional[List[str]] = None) -> Union[pd.DataFrame | pl.DataFrame]:
+        """
+        Compare the memory usage of the tables loaded with the standard and with the compact schemas.
+        """
+        pass
+
     @staticmethod
     @abstractmethod
     def get_genres_schema() -> Dict[str, Any]:
@@ -67,6 +462,16 @@ class MovieDataProvider(ABC):
     def get_movie_genre_schema() -> Dict[str, Any]:
         pass
 
+    @staticmethod
+    @abstractmethod
+    def get_actors_schema() -> Dict[str, Any]:
+        pass
+
+    @staticmethod
+    @abstractmethod
+    def get_movie_actor_schema() -> Dict[str, Any]:
+        pass
+
 
 class MovieDataProviderForPandas(MovieDataProvider):
     """
@@ -77,10 +482,15 @@ class MovieDataProviderForPandas(MovieDataProvider):
 
         Methods:
             - load_json_as_dataframe: Load a JSON file into a Pandas DataFrame.
+            - load_all: Load several tables at once, parsed in parallel worker processes.
+            - iter_json_batches: Read a JSON file incrementally, in schema-aligned batches.
+            - get_sorted_columns: Return the key columns a DataFrame is sorted by.
             - get_schema_aligned_dataframe: Align a DataFrame with a given schema.
             - get_genres_schema: Retrieve the schema for genres.
             - get_movies_schema: Retrieve the schema for movies.
             - get_movie_genre_schema: Retrieve the schema for movie-genre relationships.
+            - get_actors_schema: Retrieve the schema for actors.
+            - get_movie_actor_schema: Retrieve the schema for movie-actor (cast) relationships.
 
         Examples:
             Load a movies dataset and align it to a predefined schema:
@@ -93,14 +503,47 @@ class MovieDataProviderForPandas(MovieDataProvider):
     @staticmethod
     def load_json_as_dataframe(json_file_name: str,
                                schema_provider: Callable,
-                               index_column: Optional[str] = None) -> pd.DataFrame:
+                               index_column: Optional[str] = None,
+                               schema_on_read: bool = True,
+                               dtype_backend: Optional[str] = None,
+                               use_cache: bool = True,
+                               use_registry: bool = True,
+                               compact: bool = False,
+                               memory_map: bool = False,
+                               sorted_by: Optional[str] = None) -> pd.DataFrame:
         """
         Load a JSON file into a Pandas DataFrame and align it with a provided schema.
 
+        By default the schema is applied while parsing (see `read_json_with_schema`): the numbers are parsed
+        straight into typed columns and the text into Arrow strings, without a Python object per value. Setting
+        `schema_on_read` to False falls back to decoding the records with the `json` module and casting the
+        DataFrame column by column.
+
+        The schema-aligned DataFrame is cached as an Arrow IPC file (see `get_cached_file_path`), later
+        loads of the unchanged file are served by a memory-mapped read of the cache instead of a JSON parse.
+        Within the same process the loaded DataFrame is also kept in `dataframe_registry`, repeated loads
+        get a copy of the registered DataFrame (a cheap, lazy one under Copy-on-Write).
+
         Args:
             json_file_name (str): Name of the JSON file to be loaded (located in the `data` directory).
             schema_provider (Callable): Function that returns a schema dictionary for column alignment.
             index_column (Optional[str]): Column name to set as the index in the resulting DataFrame. Defaults to None.
+            schema_on_read (bool): Apply the schema during parsing instead of casting afterwards. Defaults to True.
+            dtype_backend (Optional[str]): Set to "pyarrow" to load the columns with pyarrow-backed dtypes
+                (`string[pyarrow]`, `int64[pyarrow]`, `double[pyarrow]`). Defaults to None (NumPy dtypes).
+            use_cache (bool): Read from and write to the columnar on-disk cache. Defaults to True.
+            use_registry (bool): Share the loaded DataFrame through the in-process `dataframe_registry`.
+                Defaults to True.
+            compact (bool): Load the low-cardinality text columns as categoricals (see `get_compact_schema`)
+                and downcast the integer columns to the narrowest safe width (see `get_downcast_dataframe`).
+                Defaults to False.
+            memory_map (bool): Load the DataFrame from a memory-mapped Arrow IPC file (the cache file, written
+                first if needed) without copying it: the columns get `pd.ArrowDtype` dtypes backed by the mapped
+                file, whose pages are shared by every process mapping the same file. Defaults to False.
+            sorted_by (Optional[str]): A key column (see `KEY_COLUMNS`) the DataFrame must be sorted by, e.g. for
+                the merge joins of `joins/pandas/sorted_join.py`. The sortedness recorded in the cache file is
+                verified first, the table is sorted (stable) only if needed and the sorted copy is cached.
+                An index set on this column is monotonic increasing. Defaults to None (order of the file).
 
         Returns:
             pd.DataFrame: The loaded and schema-aligned Pandas DataFrame.
@@ -123,22 +566,95 @@ class MovieDataProviderForPandas(MovieDataProvider):
             ...     index_column="movie_id"
             ... )
             >>> print(df.index)
+
+            Load the text-heavy movies table with pyarrow-backed dtypes:
+
+            >>> df = MovieDataProviderForPandas.load_json_as_dataframe(
+            ...     "movies.json",
+            ...     MovieDataProviderForPandas.get_movies_schema,
+            ...     dtype_backend="pyarrow"
+            ... )
+            >>> print(df.dtypes)
+
+            Load the movies table with a categorical `movie_status` and narrow integer columns:
+
+            >>> df = MovieDataProviderForPandas.load_json_as_dataframe(
+            ...     "movies.json",
+            ...     MovieDataProviderForPandas.get_movies_schema,
+            ...     compact=True
+            ... )
+            >>> print(df.memory_usage(deep=True).sum())
+
+            Load the movies sorted by `movie_id`, with a monotonic index:
+
+            >>> df = MovieDataProviderForPandas.load_json_as_dataframe(
+            ...     "movies.json",
+            ...     MovieDataProviderForPandas.get_movies_schema,
+            ...     index_column="movie_id",
+            ...     sorted_by="movie_id"
+            ... )
+            >>> print(df.index.is_monotonic_increasing)
         """
-        
-        path_to_json_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            '..',
-            'data',
-            json_file_name)
+
+        path_to_json_file = MovieDataProviderForPandas.get_data_file_path(json_file_name)
+        schema = MovieDataProviderForPandas.get_load_schema(schema_provider, dtype_backend, compact)
+
+        registry_key = (MovieDataProviderForPandas.get_registry_key(path_to_json_file, schema, index_column,
+                                                                    {"compact": compact, "memory_map": memory_map,
+                                                                     "sorted_by": sorted_by})
+                        if use_registry else None)
+        if registry_key:
+            registered_df = dataframe_registry.get(registry_key)
+            if registered_df is not None:
+                return MovieDataProviderForPandas.get_shared_copy(registered_df)
+
+        path_to_cached_file = (MovieDataProviderForPandas.get_cached_file_path(path_to_json_file, schema,
+                                                                               sorted_by=sorted_by)
+                               if use_cache or memory_map else None)
 
         try:
-            with open(path_to_json_file, 'r') as file:
-                json_data = json.load(file)
+            if path_to_cached_file and os.path.exists(path_to_cached_file):
+                df = MovieDataProviderForPandas.read_cached_dataframe(path_to_cached_file, schema, memory_map)
+            elif sorted_by:
+                # Load the table in the order of the file (from its own cache file, if any), sorted copies are
+                # only cached for the tables that were not sorted already
+                df = MovieDataProviderForPandas.load_json_as_dataframe(
+                    json_file_name, schema_provider, schema_on_read=schema_on_read, dtype_backend=dtype_backend,
+                    use_cache=use_cache, use_registry=False, compact=compact, memory_map=memory_map)
+                path_to_unsorted_file = MovieDataProviderForPandas.get_cached_file_path(path_to_json_file, schema)
+                sorted_columns = (MovieDataProviderForPandas.read_sorted_columns(path_to_unsorted_file)
+                                  if os.path.exists(path_to_unsorted_file) else None)
+                if sorted_columns is None:
+                    sorted_columns = MovieDataProviderForPandas.get_sorted_columns(df)
+
+                if sorted_by in sorted_columns:
+                    path_to_cached_file = None
+                else:
+                    df = df.sort_values(sorted_by, kind='stable', ignore_index=True)
+            elif schema_on_read:
+                df = MovieDataProviderForPandas.read_json_with_schema(path_to_json_file, schema, dtype_backend)
+            else:
+                with open(path_to_json_file, 'r') as file:
+                    if path_to_json_file.endswith(MovieDataProviderForPandas.NDJSON_FILE_EXTENSIONS):
+                        json_data = [json.loads(line) for line in file if line.strip()]
+                    else:
+                        json_data = json.load(file)
+
+                df = pd.DataFrame(json_data)
+                df.reset_index(drop=True, inplace=True)
+
+                df = MovieDataProviderForPandas.get_schema_aligned_dataframe(df, schema)
+
+            if path_to_cached_file and not os.path.exists(path_to_cached_file):
+                MovieDataProviderForPandas.store_cached_file(
+                    path_to_cached_file,
+                    lambda path: MovieDataProviderForPandas.write_cached_dataframe(df, path))
 
-            df = pd.DataFrame(json_data)
-            df.reset_index(drop=True, inplace=True)
+                if memory_map and os.path.exists(path_to_cached_file):
+                    df = MovieDataProviderForPandas.read_cached_dataframe(path_to_cached_file, schema, memory_map)
 
-            df = MovieDataProviderForPandas.get_schema_aligned_dataframe(df, schema_provider())
+            if compact:
+                df = MovieDataProviderForPandas.get_downcast_dataframe(df)
 
             if index_column:
                 df.set_index(index_column, inplace=True)
@@ -148,8 +664,285 @@ class MovieDataProviderForPandas(MovieDataProvider):
                              + f"{path_to_json_file} in {MovieDataProviderForPandas.__name__}."
                              + inspect.currentframe().f_code.co_name + f".\n Message:\n{e}")
 
+        if registry_key:
+            dataframe_registry.put(registry_key, df, int(df.memory_usage(deep=True).sum()))
+            df = MovieDataProviderForPandas.get_shared_copy(df)
+
         return df
 
+    @staticmethod
+    def get_load_schema(schema_provider: Callable, dtype_backend: Optional[str] = None,
+                        compact: bool = False) -> Dict[str, Any]:
+        """
+        Build the schema a table is loaded with, from its schema provider and the loading options.
+
+        Args:
+            schema_provider (Callable): Function that returns the schema dictionary of the table.
+            dtype_backend (Optional[str]): None for NumPy dtypes or "pyarrow" for pyarrow-backed dtypes.
+            compact (bool): Use the dictionary-encoded dtypes of `get_compact_schema`.
+
+        Returns:
+            Dict[str, Any]: The schema passed to the parser and keying the cache file.
+        """
+        schema = schema_provider()
+        if dtype_backend == "pyarrow":
+            schema = MovieDataProviderForPandas.get_pyarrow_backed_schema(schema)
+        elif dtype_backend is not None:
+            raise ValueError(f"Unsupported dtype_backend: {dtype_backend}. Use None or 'pyarrow'.")
+
+        if compact:
+            schema = MovieDataProviderForPandas.get_compact_schema(schema)
+
+        return schema
+
+    @staticmethod
+    def load_all(tables: Optional[List[str]] = None,
+                 index_columns: Optional[Dict[str, str]] = None,
+                 max_workers: Optional[int] = None,
+                 **load_options) -> Dict[str, pd.DataFrame]:
+        """
+        Load several tables at once, parsing their JSON files in parallel worker processes.
+
+        The JSON parser of Pandas holds the GIL, so the files are parsed by a process pool. The workers do not
+        send the DataFrames back (pickling them would cost about as much as parsing): each worker writes the
+        parsed table to its Arrow IPC cache file (see `get_cached_file_path`), which this process then reads
+        through a memory map. Tables already in the cache are not parsed again. The cold start of a pipeline
+        loading several tables is therefore bounded by the largest table instead of the sum of all of them.
+
+        Args:
+            tables (Optional[List[str]]): The tables to load (keys of `TABLE_FILES`). Defaults to all of them.
+            index_columns (Optional[Dict[str, str]]): The index column of the tables, by table name.
+            max_workers (Optional[int]): The maximum number of worker processes. Defaults to the number of CPUs,
+                with a single CPU (or a single table to parse) the tables are parsed in this process.
+            **load_options: Further keyword arguments of `load_json_as_dataframe` (e.g. `compact=True`),
+                `use_cache` is always on as the cache hands the tables over. `sorted_by` only applies to the tables
+                having that column, the workers parse the tables in the order of the files.
+
+        Returns:
+            Dict[str, pd.DataFrame]: The DataFrames by table name.
+
+        Examples:
+            >>> dataframes = MovieDataProviderForPandas.load_all(["movies", "movie_genre", "genres"],
+            ...                                                  index_columns={"movies": "movie_id"})
+            >>> df_movies = dataframes["movies"]
+        """
+        tables = list(tables or MovieDataProvider.TABLE_FILES)
+        index_columns = index_columns or {}
+        load_options = {**load_options, "use_cache": True}
+        schema_options = {option: load_options[option] for option in ("dtype_backend", "compact", "schema_on_read")
+                          if option in load_options}
+
+        tables_to_parse = [table for table in tables if not os.path.exists(
+            MovieDataProviderForPandas.get_cached_file_path(
+                MovieDataProviderForPandas.get_data_file_path(MovieDataProvider.TABLE_FILES[table]),
+                MovieDataProviderForPandas.get_load_schema(
+                    getattr(MovieDataProviderForPandas, f"get_{table}_schema"),
+                    schema_options.get("dtype_backend"),
+                    schema_options.get("compact", False))))]
+
+        worker_count = MovieDataProvider.get_worker_count(len(tables_to_parse), max_workers)
+        if worker_count > 1:
+            # Forked workers do not re-run the calling script, which may not be guarded by `if __name__ == '__main__'`
+            start_method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None
+            with ProcessPoolExecutor(max_workers=worker_count,
+                                     mp_context=multiprocessing.get_context(start_method)) as executor:
+                for future in [executor.submit(MovieDataProviderForPandas.write_json_to_cache,
+                                               MovieDataProvider.TABLE_FILES[table],
+                                               getattr(MovieDataProviderForPandas, f"get_{table}_schema"),
+                                               MovieDataProvider.DATA_DIRECTORY,
+                                               **schema_options)
+                               for table in tables_to_parse]:
+                    future.result()
+
+        return {table: MovieDataProviderForPandas.load_json_as_dataframe(
+            MovieDataProvider.TABLE_FILES[table],
+            getattr(MovieDataProviderForPandas, f"get_{table}_schema"),
+            index_column=index_columns.get(table),
+            **MovieDataProvider.get_table_load_options(getattr(MovieDataProviderForPandas, f"get_{table}_schema"),
+                                                       load_options))
+            for table in tables}
+
+    @staticmethod
+    def iter_json_batches(json_file_name: str,
+                          schema_provider: Callable,
+                          batch_size: int = 100_000,
+                          dtype_backend: Optional[str] = None,
+                          compact: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Read a JSON array (or NDJSON) file incrementally, as schema-aligned DataFrames of at most `batch_size` rows.
+
+        The records are decoded one by one (see `json_array_reader.iter_json_records`), so the peak memory depends
+        on the batch size instead of the file size. Concatenate the batches or stream them to a sink of
+        `json_array_reader` (`write_batches_to_parquet`, `write_batches_to_duckdb`).
+
+        Args:
+            json_file_name (str): Name of the JSON file to be read (located in the `data` directory).
+            schema_provider (Callable): Function that returns a schema dictionary for column alignment.
+            batch_size (int): The number of records of a batch. Defaults to 100_000.
+            dtype_backend (Optional[str]): Set to "pyarrow" for pyarrow-backed dtypes. Defaults to None.
+            compact (bool): Use the dictionary-encoded dtypes of `get_compact_schema`. Defaults to False.
+
+        Returns:
+            Iterator[pd.DataFrame]: The batches, with a default index.
+
+        Examples:
+            >>> for df_batch in MovieDataProviderForPandas.iter_json_batches(
+            ...         "actors.json", MovieDataProviderForPandas.get_actors_schema, batch_size=10_000):
+            ...     print(len(df_batch))
+        """
+        path_to_json_file = MovieDataProviderForPandas.get_data_file_path(json_file_name)
+        schema = MovieDataProviderForPandas.get_load_schema(schema_provider, dtype_backend, compact)
+
+        for records in iter_json_records(path_to_json_file, batch_size):
+            yield MovieDataProviderForPandas.get_schema_aligned_dataframe(pd.DataFrame(records), schema)
+
+    @staticmethod
+    def write_json_to_cache(json_file_name: str, schema_provider: Callable, data_directory: str,
+                            **schema_options) -> None:
+        """
+        Parse a JSON file into the Arrow IPC cache, without returning the DataFrame. Runs in the workers of `load_all`.
+
+        Args:
+            json_file_name (str): Name of the JSON file to be parsed.
+            schema_provider (Callable): Function that returns a schema dictionary for column alignment.
+            data_directory (str): The data directory of the calling process.
+            **schema_options: The `dtype_backend`, `compact` and `schema_on_read` options of the load.
+        """
+        MovieDataProvider.set_data_directory(data_directory)
+        MovieDataProviderForPandas.load_json_as_dataframe(json_file_name, schema_provider,
+                                                          use_cache=True, use_registry=False, **schema_options)
+
+    @staticmethod
+    def get_shared_copy(dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Create a copy of a registered DataFrame that can be handed out to a caller.
+
+        Under Copy-on-Write (always on from pandas 3.0) a shallow copy is enough: the data is shared
+        until one of the copies is modified. Without Copy-on-Write a deep copy is made, so the caller
+        can never modify the registered DataFrame.
+
+        Args:
+            dataframe (pd.DataFrame): The registered DataFrame.
+
+        Returns:
+            pd.DataFrame: A copy that is safe to modify.
+        """
+        copy_on_write = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+
+        return dataframe.copy(deep=not copy_on_write)
+
+    @staticmethod
+    def read_cached_dataframe(path_to_cached_file: str, schema: Dict, memory_map: bool = False) -> pd.DataFrame:
+        """
+        Read a cached Arrow IPC file into a Pandas DataFrame through a memory map.
+
+        Args:
+            path_to_cached_file (str): The Arrow IPC cache file.
+            schema (Dict): The schema the DataFrame is aligned to after the conversion from Arrow.
+            memory_map (bool): Keep the data in the memory-mapped file: the columns get `pd.ArrowDtype` dtypes
+                and are not aligned to the schema, as the conversion to NumPy dtypes would copy them.
+
+        Returns:
+            pd.DataFrame: The schema-aligned Pandas DataFrame.
+        """
+        table = pa.ipc.open_file(pa.memory_map(path_to_cached_file, 'r')).read_all()
+        os.utime(path_to_cached_file)
+
+        if memory_map:
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+        return MovieDataProviderForPandas.get_schema_aligned_dataframe(table.to_pandas(split_blocks=True), schema)
+
+    @staticmethod
+    def write_cached_dataframe(dataframe: pd.DataFrame, path_to_cached_file: str) -> None:
+        """
+        Write a Pandas DataFrame to an uncompressed (memory-mappable) Arrow IPC file, recording its sorted key columns
+        (see `read_sorted_columns`).
+
+        Args:
+            dataframe (pd.DataFrame): The schema-aligned DataFrame to cache.
+            path_to_cached_file (str): The Arrow IPC file to write.
+        """
+        table = MovieDataProvider.get_table_with_sorted_columns(
+            pa.Table.from_pandas(dataframe, preserve_index=False),
+            MovieDataProviderForPandas.get_sorted_columns(dataframe))
+        with pa.OSFile(path_to_cached_file, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @staticmethod
+    def get_sorted_columns(dataframe: pd.DataFrame) -> List[str]:
+        """
+        Return the key columns (`KEY_COLUMNS`) of a DataFrame sorted in ascending order, without missing values.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame, the key columns are looked up among its columns.
+
+        Returns:
+            List[str]: The sorted key columns.
+        """
+        return [column for column in MovieDataProvider.KEY_COLUMNS
+                if column in dataframe.columns and dataframe[column].is_monotonic_increasing
+                and not dataframe[column].hasnans]
+
+    @staticmethod
+    def read_json_with_schema(path_to_json_file: str, schema: Dict, dtype_backend: Optional[str] = None) -> pd.DataFrame:
+        """
+        Parse a JSON array (or NDJSON) file into a Pandas DataFrame, with the schema applied by the parser.
+
+        The native JSON readers of Polars are given the schema (see `get_polars_schema`), so the integer and float
+        columns are parsed into their final type and the text columns into Arrow strings. The columns are handed
+        over to Pandas through Arrow: as NumPy arrays, or without copying them as pyarrow-backed arrays
+        (`dtype_backend="pyarrow"`). The alignment to the schema that follows leaves the numeric columns as they are,
+        it only converts the text columns to their dtype (`object`, `string[pyarrow]` or a categorical).
+        This parses the movies about 2.5 to 3.5 times faster than the `json` module path. The peak memory while
+        parsing is higher though, as the reader holds the file and the parsed columns at once.
+
+        Args:
+            path_to_json_file (str): The JSON array or NDJSON file.
+            schema (Dict): The schema of the DataFrame (see `get_load_schema`).
+            dtype_backend (Optional[str]): None for NumPy dtypes or "pyarrow" for pyarrow-backed dtypes.
+
+        Returns:
+            pd.DataFrame: The schema-aligned Pandas DataFrame.
+        """
+        polars_schema = MovieDataProviderForPandas.get_polars_schema(schema)
+        if path_to_json_file.endswith(MovieDataProviderForPandas.NDJSON_FILE_EXTENSIONS):
+            df = pl.read_ndjson(path_to_json_file, schema=polars_schema)
+        else:
+            df = pl.read_json(path_to_json_file, schema=polars_schema)
+
+        # The categorical columns are built from NumPy-backed strings, their categories then have the same dtype
+        # as in the other loading paths
+        return MovieDataProviderForPandas.get_schema_aligned_dataframe(pd.DataFrame({
+            column: df[column].to_pandas(use_pyarrow_extension_array=dtype_backend == "pyarrow" and not isinstance(
+                pd.api.types.pandas_dtype(schema[column]), pd.CategoricalDtype))
+            for column in df.columns}), schema)
+
+    @staticmethod
+    def get_polars_schema(schema: Dict) -> Dict[str, pl.DataType]:
+        """
+        Map the dtypes of a Pandas schema to the Polars dtypes the JSON files are parsed with.
+
+        The integer and float dtypes (NumPy or pyarrow-backed) map to `pl.Int64` and `pl.Float64`, the text and
+        categorical dtypes to `pl.String`.
+
+        Args:
+            schema (Dict): A Pandas schema dictionary (see `get_load_schema`).
+
+        Returns:
+            Dict[str, pl.DataType]: The Polars schema, with the same columns.
+        """
+        polars_dtypes = {
+            "int64": pl.Int64,
+            "int64[pyarrow]": pl.Int64,
+            "float64": pl.Float64,
+            "double[pyarrow]": pl.Float64
+        }
+
+        return {column: polars_dtypes.get(dtype, pl.String) if isinstance(dtype, str) else pl.String
+                for column, dtype in schema.items()}
+
     @staticmethod
     def get_schema_aligned_dataframe(dataframe: pd.DataFrame, schema: Dict) -> pd.DataFrame:
 
@@ -161,6 +954,101 @@ class MovieDataProviderForPandas(MovieDataProvider):
 
         return dataframe
 
+    @staticmethod
+    def get_pyarrow_backed_schema(schema: Dict) -> Dict[str, Any]:
+        """
+        Map the NumPy dtypes of a schema to their pyarrow-backed counterparts.
+
+        Text columns (`object`) become `string[pyarrow]`, which stores the values in a contiguous Arrow
+        buffer instead of one Python object per value - the biggest saving for the `overview`, `tagline`
+        and `homepage` columns of the movies table.
+
+        Args:
+            schema (Dict): A schema dictionary returned by one of the `get_*_schema` methods.
+
+        Returns:
+            Dict[str, Any]: The schema with pyarrow-backed dtypes.
+        """
+        pyarrow_dtypes = {
+            "object": "string[pyarrow]",
+            "int64": "int64[pyarrow]",
+            "float64": "double[pyarrow]"
+        }
+
+        return {column: pyarrow_dtypes.get(dtype, dtype) for column, dtype in schema.items()}
+
+    @staticmethod
+    def get_compact_schema(schema: Dict) -> Dict[str, Any]:
+        """
+        Map the low-cardinality text columns of a schema to categorical dtypes.
+
+        A categorical column stores every distinct value once and one small integer code per row, instead
+        of one Python string object per row. Columns with a fixed vocabulary get a `pd.CategoricalDtype`
+        with these categories, so the codes are identical across loads; values outside the vocabulary
+        are loaded as missing values.
+
+        Args:
+            schema (Dict): A schema dictionary returned by one of the `get_*_schema` methods.
+
+        Returns:
+            Dict[str, Any]: The schema with categorical dtypes for the low-cardinality columns.
+        """
+        return {column: (pd.CategoricalDtype(MovieDataProvider.LOW_CARDINALITY_COLUMNS[column])
+                         if MovieDataProvider.LOW_CARDINALITY_COLUMNS[column] else "category")
+                if column in MovieDataProvider.LOW_CARDINALITY_COLUMNS else dtype
+                for column, dtype in schema.items()}
+
+    @staticmethod
+    def get_downcast_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Downcast the NumPy integer columns of a DataFrame to the narrowest width holding all of their values.
+
+        The width depends on the data, e.g. the `genre_id` keys fit into `int8` and the `movie_id` keys into
+        `int32`, hence the downcast happens after loading instead of being part of the schema.
+
+        Args:
+            dataframe (pd.DataFrame): The schema-aligned DataFrame.
+
+        Returns:
+            pd.DataFrame: The DataFrame with downcast integer columns.
+        """
+        for column in dataframe.columns:
+            if isinstance(dataframe[column].dtype, np.dtype) and np.issubdtype(dataframe[column].dtype, np.integer):
+                dataframe[column] = pd.to_numeric(dataframe[column], downcast='integer')
+
+        return dataframe
+
+    @staticmethod
+    def get_memory_usage_report(table_names: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Compare the memory usage (`memory_usage(deep=True)`) of the tables loaded with the standard and
+        with the compact schemas.
+
+        Args:
+            table_names (Optional[List[str]]): The tables to compare (keys of `TABLE_FILES`). Defaults to all of them.
+
+        Returns:
+            pd.DataFrame: One row per table with the `standard_bytes`, `compact_bytes`, `saved_bytes`
+                and `saved_percent` columns.
+        """
+        report = []
+        for table_name in table_names or MovieDataProvider.TABLE_FILES:
+            schema_provider = getattr(MovieDataProviderForPandas, f"get_{table_name}_schema")
+            standard_bytes, compact_bytes = (
+                int(MovieDataProviderForPandas.load_json_as_dataframe(MovieDataProvider.TABLE_FILES[table_name],
+                                                                      schema_provider,
+                                                                      compact=compact)
+                    .memory_usage(deep=True).sum())
+                for compact in (False, True))
+
+            report.append({"table": table_name,
+                           "standard_bytes": standard_bytes,
+                           "compact_bytes": compact_bytes,
+                           "saved_bytes": standard_bytes - compact_bytes,
+                           "saved_percent": round(100 * (standard_bytes - compact_bytes) / standard_bytes, 1)})
+
+        return pd.DataFrame(report)
+
     @staticmethod
     def get_genres_schema() -> Dict[str, Any]:
         return {
@@ -193,33 +1081,357 @@ class MovieDataProviderForPandas(MovieDataProvider):
             "genre_id": "int64"
         }
 
+    @staticmethod
+    def get_actors_schema() -> Dict[str, Any]:
+        return {
+            "person_id": "int64",
+            "person_name": "object"
+        }
+
+    @staticmethod
+    def get_movie_actor_schema() -> Dict[str, Any]:
+        return {
+            "movie_id": "int64",
+            "person_id": "int64",
+            "character_name": "object",
+            "gender_id": "int64",
+            "cast_order": "int64"
+        }
+
+
+class MovieDataProviderForPolars(MovieDataProvider):
+    """
+        Concrete implementation of `MovieDataProvider` using the Polars library.
+
+        The JSON files are handed over directly to the native (Rust) JSON readers of Polars together with
+        the schema, so the records are never materialized as Python objects and no casting is needed afterwards.
+
+        Methods:
+            - load_json_as_dataframe: Load a JSON (or NDJSON) file into a Polars DataFrame.
+            - load_all: Load several tables at once, parsed in parallel threads.
+            - iter_json_batches: Read a JSON file incrementally, in batches with the schema.
+            - get_sorted_columns: Return the key columns a DataFrame is sorted by.
+            - get_schema_aligned_dataframe: Align a DataFrame with a given schema.
+            - get_genres_schema: Retrieve the schema for genres.
+            - get_movies_schema: Retrieve the schema for movies.
+            - get_movie_genre_schema: Retrieve the schema for movie-genre relationships.
+            - get_actors_schema: Retrieve the schema for actors.
+            - get_movie_actor_schema: Retrieve the schema for movie-actor (cast) relationships.
+            - scan_json_as_lazyframe: Create a LazyFrame over a JSON file.
+            - scan_movies, scan_movie_genre, scan_genres, scan_actors, scan_movie_actor: LazyFrames over the data files.
 
-class MovieDataProviderForPolars:
+        Examples:
+            >>> schema_provider = MovieDataProviderForPolars.get_movies_schema
+            >>> df = MovieDataProviderForPolars.load_json_as_dataframe("movies.json", schema_provider)
+            >>> print(df.head())
+    """
 
     @staticmethod
     def load_json_as_dataframe(json_file_name: str,
                                schema_provider: Callable,
-                               index_column: Optional[str] = None) -> pl.DataFrame:
-        path_to_json_file = os.path.join(
-            os.path.dirname(os.path.abspath(__file__)),
-            '..',
-            'data',
-            json_file_name)
+                               index_column: Optional[str] = None,
+                               use_cache: bool = True,
+                               use_registry: bool = True,
+                               compact: bool = False,
+                               memory_map: bool = False,
+                               sorted_by: Optional[str] = None) -> pl.DataFrame:
+        """
+        Load a JSON file into a Polars DataFrame using the schema provided up front.
+
+        Files containing a top-level JSON array are parsed with `pl.read_json`, newline-delimited
+        files (`.ndjson`, `.jsonl`) with `pl.read_ndjson`. In both cases the schema is applied while
+        parsing, hence the data never goes through Python objects and no post-hoc cast is required.
+
+        The loaded DataFrame is cached as an Arrow IPC file (see `get_cached_file_path`), later loads of
+        the unchanged file are served by a read of the cache instead of a JSON parse.
+        Within the same process the loaded DataFrame is also kept in `dataframe_registry`. Repeated loads get
+        a clone of the registered DataFrame: it shares the column buffers, but renaming or dropping its columns
+        in place does not affect the registered DataFrame.
+
+        :param json_file_name: Name of the JSON file to be loaded (located in the `data` directory).
+        :param schema_provider: Function that returns the schema dictionary of the DataFrame.
+        :param index_column: Kept for interface compatibility, Polars DataFrames have no index.
+        :param use_cache: Read from and write to the columnar on-disk cache. Defaults to True.
+        :param use_registry: Share the loaded DataFrame through the in-process `dataframe_registry`.
+            Defaults to True.
+        :param compact: Load the low-cardinality text columns dictionary-encoded (see `get_compact_schema`)
+            and downcast the integer columns to the narrowest safe width (see `get_downcast_dataframe`).
+            Defaults to False.
+        :param memory_map: Load the DataFrame from a memory-mapped Arrow IPC file (the cache file, written first
+            if needed) without copying it. The cache is written by Polars with its own string layout (string views),
+            so `pl.from_arrow` takes over the mapped buffers as they are, and the pages of the file are shared by
+            every process mapping the same file. Defaults to False.
+        :param sorted_by: A key column (see `KEY_COLUMNS`) the DataFrame must be sorted by, e.g. for the merge joins
+            of `joins/polars/sorted_join.py`. The sortedness recorded in the cache file is verified first, the table
+            is sorted (stable) only if needed and the sorted copy is cached. The sorted key columns get the sorted
+            flag (`set_sorted`), so Polars skips the sortedness checks and uses its fast paths for sorted data
+            (e.g. binary searches instead of scans). Defaults to None (order of the file).
+        :return: The loaded, schema-aligned Polars DataFrame.
+        :raises ValueError: If there is an issue reading or processing the JSON file.
+        """
+        path_to_json_file = MovieDataProviderForPolars.get_data_file_path(json_file_name)
+
+        schema = schema_provider()
+        if compact:
+            schema = MovieDataProviderForPolars.get_compact_schema(schema)
+
+        registry_key = (MovieDataProviderForPolars.get_registry_key(path_to_json_file, schema, index_column,
+                                                                    {"compact": compact, "memory_map": memory_map,
+                                                                     "sorted_by": sorted_by})
+                        if use_registry else None)
+        if registry_key:
+            registered_df = dataframe_registry.get(registry_key)
+            if registered_df is not None:
+                return registered_df.clone()
+
+        path_to_cached_file = (MovieDataProviderForPolars.get_cached_file_path(path_to_json_file, schema,
+                                                                               sorted_by=sorted_by)
+                               if use_cache or memory_map else None)
+        sorted_columns = None
 
         try:
-            with open(path_to_json_file, 'r') as file:
-                json_data = json.load(file)
+            if path_to_cached_file and os.path.exists(path_to_cached_file):
+                df = MovieDataProviderForPolars.read_cached_dataframe(path_to_cached_file, memory_map)
+                if sorted_by:
+                    sorted_columns = MovieDataProviderForPolars.read_sorted_columns(path_to_cached_file)
+            elif sorted_by:
+                # Load the table in the order of the file (from its own cache file, if any), sorted copies are
+                # only cached for the tables that were not sorted already
+                df = MovieDataProviderForPolars.load_json_as_dataframe(
+                    json_file_name, schema_provider, use_cache=use_cache, use_registry=False, compact=compact,
+                    memory_map=memory_map)
+                path_to_unsorted_file = MovieDataProviderForPolars.get_cached_file_path(path_to_json_file, schema)
+                sorted_columns = (MovieDataProviderForPolars.read_sorted_columns(path_to_unsorted_file)
+                                  if os.path.exists(path_to_unsorted_file) else None)
+                if sorted_columns is None:
+                    sorted_columns = MovieDataProviderForPolars.get_sorted_columns(df)
 
-            df = pl.DataFrame(json_data)
-            df = MovieDataProviderForPolars.get_schema_aligned_dataframe(df, schema_provider())
+                if sorted_by not in sorted_columns:
+                    df = df.sort(sorted_by, maintain_order=True)
+                    sorted_columns = MovieDataProviderForPolars.get_sorted_columns(df)
+                    if path_to_cached_file:
+                        MovieDataProviderForPolars.store_cached_file(
+                            path_to_cached_file,
+                            lambda path: MovieDataProviderForPolars.write_cached_dataframe(df, path))
 
-        except ValueError as e:
+                        if memory_map and os.path.exists(path_to_cached_file):
+                            df = MovieDataProviderForPolars.read_cached_dataframe(path_to_cached_file, memory_map)
+            else:
+                if path_to_json_file.endswith(MovieDataProviderForPolars.NDJSON_FILE_EXTENSIONS):
+                    df = pl.read_ndjson(path_to_json_file, schema=schema)
+                else:
+                    df = pl.read_json(path_to_json_file, schema=schema)
+
+                if path_to_cached_file:
+                    MovieDataProviderForPolars.store_cached_file(
+                        path_to_cached_file,
+                        lambda path: MovieDataProviderForPolars.write_cached_dataframe(df, path))
+
+                    if memory_map and os.path.exists(path_to_cached_file):
+                        df = MovieDataProviderForPolars.read_cached_dataframe(path_to_cached_file, memory_map)
+
+            if compact:
+                df = MovieDataProviderForPolars.get_downcast_dataframe(df)
+
+            if sorted_by:
+                if sorted_columns is None:
+                    sorted_columns = MovieDataProviderForPolars.get_sorted_columns(df)
+                df = df.with_columns(pl.col(column).set_sorted() for column in sorted_columns)
+
+        except (ValueError, pl.exceptions.PolarsError) as e:
             raise ValueError(f"\n [Error] Error generated while processing "
                              + f"{path_to_json_file} in {MovieDataProviderForPolars.__name__}."
                              + inspect.currentframe().f_code.co_name + f".\n Message:\n{e}")
 
+        if registry_key:
+            dataframe_registry.put(registry_key, df, int(df.estimated_size()))
+            df = df.clone()
+
+        return df
+
+    @staticmethod
+    def load_all(tables: Optional[List[str]] = None,
+                 index_columns: Optional[Dict[str, str]] = None,
+                 max_workers: Optional[int] = None,
+                 **load_options) -> Dict[str, pl.DataFrame]:
+        """
+        Load several tables at once, parsing their JSON files in parallel threads.
+
+        The JSON readers of Polars run in Rust and release the GIL, so a thread pool parses the files
+        simultaneously and the DataFrames are shared with the threads without any serialization. The cold start
+        of a pipeline loading several tables is therefore bounded by the largest table instead of the sum of
+        all of them.
+
+        :param tables: The tables to load (keys of `TABLE_FILES`). Defaults to all of them.
+        :param index_columns: Kept for interface compatibility, Polars DataFrames have no index.
+        :param max_workers: The maximum number of threads. Defaults to the number of CPUs.
+        :param load_options: Further keyword arguments of `load_json_as_dataframe`, e.g. `compact=True`.
+            `sorted_by` only applies to the tables having that column.
+        :return: The DataFrames by table name.
+
+        Examples:
+            >>> dataframes = MovieDataProviderForPolars.load_all(["movies", "movie_genre", "genres"])
+            >>> df_movies = dataframes["movies"]
+        """
+        tables = list(tables or MovieDataProvider.TABLE_FILES)
+
+        with ThreadPoolExecutor(max_workers=MovieDataProvider.get_worker_count(len(tables), max_workers)) as executor:
+            futures = {table: executor.submit(MovieDataProviderForPolars.load_json_as_dataframe,
+                                              MovieDataProvider.TABLE_FILES[table],
+                                              getattr(MovieDataProviderForPolars, f"get_{table}_schema"),
+                                              **MovieDataProvider.get_table_load_options(
+                                                  getattr(MovieDataProviderForPolars, f"get_{table}_schema"),
+                                                  load_options))
+                       for table in tables}
+
+            return {table: future.result() for table, future in futures.items()}
+
+    @staticmethod
+    def iter_json_batches(json_file_name: str,
+                          schema_provider: Callable,
+                          batch_size: int = 100_000,
+                          compact: bool = False) -> Iterator[pl.DataFrame]:
+        """
+        Read a JSON array (or NDJSON) file incrementally, as DataFrames of at most `batch_size` rows with the schema.
+
+        The records are decoded one by one (see `json_array_reader.iter_json_records`), so the peak memory depends
+        on the batch size instead of the file size, unlike `pl.read_json` which holds the whole file. Concatenate
+        the batches or stream them to a sink of `json_array_reader` (`write_batches_to_parquet`,
+        `write_batches_to_duckdb`).
+
+        :param json_file_name: Name of the JSON file to be read (located in the `data` directory).
+        :param schema_provider: Function that returns the schema dictionary of the DataFrames.
+        :param batch_size: The number of records of a batch. Defaults to 100_000.
+        :param compact: Use the dictionary-encoded dtypes of `get_compact_schema`. Defaults to False.
+        :return: The batches.
+
+        Examples:
+            >>> for df_batch in MovieDataProviderForPolars.iter_json_batches(
+            ...         "actors.json", MovieDataProviderForPolars.get_actors_schema, batch_size=10_000):
+            ...     print(df_batch.height)
+        """
+        path_to_json_file = MovieDataProviderForPolars.get_data_file_path(json_file_name)
+        schema = schema_provider()
+        if compact:
+            schema = MovieDataProviderForPolars.get_compact_schema(schema)
+
+        for records in iter_json_records(path_to_json_file, batch_size):
+            yield pl.from_dicts(records, schema=schema)
+
+    @staticmethod
+    def read_cached_dataframe(path_to_cached_file: str, memory_map: bool = False) -> pl.DataFrame:
+        """
+        Read a cached Arrow IPC file into a Polars DataFrame.
+
+        :param path_to_cached_file: The Arrow IPC cache file.
+        :param memory_map: Map the file into memory and take over its buffers without copying them,
+            instead of reading the file into memory owned by Polars.
+        :return: The Polars DataFrame.
+        """
+        if memory_map:
+            df = pl.from_arrow(pa.ipc.open_file(pa.memory_map(path_to_cached_file, 'r')).read_all())
+        else:
+            df = pl.read_ipc(path_to_cached_file)
+        os.utime(path_to_cached_file)
+
         return df
 
+    @staticmethod
+    def write_cached_dataframe(dataframe: pl.DataFrame, path_to_cached_file: str) -> None:
+        """
+        Write a Polars DataFrame to an uncompressed (memory-mappable) Arrow IPC file, recording its sorted key columns
+        (see `read_sorted_columns`).
+
+        The DataFrame is exported with the newest Arrow layout of Polars (string views), so a memory-mapped read
+        takes over the buffers of the file without converting them.
+
+        :param dataframe: The schema-aligned DataFrame to cache.
+        :param path_to_cached_file: The Arrow IPC file to write.
+        """
+        table = MovieDataProvider.get_table_with_sorted_columns(
+            dataframe.to_arrow(compat_level=pl.CompatLevel.newest()),
+            MovieDataProviderForPolars.get_sorted_columns(dataframe))
+        with pa.OSFile(path_to_cached_file, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @staticmethod
+    def get_sorted_columns(dataframe: pl.DataFrame) -> List[str]:
+        """
+        Return the key columns (`KEY_COLUMNS`) of a DataFrame sorted in ascending order, without missing values.
+
+        :param dataframe: The DataFrame.
+        :return: The sorted key columns.
+        """
+        return [column for column in MovieDataProvider.KEY_COLUMNS
+                if column in dataframe.columns and dataframe[column].null_count() == 0
+                and dataframe[column].is_sorted()]
+
+    @staticmethod
+    def scan_json_as_lazyframe(json_file_name: str, schema_provider: Callable) -> pl.LazyFrame:
+        """
+        Create a LazyFrame over a JSON file, so projections and predicates are pushed down to the scan.
+
+        Newline-delimited files (`.ndjson`, `.jsonl`) are scanned directly with `pl.scan_ndjson`. A JSON array
+        cannot be scanned, it is loaded once and written to a Parquet file in the cache directory (keyed the
+        same way as the Arrow IPC cache), later scans read this Parquet file with `pl.scan_parquet`.
+
+        :param json_file_name: Name of the JSON file to be scanned (located in the `data` directory).
+        :param schema_provider: Function that returns the schema dictionary of the LazyFrame.
+        :return: A LazyFrame reading only the columns and row groups required by the query.
+
+        Examples:
+            >>> lf_movies = MovieDataProviderForPolars.scan_json_as_lazyframe(
+            ...     "movies.json",
+            ...     MovieDataProviderForPolars.get_movies_schema
+            ... )
+            >>> print(lf_movies.select("movie_id", "title").collect())
+        """
+        path_to_json_file = MovieDataProviderForPolars.get_data_file_path(json_file_name)
+        schema = schema_provider()
+
+        if path_to_json_file.endswith(MovieDataProviderForPolars.NDJSON_FILE_EXTENSIONS):
+            return pl.scan_ndjson(path_to_json_file, schema=schema)
+
+        path_to_parquet_file = MovieDataProviderForPolars.get_cached_file_path(path_to_json_file,
+                                                                               schema,
+                                                                               file_extension='parquet')
+        if not os.path.exists(path_to_parquet_file):
+            df = MovieDataProviderForPolars.load_json_as_dataframe(json_file_name, schema_provider)
+            MovieDataProviderForPolars.store_cached_file(
+                path_to_parquet_file,
+                lambda path: df.write_parquet(path, compression='zstd', statistics=True))
+
+            if not os.path.exists(path_to_parquet_file):
+                return df.lazy()
+
+        return pl.scan_parquet(path_to_parquet_file)
+
+    @staticmethod
+    def scan_movies() -> pl.LazyFrame:
+        return MovieDataProviderForPolars.scan_json_as_lazyframe("movies.json",
+                                                                 MovieDataProviderForPolars.get_movies_schema)
+
+    @staticmethod
+    def scan_movie_genre() -> pl.LazyFrame:
+        return MovieDataProviderForPolars.scan_json_as_lazyframe("movie_genre.json",
+                                                                 MovieDataProviderForPolars.get_movie_genre_schema)
+
+    @staticmethod
+    def scan_genres() -> pl.LazyFrame:
+        return MovieDataProviderForPolars.scan_json_as_lazyframe("genres.json",
+                                                                 MovieDataProviderForPolars.get_genres_schema)
+
+    @staticmethod
+    def scan_actors() -> pl.LazyFrame:
+        return MovieDataProviderForPolars.scan_json_as_lazyframe("actors.json",
+                                                                 MovieDataProviderForPolars.get_actors_schema)
+
+    @staticmethod
+    def scan_movie_actor() -> pl.LazyFrame:
+        return MovieDataProviderForPolars.scan_json_as_lazyframe("movie_actor.json",
+                                                                 MovieDataProviderForPolars.get_movie_actor_schema)
+
     @staticmethod
     def get_schema_aligned_dataframe(dataframe: pl.DataFrame, schema: Dict) -> pl.DataFrame:
         """
@@ -253,6 +1465,63 @@ class MovieDataProviderForPolars:
 
         return dataframe
 
+    @staticmethod
+    def get_compact_schema(schema: Dict) -> Dict[str, Any]:
+        """
+        Map the low-cardinality text columns of a schema to dictionary-encoded dtypes.
+
+        Columns with a fixed vocabulary become a `pl.Enum` (the codes are fixed and the load fails on a value
+        outside the vocabulary), the others a `pl.Categorical`. Both store one small integer code per row
+        instead of the string itself.
+
+        :param schema: A schema dictionary returned by one of the `get_*_schema` methods.
+        :return: The schema with dictionary-encoded dtypes for the low-cardinality columns.
+        """
+        return {column: (pl.Enum(MovieDataProvider.LOW_CARDINALITY_COLUMNS[column])
+                         if MovieDataProvider.LOW_CARDINALITY_COLUMNS[column] else pl.Categorical)
+                if column in MovieDataProvider.LOW_CARDINALITY_COLUMNS else dtype
+                for column, dtype in schema.items()}
+
+    @staticmethod
+    def get_downcast_dataframe(dataframe: pl.DataFrame) -> pl.DataFrame:
+        """
+        Downcast the integer columns of a DataFrame to the narrowest width holding all of their values
+        (`Series.shrink_dtype`), e.g. the `genre_id` keys to `Int8` and the `movie_id` keys to `Int32`.
+
+        :param dataframe: The schema-aligned DataFrame.
+        :return: The DataFrame with downcast integer columns.
+        """
+        return dataframe.with_columns(dataframe[column].shrink_dtype()
+                                      for column, dtype in dataframe.schema.items() if dtype.is_integer())
+
+    @staticmethod
+    def get_memory_usage_report(table_names: Optional[List[str]] = None) -> pl.DataFrame:
+        """
+        Compare the memory usage (`estimated_size`) of the tables loaded with the standard and with the
+        compact schemas.
+
+        :param table_names: The tables to compare (keys of `TABLE_FILES`). Defaults to all of them.
+        :return: One row per table with the `standard_bytes`, `compact_bytes`, `saved_bytes` and
+            `saved_percent` columns.
+        """
+        report = []
+        for table_name in table_names or MovieDataProvider.TABLE_FILES:
+            schema_provider = getattr(MovieDataProviderForPolars, f"get_{table_name}_schema")
+            standard_bytes, compact_bytes = (
+                int(MovieDataProviderForPolars.load_json_as_dataframe(MovieDataProvider.TABLE_FILES[table_name],
+                                                                      schema_provider,
+                                                                      compact=compact)
+                    .estimated_size())
+                for compact in (False, True))
+
+            report.append({"table": table_name,
+                           "standard_bytes": standard_bytes,
+                           "compact_bytes": compact_bytes,
+                           "saved_bytes": standard_bytes - compact_bytes,
+                           "saved_percent": round(100 * (standard_bytes - compact_bytes) / standard_bytes, 1)})
+
+        return pl.DataFrame(report)
+
     @staticmethod
     def get_genres_schema() -> Dict[str, Any]:
         return {
@@ -284,3 +1553,20 @@ class MovieDataProviderForPolars:
             "movie_id": pl.Int64,
             "genre_id": pl.Int64
         }
+
+    @staticmethod
+    def get_actors_schema() -> Dict[str, Any]:
+        return {
+            "person_id": pl.Int64,
+            "person_name": pl.Utf8
+        }
+
+    @staticmethod
+    def get_movie_actor_schema() -> Dict[str, Any]:
+        return {
+            "movie_id": pl.Int64,
+            "person_id": pl.Int64,
+            "character_name": pl.Utf8,
+            "gender_id": pl.Int64,
+            "cast_order": pl.Int64
+        }
@@ -0,0 +1,59 @@
+"""
+Read the movies data from a JSON file into a Pandas DataFrame,
+write it to an Arrow IPC (Feather V2) file, and read it back into a DataFrame,
+comparing the original and the read DataFrame.
+
+The file is read back twice: copied into NumPy-backed columns (`pd.read_feather`), and memory-mapped into
+`pd.ArrowDtype` columns that point into the mapped file, so the data is never copied or deserialized.
+"""
+import os
+import sys
+import pandas as pd
+import pyarrow.feather as feather
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../", "data_providers"))
+sys.path.insert(0, data_provider_path)
+
+from movie_data_provider import MovieDataProviderForPandas
+
+
+def have_same_values(df_left: pd.DataFrame, df_right: pd.DataFrame) -> bool:
+    """
+    Compare the values of two DataFrames, ignoring the dtypes (e.g. `object` vs `string[pyarrow]` columns)
+    and the missing value markers (NaN vs NA).
+    """
+    return (df_left.convert_dtypes(dtype_backend="pyarrow")
+            .equals(df_right.convert_dtypes(dtype_backend="pyarrow")))
+
+
+# Load the movies data from a JSON file into a Pandas DataFrame
+df_movies = MovieDataProviderForPandas.load_json_as_dataframe(
+    json_file_name="movies.json",
+    schema_provider=MovieDataProviderForPandas.get_movies_schema,
+    index_column=None,
+)
+
+arrow_file_path = MovieDataProviderForPandas.get_data_file_path("movies.arrow")
+
+# Write the DataFrame to an uncompressed Arrow IPC file, only uncompressed files can be memory-mapped without a copy
+df_movies.to_feather(arrow_file_path, compression="uncompressed")
+
+# Read the Arrow IPC file back into a DataFrame with NumPy-backed columns
+df_movies_from_arrow = pd.read_feather(arrow_file_path)
+print("Result of comparing the original DataFrame with the one read from the Arrow IPC file:",
+      have_same_values(df_movies, df_movies_from_arrow))
+
+# Memory-map the Arrow IPC file, the columns of the DataFrame point into the mapped file
+table = feather.read_table(arrow_file_path, memory_map=True)
+df_movies_mapped = table.to_pandas(types_mapper=pd.ArrowDtype)
+print(df_movies_mapped.dtypes)
+print("Result of comparing the original DataFrame with the memory-mapped one:",
+      have_same_values(df_movies, df_movies_mapped))
+
+# The data provider does the same with its Arrow IPC cache
+df_movies_mapped = MovieDataProviderForPandas.load_json_as_dataframe(
+    json_file_name="movies.json",
+    schema_provider=MovieDataProviderForPandas.get_movies_schema,
+    memory_map=True,
+)
+print(df_movies_mapped.head())
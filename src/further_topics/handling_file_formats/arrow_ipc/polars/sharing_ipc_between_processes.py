@@ -0,0 +1,84 @@
+"""
+Load the reference tables (movies, movie_genre, genres and actors) in several worker processes from memory-mapped
+Arrow IPC files, so the workers share one physical copy of the tables instead of holding one copy each.
+
+`load_json_as_dataframe(..., memory_map=True)` maps the Arrow IPC cache file of a table (written on the first load)
+and hands the mapped buffers over to Polars without copying them. The pages of the mapped files belong
+to the page cache of the operating system and are shared by all the processes mapping them: every worker reports
+its resident file-backed memory (`RssFile`), which holds the tables, while its private memory (`RssAnon`) does not
+grow with the size of the tables. `Pss_File` splits the shared pages between the processes mapping them, so it
+shrinks with the number of workers. The memory figures are read from `/proc` and are available on Linux only.
+"""
+import os
+import sys
+import multiprocessing as mp
+import polars.selectors as cs
+from typing import Dict
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../", "data_providers"))
+sys.path.insert(0, data_provider_path)
+
+from movie_data_provider import MovieDataProviderForPolars
+
+WORKER_COUNT = 4
+TABLES = {
+    "movies": MovieDataProviderForPolars.get_movies_schema,
+    "movie_genre": MovieDataProviderForPolars.get_movie_genre_schema,
+    "genres": MovieDataProviderForPolars.get_genres_schema,
+    "actors": MovieDataProviderForPolars.get_actors_schema,
+}
+
+
+def get_memory_status() -> Dict[str, int]:
+    """
+    Return the resident private (`RssAnon`) and file-backed (`RssFile`, `Pss_File`) memory of the process in kB.
+    """
+    memory_status = {}
+    for proc_file in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        if os.path.exists(proc_file):
+            with open(proc_file) as status_file:
+                for line in status_file:
+                    name, _, value = line.partition(":")
+                    if name in ("RssAnon", "RssFile", "Pss_File"):
+                        memory_status[name] = int(value.split()[0])
+
+    return memory_status
+
+
+def run_worker(worker_number: int, barrier, results) -> None:
+    memory_before = get_memory_status()
+
+    dataframes = {table: MovieDataProviderForPolars.load_json_as_dataframe(f"{table}.json", schema_provider,
+                                                                            memory_map=True)
+                  for table, schema_provider in TABLES.items()}
+    # Read every value once, so all the pages of the mapped files are resident
+    for df in dataframes.values():
+        df.select(cs.numeric().sum(), cs.string().str.contains("the", literal=True).sum())
+
+    # Measure while all the workers hold the tables
+    barrier.wait()
+    memory_after = get_memory_status()
+    barrier.wait()
+
+    results.put((worker_number, {name: memory_after[name] - memory_before.get(name, 0) for name in memory_after}))
+
+
+if __name__ == "__main__":
+    # Write the Arrow IPC cache files once, the workers only map them
+    for table, schema_provider in TABLES.items():
+        MovieDataProviderForPolars.load_json_as_dataframe(f"{table}.json", schema_provider, memory_map=True)
+
+    context = mp.get_context("spawn")
+    barrier = context.Barrier(WORKER_COUNT)
+    results = context.Queue()
+    workers = [context.Process(target=run_worker, args=(worker_number, barrier, results))
+               for worker_number in range(WORKER_COUNT)]
+    for worker in workers:
+        worker.start()
+    worker_results = sorted(results.get() for _ in workers)
+    for worker in workers:
+        worker.join()
+
+    print("Memory growth of every worker after loading the tables (kB):")
+    for worker_number, memory_growth in worker_results:
+        print(f"  worker {worker_number}: {memory_growth}")
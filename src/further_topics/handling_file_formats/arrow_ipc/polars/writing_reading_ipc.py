@@ -0,0 +1,49 @@
+"""
+Read the movies data from a JSON file into a Polars DataFrame,
+write it to an Arrow IPC (Feather V2) file, and read it back into a DataFrame,
+comparing the original and the read DataFrame.
+
+`pl.read_ipc` reads the file into memory owned by Polars. Memory-mapped with `pyarrow` instead, the buffers of the
+file are taken over by `pl.from_arrow` as they are: Polars writes its own string layout (string views) to the file,
+so nothing has to be converted and the DataFrame points into the mapped file.
+"""
+import os
+import sys
+import polars as pl
+import pyarrow as pa
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../", "data_providers"))
+sys.path.insert(0, data_provider_path)
+
+from movie_data_provider import MovieDataProviderForPolars
+
+# Load the movies data from a JSON file into a Polars DataFrame
+df_movies = MovieDataProviderForPolars.load_json_as_dataframe(
+    json_file_name="movies.json",
+    schema_provider=MovieDataProviderForPolars.get_movies_schema,
+    index_column=None,
+)
+
+arrow_file_path = MovieDataProviderForPolars.get_data_file_path("movies.arrow")
+
+# Write the DataFrame to an uncompressed Arrow IPC file, only uncompressed files can be memory-mapped without a copy
+df_movies.write_ipc(arrow_file_path, compression="uncompressed")
+
+# Read the Arrow IPC file back into a DataFrame
+df_movies_from_arrow = pl.read_ipc(arrow_file_path)
+print("Result of comparing the original DataFrame with the one read from the Arrow IPC file:",
+      df_movies.equals(df_movies_from_arrow))
+
+# Memory-map the Arrow IPC file, the DataFrame points into the mapped file
+df_movies_mapped = pl.from_arrow(pa.ipc.open_file(pa.memory_map(arrow_file_path, "r")).read_all())
+print(df_movies_mapped.schema)
+print("Result of comparing the original DataFrame with the memory-mapped one:",
+      df_movies.equals(df_movies_mapped))
+
+# The data provider does the same with its Arrow IPC cache
+df_movies_mapped = MovieDataProviderForPolars.load_json_as_dataframe(
+    json_file_name="movies.json",
+    schema_provider=MovieDataProviderForPolars.get_movies_schema,
+    memory_map=True,
+)
+print(df_movies_mapped.head())
@@ -0,0 +1,226 @@
+"""
+Flattening of nested JSON data with `pd.json_normalize` and `DataFrame.explode`.
+
+- `flatten_json` normalizes the JSON objects of the records into columns, up to any depth,
+- `explode_json` creates one row per element of the array found at a path (e.g. `info.emails`): the array column
+  is exploded and its elements are normalized again, without iterating over the rows in Python.
+
+The flattened columns are named after their path, e.g. `info.address.city`, as in the Polars variant.
+
+NDJSON files larger than memory are flattened chunk by chunk with `flatten_ndjson_to_parquet`.
+"""
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Dict, List, Optional, Sequence, Union
+
+
+def flatten_json(records: Union[pd.DataFrame | List[Dict]],
+                 separator: str = '.',
+                 keep_lists: bool = False) -> pd.DataFrame:
+    """
+    Normalize the JSON objects of the records into columns, whatever the depth of the nesting.
+
+    :param records: The JSON records (a list of dictionaries) or a DataFrame with dictionary columns.
+    :param separator: Joins the field names of a path into a column name.
+    :param keep_lists: Keep the list (JSON array) columns, by default they are dropped - use `explode_json` on them.
+    :return: The flattened DataFrame.
+
+    Examples:
+        >>> flatten_json([{"id": "101", "info": {"name": "George", "address": {"city": "Dublin"}}}]).columns.tolist()
+        ['id', 'info.name', 'info.address.city']
+    """
+    if isinstance(records, pd.DataFrame):
+        records = records.to_dict(orient='records')
+
+    df = pd.json_normalize(records, sep=separator)
+
+    if not keep_lists:
+        df = df.drop(columns=[column for column in df.columns if _holds_lists(df[column])])
+
+    return df
+
+
+def explode_json(records: Union[pd.DataFrame | List[Dict]],
+                 path: str,
+                 id_columns: Sequence[str] = (),
+                 separator: str = '.') -> pd.DataFrame:
+    """
+    Create one row per element of the array found at a path, the elements are normalized with `pd.json_normalize`.
+
+    The path may go through several arrays (e.g. `orders.items`), each of them is exploded in turn.
+    Rows with a missing or empty array are left out, so a path missing (or null) in every record gives no rows,
+    with the id columns only.
+
+    :param records: The JSON records (a list of dictionaries) or a DataFrame with dictionary columns.
+    :param path: The path of the array, the field names joined with `separator`.
+    :param id_columns: Columns of the (flattened) records repeated on every row, e.g. the id of the record.
+    :param separator: Joins the field names of a path into a column name.
+    :return: One row per array element, with the id columns and the flattened fields of the element
+        (named relative to the element).
+
+    Examples:
+        >>> records = [{"id": "101", "info": {"emails": [{"type": "work"}, {"type": "personal"}]}}]
+        >>> explode_json(records, "info.emails", id_columns=["id"]).values.tolist()
+        [['101', 'work'], ['101', 'personal']]
+    """
+    id_columns = list(id_columns)
+    segments = path.split(separator)
+
+    df = flatten_json(records, separator, keep_lists=True)
+    while segments:
+        column = _find_column(df.columns, segments, separator)
+        if column is None:
+            return df[id_columns].iloc[:0]
+        segments = segments[len(column.split(separator)):]
+
+        df_exploded = df[id_columns + [column]].explode(column, ignore_index=True).dropna(subset=[column])
+        df_exploded = df_exploded.reset_index(drop=True)
+        if df_exploded.empty:
+            return df_exploded[id_columns]
+
+        if len(df_exploded) and isinstance(df_exploded[column].iloc[0], dict):
+            df = pd.concat([df_exploded[id_columns],
+                            pd.json_normalize(df_exploded[column].tolist(), sep=separator)], axis=1)
+        else:
+            df = df_exploded.rename(columns={column: column.split(separator)[-1]})
+
+    return df
+
+
+def rename_to_leaf_names(df: pd.DataFrame,
+                         separator: str = '.',
+                         names: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Rename the flattened columns to the last field name of their path (`info.address.city` -> `city`),
+    or to the names given in `names`.
+    """
+    names = names or {}
+    return df.rename(columns={column: names.get(column, column.split(separator)[-1]) for column in df.columns})
+
+
+def flatten_ndjson_to_parquet(path_to_ndjson_file: str,
+                              output_directory: str,
+                              explode_paths: Sequence[str] = (),
+                              id_columns: Sequence[str] = (),
+                              chunk_size: int = 100_000,
+                              separator: str = '.') -> Dict[str, List[str]]:
+    """
+    Flatten a newline-delimited JSON file of any size into Parquet files, reading at most `chunk_size` records at once.
+
+    The file is read by `pd.read_json(lines=True, chunksize=...)`, every chunk is flattened with `flatten_json`,
+    exploded with `explode_json` and written to one Parquet file per table, so the peak memory depends on the chunk
+    size only. The tables are written to `<output_directory>/<table>/part-<chunk>.parquet`: the flattened records
+    to the `records` table, the exploded arrays to a table named after their path. Read a table back with
+    `pd.read_parquet(f"{output_directory}/{table}")`.
+
+    The Arrow schema of a table is widened with the schema of every chunk (`pa.unify_schemas` with the permissive
+    promotions): the fields first seen in a later chunk are added, the fields only seen as nulls take the type found
+    later, and numeric types are promoted (e.g. `int64` to `double`). Every chunk is cast to the widened schema
+    (fields missing from a chunk are written as nulls) and the Parquet files written before the last widening are
+    rewritten with the final schema at the end (one at a time), so every Parquet file of a table has the same
+    schema.
+
+    :param path_to_ndjson_file: The NDJSON file, one JSON record per line.
+    :param output_directory: The directory of the Parquet tables, created if needed.
+    :param explode_paths: The paths of the arrays exploded into separate tables (e.g. `info.emails`).
+    :param id_columns: Columns repeated on every row of the exploded tables, e.g. the id of the record.
+    :param chunk_size: The number of lines (records) parsed at once.
+    :param separator: Joins the field names of a path into a column name.
+    :return: The Parquet files written, by table.
+
+    Examples:
+        >>> parquet_files = flatten_ndjson_to_parquet("people.ndjson", "people_parquet",
+        ...                                           explode_paths=["info.emails"], id_columns=["id"])
+        >>> pd.read_parquet("people_parquet/info.emails")
+    """
+    tables = {'records': lambda df: _drop_paths(flatten_json(df, separator), explode_paths, separator)}
+    tables.update({explode_path: lambda df, explode_path=explode_path: explode_json(df, explode_path, id_columns,
+                                                                                    separator)
+                   for explode_path in explode_paths})
+    parquet_files = {table: [] for table in tables}
+    arrow_schemas = {table: pa.schema([]) for table in tables}
+    file_schemas = {}
+
+    # dtype=False keeps the values as parsed from JSON, e.g. "101" stays a string
+    with pd.read_json(path_to_ndjson_file, lines=True, chunksize=chunk_size, dtype=False, convert_dates=False) \
+            as json_reader:
+        for chunk_number, df_chunk in enumerate(json_reader):
+            for table, get_table in tables.items():
+                arrow_table = _with_widened_schema(pa.Table.from_pandas(get_table(df_chunk), preserve_index=False),
+                                                   arrow_schemas[table])
+                arrow_schemas[table] = arrow_table.schema
+
+                path_to_parquet_file = os.path.join(output_directory, table, f"part-{chunk_number:05d}.parquet")
+                os.makedirs(os.path.dirname(path_to_parquet_file), exist_ok=True)
+                pq.write_table(arrow_table, path_to_parquet_file)
+                parquet_files[table].append(path_to_parquet_file)
+                file_schemas[path_to_parquet_file] = arrow_table.schema
+
+    for table, table_files in parquet_files.items():
+        for path_to_parquet_file in table_files:
+            if not file_schemas[path_to_parquet_file].equals(arrow_schemas[table]):
+                pq.write_table(_with_widened_schema(pq.read_table(path_to_parquet_file), arrow_schemas[table]),
+                               path_to_parquet_file)
+
+    return parquet_files
+
+
+def _with_widened_schema(arrow_table: pa.Table, arrow_schema: pa.Schema) -> pa.Table:
+    """
+    Return the table with the fields of `arrow_schema` first (added as nulls if missing), cast to the common type of
+    both schemas, then the fields not in `arrow_schema`.
+    """
+    return pa.concat_tables([arrow_schema.empty_table(), arrow_table], promote_options='permissive')
+
+
+def _holds_lists(column: pd.Series) -> bool:
+    """
+    Check whether a column holds lists, based on its first non-missing value.
+    """
+    first_valid_index = column.first_valid_index()
+    return first_valid_index is not None and isinstance(column[first_valid_index], list)
+
+
+def _drop_paths(df: pd.DataFrame, paths: Sequence[str], separator: str) -> pd.DataFrame:
+    """
+    Drop the columns on the exploded paths, left in the flattened records when they are null in every record.
+    """
+    return df.drop(columns=[column for column in df.columns
+                            if any(f"{path}{separator}".startswith(f"{column}{separator}") for path in paths)])
+
+
+def _find_column(columns: pd.Index, segments: List[str], separator: str) -> Optional[str]:
+    """
+    Return the longest path prefix of `segments` that is a column of the flattened DataFrame, None if there is none.
+    """
+    for length in range(len(segments), 0, -1):
+        column = separator.join(segments[:length])
+        if column in columns:
+            return column
+
+    return None
+
+
+if __name__ == '__main__':
+    import json
+    import tempfile
+
+    # The emails are only in the first chunk, missing or null in the following ones: every table keeps one schema
+    # and the emails stay out of the records table
+    for missing_emails in ({}, {"emails": None}):
+        with tempfile.TemporaryDirectory() as working_directory:
+            path_to_ndjson_file = os.path.join(working_directory, "people.ndjson")
+            with open(path_to_ndjson_file, "w") as ndjson_file:
+                for person_id in range(6):
+                    emails = {"emails": [{"type": "work"}]} if person_id < 2 else missing_emails
+                    ndjson_file.write(json.dumps({"id": str(person_id), "info": {"name": "George", **emails}}) + "\n")
+
+            parquet_files = flatten_ndjson_to_parquet(path_to_ndjson_file, os.path.join(working_directory, "people"),
+                                                      explode_paths=["info.emails"], id_columns=["id"], chunk_size=2)
+            df_records = pd.concat(map(pd.read_parquet, parquet_files["records"]), ignore_index=True)
+            df_emails = pd.concat(map(pd.read_parquet, parquet_files["info.emails"]), ignore_index=True)
+            assert df_records.columns.tolist() == ["id", "info.name"] and len(df_records) == 6
+            assert df_emails.columns.tolist() == ["id", "type"] and len(df_emails) == 2
+            print(df_emails)
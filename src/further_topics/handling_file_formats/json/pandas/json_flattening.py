@@ -7,6 +7,7 @@
 # - Ensuring the final DataFrame has a clear structure with all necessary columns and renamed headers for clarity.
 
 import pandas as pd
+from json_flattener import flatten_json, explode_json, rename_to_leaf_names
 
 # input data
 data = [
@@ -68,39 +69,15 @@ data = [
 # Convert the data to a DataFrame
 df = pd.DataFrame(data, columns=["id", "info"])
 
-# Normalize the nested JSON data
-info_df = pd.json_normalize(df["info"])
+# Normalize the nested JSON data (the emails are dropped, they are exploded into a separate table)
+flattened_df = rename_to_leaf_names(flatten_json(df))
 
-# Concatenate the original id column with the normalized info DataFrame
-flattened_df = pd.concat([df["id"], info_df], axis=1)
+# Explode the emails and normalize them
+emails_df = rename_to_leaf_names(explode_json(df, "info.emails", id_columns=["id"]),
+                                 names={"type": "email_type", "email": "email_address"})
 
-# Explode the emails column
-flattened_df = flattened_df.explode("emails")
-
-# Normalize the emails column
-emails_df = pd.json_normalize(flattened_df["emails"])
-
-# Reset indexes to ensure uniqueness
-flattened_df = flattened_df.reset_index(drop=True)
-emails_df = emails_df.reset_index(drop=True)
-
-# Concatenate the flattened DataFrame with the emails DataFrame
-final_df = pd.concat([flattened_df.drop(columns=["emails"]), emails_df], axis=1)
-
-
-# Concatenate the flattened DataFrame with the emails DataFrame
-final_df = pd.concat([flattened_df.drop(columns=["emails"]), emails_df], axis=1)
-
-# Rename columns for clarity
-final_df.rename(columns={
-    "emails.type": "email_type",
-    "emails.email": "email_address",
-    "address.country_ISO2_code": "country_ISO2_code",
-    "address.street": "street",
-    "address.house_number": "house_number",
-    "address.city": "city"
-}, inplace=True)
+# Join the person and the emails data
+final_df = flattened_df.merge(emails_df, on="id")
 
 # Show the flattened DataFrame
 print(final_df)
-
@@ -0,0 +1,44 @@
+# Task:
+# Flatten a newline-delimited JSON (NDJSON) file of nested person records into Parquet tables
+# using Python's Pandas library, without loading the whole file into memory.
+# This involves:
+# - Reading the records in chunks of a bounded size (`pd.read_json(lines=True, chunksize=...)`).
+# - Flattening the nested fields of every chunk and exploding the emails into a separate table.
+# - Appending every chunk to the partitioned Parquet output (one file per chunk and table).
+
+import json
+import os
+import tempfile
+import pandas as pd
+from json_flattener import flatten_ndjson_to_parquet
+
+person_template = {
+    "first_name": "George",
+    "last_name": "Washington",
+    "age": 57,
+    "address": {"country_ISO2_code": "IR", "street": "Flowers road", "house_number": 38, "city": "Dublin"},
+    "emails": [
+        {"type": "work", "email": "georgew@workplace.com"},
+        {"type": "personal", "email": "georgew@gmail.com"}
+    ]
+}
+
+with tempfile.TemporaryDirectory() as working_directory:
+    # Write a sample NDJSON file, one nested record per line
+    path_to_ndjson_file = os.path.join(working_directory, "people.ndjson")
+    with open(path_to_ndjson_file, "w") as ndjson_file:
+        for person_id in range(10_000):
+            ndjson_file.write(json.dumps({"id": str(person_id), "info": person_template}) + "\n")
+
+    # Flatten it 2,500 records at a time
+    output_directory = os.path.join(working_directory, "people")
+    parquet_files = flatten_ndjson_to_parquet(path_to_ndjson_file,
+                                              output_directory,
+                                              explode_paths=["info.emails"],
+                                              id_columns=["id"],
+                                              chunk_size=2_500)
+    print({table: len(files) for table, files in parquet_files.items()})
+
+    # Read the partitioned tables back
+    print(pd.read_parquet(os.path.join(output_directory, "records")))
+    print(pd.read_parquet(os.path.join(output_directory, "info.emails")))
@@ -0,0 +1,228 @@
+"""
+Flattening of nested JSON data with the native struct and list operations of Polars.
+
+Nested objects are loaded as `pl.Struct` columns and arrays as `pl.List` columns, so flattening never goes through
+Python dictionaries:
+- `flatten_json` unnests the struct columns level by level (`struct.unnest`), up to any depth,
+- `explode_json` creates one row per element of the array found at a path (e.g. `info.emails`), with `explode`.
+
+The flattened columns are named after their path, e.g. `info.address.city`.
+
+NDJSON files larger than memory are flattened chunk by chunk with `flatten_ndjson_to_parquet`.
+"""
+import io
+import os
+import polars as pl
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Union
+
+
+def flatten_json(frame: Union[pl.DataFrame | pl.LazyFrame],
+                 separator: str = '.',
+                 keep_lists: bool = False) -> Union[pl.DataFrame | pl.LazyFrame]:
+    """
+    Unnest every struct column of a DataFrame, whatever the depth of the nesting.
+
+    :param frame: A DataFrame or LazyFrame with struct (JSON object) columns.
+    :param separator: Joins the field names of a path into a column name.
+    :param keep_lists: Keep the list (JSON array) columns, by default they are dropped - use `explode_json` on them.
+    :return: The flattened DataFrame or LazyFrame.
+
+    Examples:
+        >>> df = pl.DataFrame({"id": ["101"], "info": [{"name": "George", "address": {"city": "Dublin"}}]})
+        >>> flatten_json(df).columns
+        ['id', 'info.name', 'info.address.city']
+    """
+    schema = frame.collect_schema()
+    while any(isinstance(dtype, pl.Struct) for dtype in schema.values()):
+        frame = frame.select(pl.col(column).struct.unnest().name.prefix(f"{column}{separator}")
+                             if isinstance(dtype, pl.Struct) else pl.col(column)
+                             for column, dtype in schema.items())
+        schema = frame.collect_schema()
+
+    if not keep_lists:
+        frame = frame.drop(column for column, dtype in schema.items() if isinstance(dtype, pl.List))
+
+    return frame
+
+
+def explode_json(frame: Union[pl.DataFrame | pl.LazyFrame],
+                 path: str,
+                 id_columns: Sequence[str] = (),
+                 separator: str = '.') -> Union[pl.DataFrame | pl.LazyFrame]:
+    """
+    Create one row per element of the array found at a path, the elements are flattened with `flatten_json`.
+
+    The path may go through several arrays (e.g. `orders.items`), each of them is exploded in turn.
+    Rows with a missing or empty array are left out, so a path missing (or null) in every record gives no rows,
+    with the id columns only.
+
+    :param frame: A DataFrame or LazyFrame with struct and list columns.
+    :param path: The path of the array, the field names joined with `separator`.
+    :param id_columns: Columns of the (flattened) frame repeated on every row, e.g. the id of the record.
+    :param separator: Joins the field names of a path into a column name.
+    :return: One row per array element, with the id columns and the flattened fields of the element
+        (named relative to the element).
+
+    Examples:
+        >>> df = pl.DataFrame({"id": ["101"], "info": [{"emails": [{"type": "work"}, {"type": "personal"}]}]})
+        >>> explode_json(df, "info.emails", id_columns=["id"]).rows()
+        [('101', 'work'), ('101', 'personal')]
+    """
+    id_columns = list(id_columns)
+    segments = path.split(separator)
+
+    frame = flatten_json(frame, separator, keep_lists=True)
+    while segments:
+        column = _find_column(frame.collect_schema(), segments, separator)
+        element_dtype = frame.collect_schema()[column] if column else pl.Null
+        if isinstance(element_dtype, pl.List):
+            element_dtype = element_dtype.inner
+        if element_dtype == pl.Null:
+            # The path is missing, null or an empty array in every record
+            return frame.select(id_columns).clear()
+        segments = segments[len(column.split(separator)):]
+
+        frame = frame.select(*id_columns, column).explode(column).drop_nulls(column)
+        if isinstance(element_dtype, pl.Struct):
+            frame = frame.select(*id_columns, pl.col(column).struct.unnest())
+        else:
+            frame = frame.rename({column: column.split(separator)[-1]})
+
+        frame = flatten_json(frame, separator, keep_lists=True)
+
+    return frame
+
+
+def rename_to_leaf_names(frame: Union[pl.DataFrame | pl.LazyFrame],
+                         separator: str = '.',
+                         names: Optional[Dict[str, str]] = None) -> Union[pl.DataFrame | pl.LazyFrame]:
+    """
+    Rename the flattened columns to the last field name of their path (`info.address.city` -> `city`),
+    or to the names given in `names`.
+    """
+    names = names or {}
+    return frame.rename({column: names.get(column, column.split(separator)[-1])
+                         for column in frame.collect_schema().names()})
+
+
+def flatten_ndjson_to_parquet(path_to_ndjson_file: str,
+                              output_directory: str,
+                              explode_paths: Sequence[str] = (),
+                              id_columns: Sequence[str] = (),
+                              chunk_size: int = 100_000,
+                              schema: Optional[Dict] = None,
+                              separator: str = '.') -> Dict[str, List[str]]:
+    """
+    Flatten a newline-delimited JSON file of any size into Parquet files, reading at most `chunk_size` records at once.
+
+    Every chunk of lines is parsed by `pl.read_ndjson`, flattened with `flatten_json`, exploded with `explode_json`
+    and written to one Parquet file per table, so the peak memory depends on the chunk size only. The tables are
+    written to `<output_directory>/<table>/part-<chunk>.parquet`: the flattened records to the `records` table,
+    the exploded arrays to a table named after their path. Read a table back with
+    `pl.scan_parquet(f"{output_directory}/{table}/*.parquet")`.
+
+    :param path_to_ndjson_file: The NDJSON file, one JSON record per line.
+    :param output_directory: The directory of the Parquet tables, created if needed.
+    :param explode_paths: The paths of the arrays exploded into separate tables (e.g. `info.emails`).
+    :param id_columns: Columns repeated on every row of the exploded tables, e.g. the id of the record.
+    :param chunk_size: The number of lines (records) parsed at once.
+    :param schema: The schema of the records, applied to every chunk. By default the schema of every chunk is
+        inferred from all its records and the schema of a table is widened with the schema of every chunk:
+        the fields first seen in a later chunk are added, the fields only seen as nulls (`pl.Null`) take the type
+        found later, and numeric types are promoted (e.g. `Int64` to `Float64`). The Parquet files written before
+        the last widening are rewritten with the final schema at the end (one at a time), so every Parquet file of
+        a table has the same schema.
+    :param separator: Joins the field names of a path into a column name.
+    :return: The Parquet files written, by table.
+
+    Examples:
+        >>> parquet_files = flatten_ndjson_to_parquet("people.ndjson", "people_parquet",
+        ...                                           explode_paths=["info.emails"], id_columns=["id"])
+        >>> pl.scan_parquet("people_parquet/info.emails/*.parquet").collect()
+    """
+    tables = {'records': lambda df: _drop_paths(flatten_json(df, separator), explode_paths, separator)}
+    tables.update({explode_path: lambda df, explode_path=explode_path: explode_json(df, explode_path, id_columns,
+                                                                                    separator)
+                   for explode_path in explode_paths})
+    parquet_files = {table: [] for table in tables}
+    table_schemas = {table: pl.Schema() for table in tables}
+    file_schemas = {}
+
+    with open(path_to_ndjson_file, 'rb') as ndjson_file:
+        chunk_number = 0
+        while lines := list(islice(ndjson_file, chunk_size)):
+            df_chunk = pl.read_ndjson(io.BytesIO(b''.join(lines)), schema=schema, infer_schema_length=None)
+
+            for table, get_table in tables.items():
+                df_table = _with_widened_schema(get_table(df_chunk), table_schemas[table])
+                table_schemas[table] = df_table.schema
+
+                path_to_parquet_file = os.path.join(output_directory, table, f"part-{chunk_number:05d}.parquet")
+                os.makedirs(os.path.dirname(path_to_parquet_file), exist_ok=True)
+                df_table.write_parquet(path_to_parquet_file)
+                parquet_files[table].append(path_to_parquet_file)
+                file_schemas[path_to_parquet_file] = df_table.schema
+
+            chunk_number += 1
+
+    for table, table_files in parquet_files.items():
+        for path_to_parquet_file in table_files:
+            if file_schemas[path_to_parquet_file] != table_schemas[table]:
+                _with_widened_schema(pl.read_parquet(path_to_parquet_file),
+                                     table_schemas[table]).write_parquet(path_to_parquet_file)
+
+    return parquet_files
+
+
+def _with_widened_schema(df: pl.DataFrame, schema: pl.Schema) -> pl.DataFrame:
+    """
+    Return the DataFrame with the columns of `schema` first (added as nulls if missing), cast to the supertype of
+    both schemas, then the columns not in `schema`.
+    """
+    return pl.concat([pl.DataFrame(schema=schema), df], how='diagonal_relaxed')
+
+
+def _drop_paths(frame: Union[pl.DataFrame | pl.LazyFrame],
+                paths: Sequence[str],
+                separator: str) -> Union[pl.DataFrame | pl.LazyFrame]:
+    """
+    Drop the columns on the exploded paths, left in the flattened records when they are null in every record.
+    """
+    return frame.drop(column for column in frame.collect_schema().names()
+                      if any(f"{path}{separator}".startswith(f"{column}{separator}") for path in paths))
+
+
+def _find_column(schema: pl.Schema, segments: List[str], separator: str) -> Optional[str]:
+    """
+    Return the longest path prefix of `segments` that is a column of the flattened frame, None if there is none.
+    """
+    for length in range(len(segments), 0, -1):
+        column = separator.join(segments[:length])
+        if column in schema:
+            return column
+
+    return None
+
+
+if __name__ == '__main__':
+    import json
+    import tempfile
+
+    # The emails are only in the first chunk, missing or null in the following ones: every table keeps one schema
+    # and the emails stay out of the records table
+    for missing_emails in ({}, {"emails": None}):
+        with tempfile.TemporaryDirectory() as working_directory:
+            path_to_ndjson_file = os.path.join(working_directory, "people.ndjson")
+            with open(path_to_ndjson_file, "w") as ndjson_file:
+                for person_id in range(6):
+                    emails = {"emails": [{"type": "work"}]} if person_id < 2 else missing_emails
+                    ndjson_file.write(json.dumps({"id": str(person_id), "info": {"name": "George", **emails}}) + "\n")
+
+            parquet_files = flatten_ndjson_to_parquet(path_to_ndjson_file, os.path.join(working_directory, "people"),
+                                                      explode_paths=["info.emails"], id_columns=["id"], chunk_size=2)
+            df_records = pl.read_parquet(parquet_files["records"])
+            df_emails = pl.read_parquet(parquet_files["info.emails"])
+            assert df_records.columns == ["id", "info.name"] and df_records.height == 6
+            assert df_emails.columns == ["id", "type"] and df_emails.height == 2
+            print(df_emails)
@@ -7,7 +7,7 @@
 # - Ensuring the final DataFrame has a clear structure with all necessary columns and renamed headers for clarity.
 
 import polars as pl
-from typing import Dict
+from json_flattener import flatten_json, explode_json, rename_to_leaf_names
 
 # Input data
 data = [
@@ -67,60 +67,13 @@ data = [
 ]
 
 
-def flatten_info(id: int, info: Dict) -> Dict:
-    """
-    Flattens nested fields within a dictionary.
+# Convert the data to a Polars DataFrame, the nested objects become struct columns and the arrays list columns
+df = pl.DataFrame(data, schema=["id", "info"], orient="row")
 
-    This function extracts and flattens nested fields from the input dictionary,
-    creating a new dictionary with a simplified structure to prepare JSON data for tabular representation.
-
-    :param id:
-        The id of the record.
-
-    :type id: int
-
-    :param info:
-        Dictionary containing nested user information. The expected structure includes
-        'first_name', 'last_name', 'age', and 'address' which itself contains
-        'country_ISO2_code', 'street', 'house_number', and 'city'.
-
-    :type info: Dict
-
-    :return:
-        A flattened dictionary with the following keys:
-        - 'first_name': User's first name.
-        - 'last_name': User's last name.
-        - 'age': User's age.
-        - 'country_ISO2_code': Country ISO2 code from the address.
-        - 'street': Street name from the address.
-        - 'house_number': House number from the address.
-        - 'city': City from the address.
-
-    :rtype: Dict
-    """
-    flattened = {
-        "id": id,
-        "first_name": info["first_name"],
-        "last_name": info["last_name"],
-        "age": info["age"],
-        "country_ISO2_code": info["address"]["country_ISO2_code"],
-        "street": info["address"]["street"],
-        "house_number": info["address"]["house_number"],
-        "city": info["address"]["city"],
-    }
-    return flattened
-
-
-# Convert the data to a Polars DataFrame
-df = pl.DataFrame(data, schema=[("id", pl.Utf8), ("info", pl.Object)])
-
-# Flatten the info column
-flattened_data = [flatten_info(row["id"], row["info"]) for row in df.to_dicts()]
-emails_data = [(row["id"], email["type"], email["email"]) for row in df.to_dicts() for email in row["info"]["emails"]]
-
-# Create Polars DataFrames
-flattened_df = pl.DataFrame(flattened_data)
-emails_df = pl.DataFrame(emails_data, schema=[("id", pl.Utf8), ("email_type", pl.String), ("email_address", pl.String)])
+# Flatten the info column (struct.unnest) and explode the emails (explode), both natively in Polars
+flattened_df = rename_to_leaf_names(flatten_json(df))
+emails_df = rename_to_leaf_names(explode_json(df, "info.emails", id_columns=["id"]),
+                                 names={"type": "email_type", "email": "email_address"})
 
 # Join the data
 final_df = flattened_df.join(emails_df, on="id")
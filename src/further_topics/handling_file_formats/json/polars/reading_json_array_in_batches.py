@@ -0,0 +1,53 @@
+"""
+Read a JSON file holding a top-level array (actors.json) in batches of a bounded size, instead of parsing
+the whole file at once, and stream the schema-aligned batches to a Parquet file and to a DuckDB table.
+
+The records are decoded one by one (`json.JSONDecoder.raw_decode`, see `json_array_reader.py` of the data providers),
+so the peak memory depends on the batch size only. Point the data provider to a scaled dataset (BEAR_MATCHES_DATA_DIR)
+to read a large dump.
+"""
+import os
+import sys
+import duckdb
+import polars as pl
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../", "data_providers"))
+sys.path.insert(0, data_provider_path)
+
+from movie_data_provider import MovieDataProviderForPolars
+from json_array_reader import concat_batches, write_batches_to_duckdb, write_batches_to_parquet
+
+BATCH_SIZE = 1_000
+
+# Iterate over the batches
+for df_batch in MovieDataProviderForPolars.iter_json_batches("actors.json",
+                                                             MovieDataProviderForPolars.get_actors_schema,
+                                                             batch_size=BATCH_SIZE):
+    print(df_batch.shape, df_batch["person_id"].min(), df_batch["person_id"].max())
+
+# Stream the batches to a Parquet file, one row group per batch
+parquet_file_path = MovieDataProviderForPolars.get_data_file_path("actors_batches.parquet")
+row_count = write_batches_to_parquet(
+    MovieDataProviderForPolars.iter_json_batches("actors.json", MovieDataProviderForPolars.get_actors_schema,
+                                                 batch_size=BATCH_SIZE),
+    parquet_file_path)
+print(f"{row_count} rows written to {parquet_file_path}")
+
+# Stream the batches to a DuckDB table
+connection = duckdb.connect()
+write_batches_to_duckdb(
+    MovieDataProviderForPolars.iter_json_batches("actors.json", MovieDataProviderForPolars.get_actors_schema,
+                                                 batch_size=BATCH_SIZE),
+    connection,
+    "actors")
+print(connection.sql("SELECT COUNT(*) AS number_of_actors FROM actors").pl())
+
+# Concatenate the batches, the result is the same as loading the whole file
+df_actors = concat_batches(
+    MovieDataProviderForPolars.iter_json_batches("actors.json", MovieDataProviderForPolars.get_actors_schema,
+                                                 batch_size=BATCH_SIZE))
+df_actors_loaded = MovieDataProviderForPolars.load_json_as_dataframe("actors.json",
+                                                                     MovieDataProviderForPolars.get_actors_schema)
+print("Result of comparing the concatenated batches with the loaded DataFrame:", df_actors.equals(df_actors_loaded))
+print("Result of comparing the Parquet file with the loaded DataFrame:",
+      pl.read_parquet(parquet_file_path).equals(df_actors_loaded))
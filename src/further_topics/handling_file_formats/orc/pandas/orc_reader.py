@@ -0,0 +1,59 @@
+"""
+Reading and writing ORC files with Pandas through `pyarrow.orc`.
+
+`pd.read_orc` always materializes the whole file. The functions below read only the requested columns
+(`columns=` is pushed down to the ORC reader) and can iterate over the stripes of the file, so an ORC extract
+larger than memory is processed one stripe (by default at most 64 MiB) at a time.
+"""
+import pandas as pd
+import pyarrow as pa
+import pyarrow.orc as orc
+from typing import Iterator, List, Optional
+
+
+def write_orc(df: pd.DataFrame,
+              path_to_orc_file: str,
+              stripe_size: int = 64 * 1024 ** 2,
+              compression: str = 'zstd',
+              row_index_stride: int = 10_000) -> None:
+    """
+    Write a DataFrame to an ORC file.
+
+    :param df: The DataFrame to write, the index is not written.
+    :param path_to_orc_file: The ORC file.
+    :param stripe_size: The (uncompressed) size of a stripe in bytes, the unit of `iter_orc_stripes`.
+    :param compression: The compression codec (`uncompressed`, `snappy`, `zlib`, `lz4` or `zstd`).
+    :param row_index_stride: The number of rows between two entries of the row index.
+    """
+    orc.write_table(pa.Table.from_pandas(df, preserve_index=False),
+                    path_to_orc_file,
+                    stripe_size=stripe_size,
+                    compression=compression,
+                    row_index_stride=row_index_stride)
+
+
+def read_orc(path_to_orc_file: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read an ORC file into a DataFrame, reading only the given columns.
+
+    :param path_to_orc_file: The ORC file.
+    :param columns: The columns to read, None for all of them.
+    :return: The DataFrame.
+    """
+    return orc.ORCFile(path_to_orc_file).read(columns=columns).to_pandas()
+
+
+def iter_orc_stripes(path_to_orc_file: str, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over the stripes of an ORC file, a stripe is read only when the iterator gets to it.
+
+    :param path_to_orc_file: The ORC file.
+    :param columns: The columns to read, None for all of them.
+    :return: One DataFrame per stripe.
+
+    Examples:
+        >>> total_revenue = sum(df_stripe["revenue"].sum() for df_stripe in iter_orc_stripes("movies.orc", ["revenue"]))
+    """
+    orc_file = orc.ORCFile(path_to_orc_file)
+    for stripe in range(orc_file.nstripes):
+        yield orc_file.read_stripe(stripe, columns=columns).to_pandas()
@@ -0,0 +1,62 @@
+"""
+Reading and writing ORC files with Polars.
+
+Polars has no ORC reader of its own, the files are read by `pyarrow.orc` and handed over to Polars with
+`pl.from_arrow` instead of converting the data through Pandas. The numeric and other fixed-width columns keep their
+Arrow buffers, the string columns are copied into the string views of Polars.
+Only the requested columns are read (`columns=` is pushed down to the ORC reader) and the stripes of the file can be
+iterated, so an ORC extract larger than memory is processed one stripe (by default at most 64 MiB) at a time.
+"""
+import polars as pl
+import pyarrow.orc as orc
+from typing import Iterator, List, Optional
+
+
+def write_orc(df: pl.DataFrame,
+              path_to_orc_file: str,
+              stripe_size: int = 64 * 1024 ** 2,
+              compression: str = 'zstd',
+              row_index_stride: int = 10_000) -> None:
+    """
+    Write a DataFrame to an ORC file.
+
+    ORC has no string view type, the string columns are written as (large) strings.
+
+    :param df: The DataFrame to write.
+    :param path_to_orc_file: The ORC file.
+    :param stripe_size: The (uncompressed) size of a stripe in bytes, the unit of `iter_orc_stripes`.
+    :param compression: The compression codec (`uncompressed`, `snappy`, `zlib`, `lz4` or `zstd`).
+    :param row_index_stride: The number of rows between two entries of the row index.
+    """
+    orc.write_table(df.to_arrow(compat_level=pl.CompatLevel.oldest()),
+                    path_to_orc_file,
+                    stripe_size=stripe_size,
+                    compression=compression,
+                    row_index_stride=row_index_stride)
+
+
+def read_orc(path_to_orc_file: str, columns: Optional[List[str]] = None) -> pl.DataFrame:
+    """
+    Read an ORC file into a DataFrame, reading only the given columns.
+
+    :param path_to_orc_file: The ORC file.
+    :param columns: The columns to read, None for all of them.
+    :return: The DataFrame.
+    """
+    return pl.from_arrow(orc.ORCFile(path_to_orc_file).read(columns=columns))
+
+
+def iter_orc_stripes(path_to_orc_file: str, columns: Optional[List[str]] = None) -> Iterator[pl.DataFrame]:
+    """
+    Iterate over the stripes of an ORC file, a stripe is read only when the iterator gets to it.
+
+    :param path_to_orc_file: The ORC file.
+    :param columns: The columns to read, None for all of them.
+    :return: One DataFrame per stripe.
+
+    Examples:
+        >>> total_revenue = sum(df_stripe["revenue"].sum() for df_stripe in iter_orc_stripes("movies.orc", ["revenue"]))
+    """
+    orc_file = orc.ORCFile(path_to_orc_file)
+    for stripe in range(orc_file.nstripes):
+        yield pl.from_arrow(orc_file.read_stripe(stripe, columns=columns))
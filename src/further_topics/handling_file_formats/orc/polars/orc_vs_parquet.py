@@ -0,0 +1,57 @@
+"""
+Compare the file size and the read speed of ORC and Parquet for the movies.
+
+Both files are compressed with zstd. The reads are timed for all the columns, for a projection of three columns
+and, for ORC, for the stripe by stripe iteration of the projection. Point the data provider to a scaled dataset
+(BEAR_MATCHES_DATA_DIR, see `data_generators/movie_data_scaler.py`) to compare the formats on more data.
+"""
+import os
+import sys
+import time
+import statistics
+import tempfile
+import polars as pl
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../", "data_providers"))
+sys.path.insert(0, data_provider_path)
+
+from movie_data_provider import MovieDataProviderForPolars
+from orc_reader import write_orc, read_orc, iter_orc_stripes
+
+REPETITIONS = 10
+PROJECTION = ["movie_id", "release_date", "revenue"]
+
+
+def get_median_latency_ms(read) -> float:
+    latencies = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        read()
+        latencies.append(time.perf_counter() - start)
+
+    return statistics.median(latencies) * 1000
+
+
+df_movies = MovieDataProviderForPolars.load_json_as_dataframe("movies.json", MovieDataProviderForPolars.get_movies_schema)
+
+with tempfile.TemporaryDirectory() as working_directory:
+    path_to_orc_file = os.path.join(working_directory, "movies.orc")
+    path_to_parquet_file = os.path.join(working_directory, "movies.parquet")
+
+    write_orc(df_movies, path_to_orc_file, compression="zstd")
+    df_movies.write_parquet(path_to_parquet_file, compression="zstd")
+
+    readers = {
+        "orc": lambda columns=None: read_orc(path_to_orc_file, columns),
+        "parquet": lambda columns=None: pl.read_parquet(path_to_parquet_file, columns=columns),
+    }
+
+    print(f"{'format':<10}{'size (KiB)':>12}{'all columns (ms)':>20}{'projection (ms)':>20}")
+    for file_format, path_to_file in (("orc", path_to_orc_file), ("parquet", path_to_parquet_file)):
+        print(f"{file_format:<10}"
+              f"{os.path.getsize(path_to_file) / 1024:>12.1f}"
+              f"{get_median_latency_ms(readers[file_format]):>20.2f}"
+              f"{get_median_latency_ms(lambda: readers[file_format](PROJECTION)):>20.2f}")
+
+    print(f"orc projection, stripe by stripe: "
+          f"{get_median_latency_ms(lambda: list(iter_orc_stripes(path_to_orc_file, PROJECTION))):.2f} ms")
@@ -0,0 +1,41 @@
+"""
+Read the movies data from a JSON file into a Polars DataFrame,
+write it to a ORC(Optimized Row Columnar) file, and read it back into a DataFrame,
+comparing the original and the read DataFrame.
+
+Polars has no native ORC support, the file is written and read by `pyarrow.orc` (see `orc_reader.py`).
+"""
+import os
+import sys
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../", "data_providers"))
+sys.path.insert(0, data_provider_path)
+
+from movie_data_provider import MovieDataProviderForPolars
+from orc_reader import write_orc, read_orc, iter_orc_stripes
+
+# Load the movies data from a JSON file into a Polars DataFrame
+df_movies = MovieDataProviderForPolars.load_json_as_dataframe(
+    json_file_name="movies.json",
+    schema_provider=MovieDataProviderForPolars.get_movies_schema,
+    index_column=None,
+)
+
+orc_file_path = os.path.abspath(
+    os.path.join(data_provider_path, "../data", "movies.orc")
+)
+
+# Write the DataFrame to an ORC file
+write_orc(df_movies, orc_file_path, compression="uncompressed")
+
+# Read the ORC file back into a DataFrame
+df_movies_from_orc = read_orc(orc_file_path)
+# Check if schema is retained
+print(df_movies_from_orc.schema)
+# Compare the original DataFrame with the one read from the ORC file
+print("Result of comparing the original DataFrame with the one read from the ORC file:",
+      df_movies.equals(df_movies_from_orc))
+
+# Read only two columns, stripe by stripe
+for df_stripe in iter_orc_stripes(orc_file_path, columns=["movie_id", "revenue"]):
+    print(df_stripe.shape, df_stripe["revenue"].sum())
@@ -0,0 +1,148 @@
+"""
+Partitioned Parquet export of the movies, tuned for selective reads.
+
+The movies are written to a hive-partitioned directory (e.g. `release_year=2010/movie_status=Released/part-0.parquet`)
+and sorted by `movie_id` within every file. A query filtering on `release_date` reads back only:
+- the partitions of the matching release years, the other files are never opened (partition pruning),
+- the row groups whose `release_date` min/max statistics overlap the range (row group skipping).
+
+The row group size, the dictionary encoding, the statistics / page index and the compression level are parameters
+of `write_partitioned_parquet`. The DataFrame is converted to an Arrow table and written with
+`pyarrow.dataset.write_dataset`, which exposes all of these options, and read back through `pyarrow.dataset`
+with the filters pushed down to the scan.
+"""
+import glob
+import os
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from typing import List, Optional, Sequence, Tuple, Union
+
+
+def add_release_year(df_movies: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the `release_year` column (Int16, missing for a missing release date) derived from the `release_date` column.
+    """
+    return df_movies.assign(
+        release_year=pd.to_numeric(df_movies['release_date'].str.slice(0, 4), errors='coerce').astype('Int16'))
+
+
+def write_partitioned_parquet(df_movies: pd.DataFrame,
+                              root_directory: str,
+                              partition_by: Sequence[str] = ('release_year',),
+                              sort_by: Sequence[str] = ('movie_id',),
+                              row_group_size: int = 64 * 1024,
+                              use_dictionary: Union[bool, Sequence[str]] = True,
+                              write_statistics: bool = True,
+                              write_page_index: bool = True,
+                              compression: str = 'zstd',
+                              compression_level: Optional[int] = None) -> List[str]:
+    """
+    Write the movies to a hive-partitioned Parquet directory, replacing the export written there before
+    (see `remove_partitioned_parquet`).
+
+    :param df_movies: The movies, `release_year` is derived from `release_date` if it is a partition column.
+    :param root_directory: The root directory of the partitions.
+    :param partition_by: The partition columns, e.g. `('release_year', 'movie_status')`. Empty for a single file.
+    :param sort_by: The sort order of the rows within the files.
+    :param row_group_size: The maximum number of rows of a row group. Smaller row groups allow skipping more data
+        on selective reads, larger ones compress better and have less metadata.
+    :param use_dictionary: Dictionary encode all the columns (True), none of them (False) or the listed ones.
+    :param write_statistics: Write the min/max statistics of the row groups, required to skip row groups.
+    :param write_page_index: Write the column and offset indexes, which allow skipping pages within row groups.
+    :param compression: The compression codec (`zstd`, `snappy`, `lz4`, `gzip`, `brotli` or `none`).
+    :param compression_level: The compression level, None for the default level of the codec.
+    :return: The Parquet files written.
+    """
+    if 'release_year' in partition_by and 'release_year' not in df_movies.columns:
+        df_movies = add_release_year(df_movies)
+
+    df_movies = df_movies.sort_values([*partition_by, *sort_by], na_position='last')
+    table = pa.Table.from_pandas(df_movies, preserve_index=False)
+
+    file_options = ds.ParquetFileFormat().make_write_options(
+        compression=compression,
+        compression_level=compression_level,
+        use_dictionary=list(use_dictionary) if not isinstance(use_dictionary, bool) else use_dictionary,
+        write_statistics=write_statistics,
+        write_page_index=write_page_index)
+
+    remove_partitioned_parquet(root_directory)
+
+    ds.write_dataset(table,
+                     root_directory,
+                     format='parquet',
+                     partitioning=list(partition_by) or None,
+                     partitioning_flavor='hive' if partition_by else None,
+                     file_options=file_options,
+                     min_rows_per_group=min(row_group_size, max(len(table), 1)),
+                     max_rows_per_group=row_group_size,
+                     existing_data_behavior='overwrite_or_ignore')
+
+    return sorted(glob.glob(os.path.join(root_directory, '**', '*.parquet'), recursive=True))
+
+
+def remove_partitioned_parquet(root_directory: str) -> None:
+    """
+    Remove a Parquet export written to a root directory before: its Parquet files and partition directories.
+
+    :param root_directory: The root directory of the partitions, nothing is done if it does not exist.
+    :raises FileExistsError: If the root directory holds other files, or directories not named `column=value`,
+        so that a directory holding unrelated data is never emptied.
+    """
+    if not os.path.isdir(root_directory):
+        return
+
+    unrelated_paths = [os.path.join(directory, name)
+                       for directory, subdirectories, file_names in os.walk(root_directory)
+                       for name in [*(name for name in subdirectories if '=' not in name),
+                                    *(name for name in file_names if not name.endswith('.parquet'))]]
+    if unrelated_paths:
+        raise FileExistsError(f"{root_directory} holds files which were not written by write_partitioned_parquet, "
+                              f"e.g. {unrelated_paths[0]}. Write to an empty or new directory instead.")
+
+    for name in os.listdir(root_directory):
+        path = os.path.join(root_directory, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+
+def read_partitioned_parquet(root_directory: str,
+                             columns: Optional[List[str]] = None,
+                             release_date_range: Optional[Tuple[str, str]] = None,
+                             filters: Optional[List[Tuple]] = None) -> pd.DataFrame:
+    """
+    Read a partitioned Parquet directory, with the partition columns restored from the directory names.
+
+    A `release_date_range` (inclusive, `YYYY-MM-DD` strings) is applied on `release_date` and, if the data is
+    partitioned by `release_year`, on the matching years as well, so the other partitions are pruned.
+
+    :param root_directory: The root directory written by `write_partitioned_parquet`.
+    :param columns: The columns to read, None for all of them.
+    :param release_date_range: The first and last release date to read.
+    :param filters: Further filters in the `pd.read_parquet` format, e.g. `[('movie_status', '==', 'Released')]`.
+        The filters of the partition columns prune whole files, the others skip row groups based on their statistics.
+    :return: The matching movies.
+
+    Examples:
+        >>> df_movies = read_partitioned_parquet("movies_partitioned",
+        ...                                      columns=["movie_id", "title"],
+        ...                                      release_date_range=("2010-01-01", "2010-06-30"))
+    """
+    dataset = ds.dataset(root_directory, format='parquet', partitioning='hive')
+    filters = list(filters or [])
+
+    if release_date_range:
+        first_release_date, last_release_date = release_date_range
+        filters += [('release_date', '>=', first_release_date), ('release_date', '<=', last_release_date)]
+        if 'release_year' in dataset.schema.names:
+            filters += [('release_year', '>=', int(first_release_date[:4])),
+                        ('release_year', '<=', int(last_release_date[:4]))]
+
+    table = dataset.to_table(columns=columns, filter=pq.filters_to_expression(filters) if filters else None)
+
+    return table.to_pandas()
@@ -24,7 +24,7 @@ df_movies = MovieDataProviderForPandas.load_json_as_dataframe(
 )
 
 parquet_file_path = os.path.abspath(
-    os.path.join(data_provider_path, "../data", "movies,parquet")
+    os.path.join(data_provider_path, "../data", "movies.parquet")
 )
 
 # Write the DataFrame to a Parquet file
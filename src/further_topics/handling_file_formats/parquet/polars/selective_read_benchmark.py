@@ -0,0 +1,42 @@
+"""
+Compare the latency of a selective read (the movies released in the first half of 2010) from a flat Parquet file
+and from a Parquet directory partitioned by release year.
+
+Both files are written by `write_partitioned_parquet` with the same row group size, statistics and compression.
+The flat file is read with the `release_date` filter pushed down to the row group statistics only, the partitioned
+directory additionally prunes the partitions of the other release years.
+Point the data provider to a scaled dataset (BEAR_MATCHES_DATA_DIR) to see the difference growing with the data.
+"""
+import os
+import sys
+import time
+import statistics
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+from partitioned_parquet import write_partitioned_parquet, scan_partitioned_parquet
+
+REPETITIONS = 20
+RELEASE_DATE_RANGE = ("2010-01-01", "2010-06-30")
+COLUMNS = ["movie_id", "title", "release_date", "vote_average"]
+
+df_movies = MovieDataProviderForPolars.load_json_as_dataframe("movies.json",
+                                                              MovieDataProviderForPolars.get_movies_schema)
+
+layouts = {
+    "flat": MovieDataProviderForPolars.get_data_file_path("movies_flat"),
+    "partitioned by release_year": MovieDataProviderForPolars.get_data_file_path("movies_partitioned"),
+}
+write_partitioned_parquet(df_movies, layouts["flat"], partition_by=(), row_group_size=1024)
+write_partitioned_parquet(df_movies, layouts["partitioned by release_year"], partition_by=("release_year",),
+                          row_group_size=1024)
+
+for layout, root_directory in layouts.items():
+    latencies = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        df_selected = scan_partitioned_parquet(root_directory, RELEASE_DATE_RANGE).select(COLUMNS).collect()
+        latencies.append(time.perf_counter() - start)
+
+    print(f"{layout:<30} {df_selected.height:>6} rows   median {statistics.median(latencies) * 1000:8.2f} ms")
@@ -0,0 +1,44 @@
+"""
+List the dramas released in 2010 or later together with their genres, using Polars LazyFrames.
+
+The movies, movie-genre pairs and genres are scanned lazily through the data provider, so nothing
+is read until `collect()` is called. Polars optimizes the whole query before executing it:
+- projection pushdown: only the `movie_id`, `title`, `release_date` and `genre_name` related columns are read,
+  the wide `overview`, `tagline` and `homepage` columns are never loaded,
+- predicate pushdown: the release date filter is applied while scanning the movies file.
+
+Compare the plan printed by `explain(optimized=False)` with the optimized one to see the difference.
+"""
+import os
+import sys
+import polars as pl
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+
+lf_movies = MovieDataProviderForPolars.scan_movies()
+lf_movie_genre = MovieDataProviderForPolars.scan_movie_genre()
+lf_genres = MovieDataProviderForPolars.scan_genres()
+
+lf_movies_with_genres = (
+    lf_movies
+    .filter(pl.col('release_date') >= '2010-01-01')
+    .join(lf_movie_genre, on='movie_id', how='inner')
+    .join(lf_genres, on='genre_id', how='inner')
+    .group_by('movie_id', 'title', 'release_date')
+    .agg(genres_list=pl.col('genre_name'))
+    .filter(pl.col('genres_list').list.contains('Drama'))
+    .with_columns(genres_concatenated=pl.col('genres_list').list.join(', '))
+    .sort('release_date')
+)
+
+print("Query plan as written:")
+print(lf_movies_with_genres.explain(optimized=False))
+
+print("\nOptimized query plan (see the projected columns and the pushed down filter at the scans):")
+print(lf_movies_with_genres.explain())
+
+# Nothing has been read so far, the query is executed here
+df_movies_with_genres = lf_movies_with_genres.collect()
+print(df_movies_with_genres)
@@ -0,0 +1,20 @@
+"""
+Compare the memory usage of the tables loaded with the standard and with the compact schemas.
+
+The compact schemas store the low-cardinality text columns as Enum/Categorical columns and downcast the
+integer columns to the narrowest width holding all of their values.
+"""
+import os
+import sys
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+
+df_report = MovieDataProviderForPolars.get_memory_usage_report()
+print(df_report)
+
+df_movies = MovieDataProviderForPolars.load_json_as_dataframe("movies.json",
+                                                              MovieDataProviderForPolars.get_movies_schema,
+                                                              compact=True)
+print(df_movies.schema)
@@ -0,0 +1,155 @@
+"""
+Groups of consecutive free seats, computed in a single vectorized pass over NumPy arrays.
+
+A free seat group is a run of free seats with consecutive seat ids in the same hall. Runs shorter than
+`min_group_size` (by default single free seats) are not counted, as in `seat_reservations.py`.
+
+Instead of shifting, filtering and grouping intermediate DataFrames, the run boundaries are found by comparing
+every free seat with the previous one (a different hall or a seat id gap starts a new run), and the run lengths
+are the distances between the boundaries. Seat maps too large to be loaded at once can be processed batch by
+batch with `iter_free_seat_groups`: the run still open at the end of a batch is carried over to the next one.
+"""
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Iterator, Optional
+
+
+def get_free_seat_groups(df_seats: pd.DataFrame,
+                         hall_column: Optional[str] = None,
+                         seat_column: str = 'seat_id',
+                         free_column: str = 'is_free',
+                         min_group_size: int = 2) -> pd.DataFrame:
+    """
+    Find the groups of consecutive free seats of one or more halls.
+
+    :param df_seats: One row per seat, with the seat id, the free flag (1/True for free seats) and optionally the hall.
+    :param hall_column: The column identifying the hall, None if every seat belongs to the same hall.
+    :param seat_column: The seat id column, consecutive seats have consecutive ids.
+    :param free_column: The column flagging the free seats.
+    :param min_group_size: Groups with fewer free seats are left out.
+    :return: One row per group with the hall (if any), `first_seat_id` and `group_size` columns,
+        sorted by hall and seat.
+    """
+    groups = _get_runs(*_get_free_seat_arrays(df_seats, hall_column, seat_column, free_column))
+    df_groups = _to_dataframe(groups, hall_column)
+
+    return df_groups[df_groups['group_size'] >= min_group_size].reset_index(drop=True)
+
+
+def count_free_seat_groups_by_size(df_seats: pd.DataFrame,
+                                   hall_column: Optional[str] = None,
+                                   seat_column: str = 'seat_id',
+                                   free_column: str = 'is_free',
+                                   min_group_size: int = 2) -> pd.DataFrame:
+    """
+    Count the groups of consecutive free seats by group size.
+
+    :return: The `group_size` and `nr_of_free_seatgroups` columns, sorted by group size
+        (and by hall first, if `hall_column` is set).
+    """
+    if hall_column:
+        df_groups = get_free_seat_groups(df_seats, hall_column, seat_column, free_column, min_group_size)
+        return df_groups.groupby([hall_column, 'group_size']).size().reset_index(name='nr_of_free_seatgroups')
+
+    _, _, group_sizes = _get_runs(*_get_free_seat_arrays(df_seats, hall_column, seat_column, free_column))
+    sizes, size_counts = np.unique(group_sizes[group_sizes >= min_group_size], return_counts=True)
+
+    return pd.DataFrame({'group_size': sizes, 'nr_of_free_seatgroups': size_counts})
+
+
+def iter_free_seat_groups(seat_batches: Iterable[pd.DataFrame],
+                          hall_column: Optional[str] = None,
+                          seat_column: str = 'seat_id',
+                          free_column: str = 'is_free',
+                          min_group_size: int = 2) -> Iterator[pd.DataFrame]:
+    """
+    Find the groups of consecutive free seats of a seat map read in batches (e.g. `pd.read_csv(..., chunksize=...)`).
+
+    The batches must follow each other in hall and seat order. The last group of a batch may continue in the next
+    batch, so it is only emitted once the next batch (or the end of the input) shows where it ends.
+
+    :return: An iterator of DataFrames in the format of `get_free_seat_groups`.
+    """
+    open_run = None
+    for df_batch in seat_batches:
+        halls, seats = _get_free_seat_arrays(df_batch, hall_column, seat_column, free_column)
+        run_halls, first_seats, group_sizes = _get_runs(halls, seats)
+        if len(first_seats) == 0:
+            continue
+
+        if open_run is not None:
+            open_hall, open_first_seat, open_size = open_run
+            if run_halls[0] == open_hall and first_seats[0] == open_first_seat + open_size:
+                first_seats[0] = open_first_seat
+                group_sizes[0] += open_size
+            else:
+                run_halls = np.r_[open_hall, run_halls]
+                first_seats = np.r_[open_first_seat, first_seats]
+                group_sizes = np.r_[open_size, group_sizes]
+
+        open_run = (run_halls[-1], first_seats[-1], group_sizes[-1])
+        df_groups = _to_dataframe((run_halls[:-1], first_seats[:-1], group_sizes[:-1]), hall_column)
+        yield df_groups[df_groups['group_size'] >= min_group_size].reset_index(drop=True)
+
+    if open_run is not None:
+        df_groups = _to_dataframe(tuple(np.array([value]) for value in open_run), hall_column)
+        yield df_groups[df_groups['group_size'] >= min_group_size].reset_index(drop=True)
+
+
+def count_free_seat_groups_in_batches(seat_batches: Iterable[pd.DataFrame],
+                                      hall_column: Optional[str] = None,
+                                      seat_column: str = 'seat_id',
+                                      free_column: str = 'is_free',
+                                      min_group_size: int = 2) -> pd.DataFrame:
+    """
+    Count the groups of consecutive free seats by group size, keeping only the counts in memory.
+
+    :return: The `group_size` and `nr_of_free_seatgroups` columns, sorted by group size.
+    """
+    counts: Dict[int, int] = {}
+    for df_groups in iter_free_seat_groups(seat_batches, hall_column, seat_column, free_column, min_group_size):
+        sizes, size_counts = np.unique(df_groups['group_size'].to_numpy(), return_counts=True)
+        for size, size_count in zip(sizes.tolist(), size_counts.tolist()):
+            counts[size] = counts.get(size, 0) + size_count
+
+    return pd.DataFrame(sorted(counts.items()), columns=['group_size', 'nr_of_free_seatgroups'])
+
+
+def _get_free_seat_arrays(df_seats: pd.DataFrame,
+                          hall_column: Optional[str],
+                          seat_column: str,
+                          free_column: str) -> tuple:
+    """
+    Return the hall and seat ids of the free seats, sorted by hall and seat.
+    """
+    is_free = df_seats[free_column].to_numpy().astype(bool)
+    seats = df_seats[seat_column].to_numpy()[is_free]
+    halls = df_seats[hall_column].to_numpy()[is_free] if hall_column else np.zeros(len(seats), dtype=np.int8)
+
+    is_sorted = bool(np.all((halls[1:] > halls[:-1]) | ((halls[1:] == halls[:-1]) & (seats[1:] >= seats[:-1]))))
+    if not is_sorted:
+        order = np.lexsort((seats, halls))
+        halls, seats = halls[order], seats[order]
+
+    return halls, seats
+
+
+def _get_runs(halls: np.ndarray, seats: np.ndarray) -> tuple:
+    """
+    Split sorted free seats into runs of consecutive seat ids, return the hall, first seat and length of every run.
+    """
+    if len(seats) == 0:
+        return halls, seats, np.empty(0, dtype=np.int64)
+
+    run_starts = np.flatnonzero(np.r_[True, (seats[1:] != seats[:-1] + 1) | (halls[1:] != halls[:-1])])
+    group_sizes = np.diff(np.append(run_starts, len(seats)))
+
+    return halls[run_starts], seats[run_starts], group_sizes
+
+
+def _to_dataframe(groups: tuple, hall_column: Optional[str]) -> pd.DataFrame:
+    halls, first_seats, group_sizes = groups
+    columns = {hall_column: halls} if hall_column else {}
+    columns.update(first_seat_id=first_seats, group_size=group_sizes)
+
+    return pd.DataFrame(columns)
@@ -1,5 +1,6 @@
 import pandas as pd
 import numpy as np
+from free_seat_groups import count_free_seat_groups_by_size
 
 # Create a DataFrame
 seat_reservation_data = [
@@ -33,3 +34,6 @@ result = group_sizes.groupby("group_size").size().reset_index(name="nr_of_free_s
 
 # Show the result
 print(result.sort_values("group_size"))
+
+# The same result in a single vectorized pass, without intermediate DataFrames
+print(count_free_seat_groups_by_size(df_seat_reservation))
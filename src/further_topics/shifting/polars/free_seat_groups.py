@@ -0,0 +1,74 @@
+"""
+Groups of consecutive free seats, computed in a single vectorized pass over the free seats.
+
+A free seat group is a run of free seats with consecutive seat ids in the same hall. Runs shorter than
+`min_group_size` (by default single free seats) are not counted, as in `seat_reservations.py`.
+
+Instead of shifting, filtering and grouping intermediate DataFrames, the first seat of every run is flagged by
+comparing every free seat with the previous one (a different hall or a seat id gap starts a new run), and the run
+lengths are the distances between the flagged positions (`pl.arg_where`). The functions accept a DataFrame or a
+LazyFrame; with a LazyFrame (e.g. `pl.scan_parquet` over a seat map with tens of millions of seats) only the
+three required columns are read. The query runs in memory: `pl.arg_where` and the sort are not streamable.
+"""
+import polars as pl
+from typing import Optional, Union
+
+
+def get_free_seat_groups(seats: Union[pl.DataFrame | pl.LazyFrame],
+                         hall_column: Optional[str] = None,
+                         seat_column: str = 'seat_id',
+                         free_column: str = 'is_free',
+                         min_group_size: int = 2,
+                         assume_sorted: bool = False) -> Union[pl.DataFrame | pl.LazyFrame]:
+    """
+    Find the groups of consecutive free seats of one or more halls.
+
+    :param seats: One row per seat, with the seat id, the free flag (1/True for free seats) and optionally the hall.
+    :param hall_column: The column identifying the hall, None if every seat belongs to the same hall.
+    :param seat_column: The seat id column, consecutive seats have consecutive ids.
+    :param free_column: The column flagging the free seats.
+    :param min_group_size: Groups with fewer free seats are left out.
+    :param assume_sorted: Skip sorting, the seats are already sorted by hall and seat id.
+    :return: One row per group with the hall (if any), `first_seat_id` and `group_size` columns,
+        sorted by hall and seat. A LazyFrame if `seats` is a LazyFrame.
+    """
+    halls = [hall_column] if hall_column else []
+
+    free_seats = seats.filter(pl.col(free_column).cast(pl.Boolean))
+    if not assume_sorted:
+        free_seats = free_seats.sort(*halls, seat_column)
+
+    is_run_start = pl.col(seat_column).diff() != 1
+    if hall_column:
+        is_run_start = is_run_start | (pl.col(hall_column) != pl.col(hall_column).shift(1))
+    is_run_start = is_run_start.fill_null(True)
+
+    return (
+        free_seats
+        .select(*[pl.col(hall).filter(is_run_start) for hall in halls],
+                first_seat_id=pl.col(seat_column).filter(is_run_start),
+                group_size=pl.arg_where(is_run_start).append(pl.len()).diff().slice(1))
+        .filter(pl.col('group_size') >= min_group_size)
+    )
+
+
+def count_free_seat_groups_by_size(seats: Union[pl.DataFrame | pl.LazyFrame],
+                                   hall_column: Optional[str] = None,
+                                   seat_column: str = 'seat_id',
+                                   free_column: str = 'is_free',
+                                   min_group_size: int = 2,
+                                   assume_sorted: bool = False) -> Union[pl.DataFrame | pl.LazyFrame]:
+    """
+    Count the groups of consecutive free seats by group size.
+
+    :return: The `group_size` and `nr_of_free_seatgroups` columns, sorted by group size
+        (and by hall first, if `hall_column` is set). A LazyFrame if `seats` is a LazyFrame.
+    """
+    by = [hall_column, 'group_size'] if hall_column else ['group_size']
+
+    return (
+        get_free_seat_groups(seats, hall_column, seat_column, free_column, min_group_size, assume_sorted)
+        .group_by(by)
+        .agg(nr_of_free_seatgroups=pl.len())
+        .sort(by)
+    )
@@ -1,4 +1,5 @@
 import polars as pl
+from free_seat_groups import count_free_seat_groups_by_size
 
 # Create a DataFrame
 seat_reservation_data = [
@@ -33,10 +34,13 @@ consecutive_seats = consecutive_seats.with_columns([
 ])
 
 # Step 4: Create group_sizes DataFrame
-group_sizes = consecutive_seats.group_by("group_number").agg(pl.count().alias("group_size"))
+group_sizes = consecutive_seats.group_by("group_number").agg(pl.len().alias("group_size"))
 
 # Step 5: Calculate the number of free seat groups by group_size
-result = group_sizes.group_by("group_size").agg(pl.count().alias("nr_of_free_seatgroups"))
+result = group_sizes.group_by("group_size").agg(pl.len().alias("nr_of_free_seatgroups"))
 
 # Show the result
 print(result.sort("group_size"))
+
+# The same result in a single vectorized pass, without intermediate DataFrames
+print(count_free_seat_groups_by_size(df_seat_reservation, assume_sorted=True))
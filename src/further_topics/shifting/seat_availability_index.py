@@ -0,0 +1,303 @@
+"""
+Incremental index of the free seat groups of a hall, for seat maps where single seats are booked and released
+all the time.
+
+`free_seat_groups.py` (pandas and Polars) computes the groups of consecutive free seats from the whole seat map.
+`SeatAvailabilityIndex` computes them once and then keeps them up to date seat by seat:
+- the free runs are stored by their first and by their last seat, so a released seat finds the runs it joins
+  in O(1),
+- a Fenwick tree counts the taken seats, so a booked seat finds the ends of the run it splits
+  (the previous and the next taken seat) in O(log n),
+- the run-length histogram (group_size -> nr_of_free_seatgroups) and the runs of every size are updated
+  with the runs, so `find_adjacent_free_seats(k)` answers without scanning the seats.
+
+Run the module to check the index against the batch computation of both engines after random bookings and releases.
+"""
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class SeatAvailabilityIndex:
+    """
+    The free seat groups of a hall, updated incrementally when a seat is booked or released.
+
+    Seat ids missing from the seat map (e.g. an aisle) are treated as permanently taken seats.
+
+    Examples:
+        >>> index = SeatAvailabilityIndex.from_seats([1, 2, 3, 4, 5], [1, 0, 1, 1, 1])
+        >>> index.get_histogram()
+        {3: 1}
+        >>> index.release(2)
+        >>> index.find_adjacent_free_seats(4)
+        [1, 2, 3, 4]
+    """
+
+    def __init__(self, first_seat_id: int, is_free: List[bool], min_group_size: int = 2):
+        """
+        :param first_seat_id: The id of the first seat, the other seats have consecutive ids.
+        :param is_free: The free flag of every seat.
+        :param min_group_size: Groups with fewer free seats are left out of the histogram.
+        """
+        self.first_seat_id = first_seat_id
+        self.min_group_size = min_group_size
+        self._is_free = [bool(free) for free in is_free]
+        self._seat_count = len(self._is_free)
+
+        # Fenwick tree over the taken seats (1-based positions)
+        self._taken_tree = [0] * (self._seat_count + 1)
+        for position, free in enumerate(self._is_free, start=1):
+            self._taken_tree[position] += not free
+            parent = position + (position & -position)
+            if parent <= self._seat_count:
+                self._taken_tree[parent] += self._taken_tree[position]
+        self._highest_power_of_two = 1 << (self._seat_count.bit_length() - 1) if self._seat_count else 0
+
+        # the free runs as (first, last) positions (0-based), by first and by last position
+        self._run_end_by_start: Dict[int, int] = {}
+        self._run_start_by_end: Dict[int, int] = {}
+        # number of runs and the first positions of the runs, by run size
+        self._histogram: Dict[int, int] = {}
+        self._run_starts_by_size: Dict[int, Set[int]] = {}
+        self._sizes: List[int] = []
+
+        position = 0
+        while position < self._seat_count:
+            if self._is_free[position]:
+                run_end = position
+                while run_end + 1 < self._seat_count and self._is_free[run_end + 1]:
+                    run_end += 1
+                self._add_run(position, run_end)
+                position = run_end
+            position += 1
+
+    @classmethod
+    def from_seats(cls, seat_ids: Iterable[int], is_free: Iterable, min_group_size: int = 2) -> "SeatAvailabilityIndex":
+        """
+        Build the index of a seat map given as seat ids and free flags (1/True for free seats), in any order.
+
+        :param seat_ids: The seat ids, e.g. `df_seat_reservation["seat_id"]` of either engine.
+        :param is_free: The free flags, e.g. `df_seat_reservation["is_free"]`.
+        :param min_group_size: Groups with fewer free seats are left out of the histogram.
+        """
+        free_by_seat_id = dict(zip((int(seat_id) for seat_id in seat_ids), (bool(free) for free in is_free)))
+        if not free_by_seat_id:
+            return cls(0, [], min_group_size)
+
+        first_seat_id = min(free_by_seat_id)
+        return cls(first_seat_id,
+                   [free_by_seat_id.get(seat_id, False) for seat_id in range(first_seat_id, max(free_by_seat_id) + 1)],
+                   min_group_size)
+
+    def is_free(self, seat_id: int) -> bool:
+        return self._is_free[self._get_position(seat_id)]
+
+    def book(self, seat_id: int) -> None:
+        """
+        Mark a free seat as taken: its run is split into the free seats before and after it. O(log n).
+        """
+        position = self._get_position(seat_id)
+        if not self._is_free[position]:
+            return
+
+        run_start = self._find_previous_taken(position) + 1
+        run_end = self._find_next_taken(position) - 1
+
+        self._remove_run(run_start, run_end)
+        if run_start < position:
+            self._add_run(run_start, position - 1)
+        if position < run_end:
+            self._add_run(position + 1, run_end)
+
+        self._is_free[position] = False
+        self._update_taken_tree(position, 1)
+
+    def release(self, seat_id: int) -> None:
+        """
+        Mark a taken seat as free: it is merged with the runs ending right before and starting right after it. O(log n).
+        """
+        position = self._get_position(seat_id)
+        if self._is_free[position]:
+            return
+
+        run_start = run_end = position
+        if position - 1 in self._run_start_by_end:
+            run_start = self._run_start_by_end[position - 1]
+            self._remove_run(run_start, position - 1)
+        if position + 1 in self._run_end_by_start:
+            run_end = self._run_end_by_start[position + 1]
+            self._remove_run(position + 1, run_end)
+        self._add_run(run_start, run_end)
+
+        self._is_free[position] = True
+        self._update_taken_tree(position, -1)
+
+    def toggle(self, seat_id: int) -> None:
+        """
+        Book a free seat or release a taken one.
+        """
+        if self.is_free(seat_id):
+            self.book(seat_id)
+        else:
+            self.release(seat_id)
+
+    def get_histogram(self) -> Dict[int, int]:
+        """
+        Return the number of free seat groups by group size (groups of at least `min_group_size` seats).
+        """
+        return {size: self._histogram[size] for size in self._sizes if size >= self.min_group_size}
+
+    def find_adjacent_free_seats(self, k: int) -> Optional[List[int]]:
+        """
+        Find k adjacent free seats, taken from one of the smallest groups that is large enough (best fit),
+        so the large groups stay available for large parties. O(log n).
+
+        :param k: The number of adjacent seats.
+        :return: The seat ids, or None if there is no group of at least k free seats.
+        """
+        size_index = bisect_left(self._sizes, k)
+        if k < 1 or size_index == len(self._sizes):
+            return None
+
+        run_start = next(iter(self._run_starts_by_size[self._sizes[size_index]]))
+        return list(range(self.first_seat_id + run_start, self.first_seat_id + run_start + k))
+
+    def get_free_seat_groups(self) -> List[Tuple[int, int]]:
+        """
+        Return the (first_seat_id, group_size) of every group of at least `min_group_size` seats, sorted by seat.
+        """
+        return [(self.first_seat_id + run_start, run_end - run_start + 1)
+                for run_start, run_end in sorted(self._run_end_by_start.items())
+                if run_end - run_start + 1 >= self.min_group_size]
+
+    def _get_position(self, seat_id: int) -> int:
+        position = seat_id - self.first_seat_id
+        if not 0 <= position < self._seat_count:
+            raise KeyError(f"Seat {seat_id} is not part of the seat map")
+
+        return position
+
+    def _add_run(self, run_start: int, run_end: int) -> None:
+        size = run_end - run_start + 1
+        self._run_end_by_start[run_start] = run_end
+        self._run_start_by_end[run_end] = run_start
+
+        if size not in self._histogram:
+            self._histogram[size] = 0
+            self._run_starts_by_size[size] = set()
+            insort(self._sizes, size)
+        self._histogram[size] += 1
+        self._run_starts_by_size[size].add(run_start)
+
+    def _remove_run(self, run_start: int, run_end: int) -> None:
+        size = run_end - run_start + 1
+        del self._run_end_by_start[run_start]
+        del self._run_start_by_end[run_end]
+
+        self._histogram[size] -= 1
+        self._run_starts_by_size[size].discard(run_start)
+        if self._histogram[size] == 0:
+            del self._histogram[size]
+            del self._run_starts_by_size[size]
+            self._sizes.pop(bisect_left(self._sizes, size))
+
+    def _update_taken_tree(self, position: int, delta: int) -> None:
+        tree_position = position + 1
+        while tree_position <= self._seat_count:
+            self._taken_tree[tree_position] += delta
+            tree_position += tree_position & -tree_position
+
+    def _count_taken(self, position: int) -> int:
+        """
+        Count the taken seats at positions 0..position.
+        """
+        count = 0
+        tree_position = position + 1
+        while tree_position > 0:
+            count += self._taken_tree[tree_position]
+            tree_position -= tree_position & -tree_position
+
+        return count
+
+    def _find_nth_taken(self, n: int) -> int:
+        """
+        Return the position of the n-th (1-based) taken seat, `_seat_count` if there are fewer taken seats.
+        """
+        tree_position = 0
+        step = self._highest_power_of_two
+        while step:
+            if tree_position + step <= self._seat_count and self._taken_tree[tree_position + step] < n:
+                tree_position += step
+                n -= self._taken_tree[tree_position]
+            step >>= 1
+
+        return tree_position
+
+    def _find_previous_taken(self, position: int) -> int:
+        """
+        Return the position of the last taken seat before `position`, -1 if there is none.
+        """
+        taken_before = self._count_taken(position - 1) if position else 0
+        return self._find_nth_taken(taken_before) if taken_before else -1
+
+    def _find_next_taken(self, position: int) -> int:
+        """
+        Return the position of the first taken seat after `position`, `_seat_count` if there is none.
+        """
+        return self._find_nth_taken(self._count_taken(position) + 1)
+
+
+if __name__ == '__main__':
+    import importlib.util
+    import os
+    import random
+    import pandas as pd
+    import polars as pl
+
+    def load_module(engine: str):
+        path_to_module = os.path.join(os.path.dirname(os.path.abspath(__file__)), engine, 'free_seat_groups.py')
+        spec = importlib.util.spec_from_file_location(f'{engine}_free_seat_groups', path_to_module)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    pandas_free_seat_groups = load_module('pandas')
+    polars_free_seat_groups = load_module('polars')
+
+    seat_reservation_data = [
+        (1, 1), (2, 0), (3, 1), (4, 1), (5, 1),
+        (6, 0), (7, 1), (8, 1), (9, 0), (10, 1),
+        (11, 0), (12, 1), (13, 0), (14, 1), (15, 1),
+        (16, 1), (17, 1), (18, 1), (19, 0), (20, 1), (21, 1)
+    ]
+    df_seat_reservation = pd.DataFrame(seat_reservation_data, columns=["seat_id", "is_free"])
+
+    seat_index = SeatAvailabilityIndex.from_seats(df_seat_reservation["seat_id"], df_seat_reservation["is_free"])
+    print("Free seat groups by size:", seat_index.get_histogram())
+    print("4 adjacent free seats:", seat_index.find_adjacent_free_seats(4))
+
+    # Equivalence with the batch computation after every booking / release
+    random.seed(42)
+    seat_count = 500
+    df_seats = pd.DataFrame({"seat_id": range(1, seat_count + 1),
+                             "is_free": [random.randint(0, 1) for _ in range(seat_count)]})
+    seat_index = SeatAvailabilityIndex.from_seats(df_seats["seat_id"], df_seats["is_free"])
+
+    for _ in range(2000):
+        seat_id = random.randint(1, seat_count)
+        seat_index.toggle(seat_id)
+        df_seats.loc[df_seats["seat_id"] == seat_id, "is_free"] ^= 1
+
+        expected_groups = pandas_free_seat_groups.get_free_seat_groups(df_seats)
+        assert seat_index.get_free_seat_groups() == list(zip(expected_groups["first_seat_id"].tolist(),
+                                                             expected_groups["group_size"].tolist()))
+
+        df_expected_histogram = polars_free_seat_groups.count_free_seat_groups_by_size(pl.from_pandas(df_seats))
+        assert seat_index.get_histogram() == dict(df_expected_histogram.iter_rows())
+
+        k = random.randint(1, 8)
+        adjacent_seats = seat_index.find_adjacent_free_seats(k)
+        has_group = bool((expected_groups["group_size"] >= k).any()) or (k == 1 and bool(df_seats["is_free"].any()))
+        assert (adjacent_seats is not None) == has_group
+        assert adjacent_seats is None or all(seat_index.is_free(adjacent_seat) for adjacent_seat in adjacent_seats)
+
+    print("The incremental index matches the batch computation after 2000 bookings and releases.")
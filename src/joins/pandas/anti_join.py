@@ -0,0 +1,140 @@
+"""
+Anti join: the rows of a DataFrame whose key has no match in another DataFrame, e.g. the movies with no genres.
+
+Pandas has no anti join, the usual left join + `isnull` filter materializes the whole joined DataFrame only to throw
+most of it away. `anti_join` only computes a boolean mask over the keys of the left DataFrame, with one of these
+strategies:
+- `hash`: hash-set membership of the left keys in the right keys (`isin`),
+- `merge`: binary search of the left keys in the sorted right keys (`np.searchsorted`), no hash table is built,
+- `left_join`: the left join + `isnull` filter, kept for comparison,
+- `duckdb`: an `ANTI JOIN` of the keys and row positions in DuckDB.
+
+The `auto` strategy takes `merge` when the keys of both sides are already sorted (e.g. the movies and the movie-genre
+pairs, both sorted by `movie_id`), the binary searches then walk the right keys in order, and `hash` otherwise.
+The selected rows keep the order and the index of the left DataFrame. Missing keys are not supported.
+"""
+import time
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from typing import Optional, Sequence
+
+STRATEGIES = ('hash', 'merge', 'left_join', 'duckdb')
+
+
+def get_keys(df: pd.DataFrame, key: str) -> np.ndarray:
+    """
+    Return the values of a key column, or of an index level of the same name, as a NumPy array.
+    """
+    if key in df.columns:
+        return df[key].to_numpy()
+
+    return df.index.get_level_values(key).to_numpy()
+
+
+def choose_anti_join_strategy(left_keys: np.ndarray, right_keys: np.ndarray) -> str:
+    """
+    Choose the anti join strategy: `merge` if the keys of both sides are sorted (no sorting and no hash table needed),
+    `hash` otherwise.
+    """
+    if (len(right_keys) and pd.Index(right_keys).is_monotonic_increasing
+            and pd.Index(left_keys).is_monotonic_increasing):
+        return 'merge'
+
+    return 'hash'
+
+
+def anti_join(df_left: pd.DataFrame,
+              df_right: pd.DataFrame,
+              left_on: str,
+              right_on: Optional[str] = None,
+              strategy: str = 'auto') -> pd.DataFrame:
+    """
+    Return the rows of `df_left` whose key does not occur in `df_right`.
+
+    :param df_left: The DataFrame the rows are selected from.
+    :param df_right: The DataFrame holding the keys to exclude.
+    :param left_on: The key column (or index level) of `df_left`.
+    :param right_on: The key column (or index level) of `df_right`, defaults to `left_on`.
+    :param strategy: One of `STRATEGIES`, or `auto` to choose it from the keys (see `choose_anti_join_strategy`).
+    :return: The rows of `df_left` without a match, in their original order and with their index.
+
+    Examples:
+        >>> df_movies_with_no_genres = anti_join(df_movies, df_movie_genre, "movie_id")
+    """
+    right_on = right_on or left_on
+    left_keys, right_keys = get_keys(df_left, left_on), get_keys(df_right, right_on)
+
+    if strategy == 'auto':
+        strategy = choose_anti_join_strategy(left_keys, right_keys)
+
+    if strategy == 'hash':
+        return df_left[~pd.Series(left_keys).isin(right_keys).to_numpy()]
+
+    if strategy == 'merge':
+        if not pd.Index(right_keys).is_monotonic_increasing:
+            right_keys = np.sort(right_keys)
+        positions = np.searchsorted(right_keys, left_keys)
+        is_matched = right_keys[np.minimum(positions, len(right_keys) - 1)] == left_keys if len(right_keys) else False
+        return df_left[~((positions < len(right_keys)) & is_matched)]
+
+    if strategy == 'left_join':
+        df_right_keys = pd.DataFrame({right_on: right_keys, '_matched': True})
+        df_joined = pd.DataFrame({left_on: left_keys}).merge(df_right_keys.drop_duplicates(right_on),
+                                                             left_on=left_on, right_on=right_on, how='left')
+        return df_left[df_joined['_matched'].isnull().to_numpy()]
+
+    if strategy == 'duckdb':
+        import duckdb
+
+        connection = duckdb.connect()
+        connection.register('left_keys', pa.table({'position': np.arange(len(left_keys)), 'key': left_keys}))
+        connection.register('right_keys', pa.table({'key': right_keys}))
+        positions = connection.sql("SELECT l.position FROM left_keys l ANTI JOIN right_keys r ON l.key = r.key "
+                                   "ORDER BY l.position").fetchnumpy()['position']
+        return df_left.iloc[positions]
+
+    raise ValueError(f"Unsupported anti join strategy: {strategy}. Use 'auto' or one of {STRATEGIES}")
+
+
+def benchmark_anti_join_strategies(df_left: pd.DataFrame,
+                                   df_right: pd.DataFrame,
+                                   left_on: str,
+                                   right_on: Optional[str] = None,
+                                   strategies: Sequence[str] = STRATEGIES,
+                                   repetitions: int = 5) -> pd.DataFrame:
+    """
+    Time every strategy and check that they select the same rows as the `hash` strategy.
+
+    :return: One row per strategy with the best time in milliseconds, the number of rows selected and
+        whether the result equals the result of the `hash` strategy.
+    """
+    df_expected = anti_join(df_left, df_right, left_on, right_on, 'hash')
+
+    results = []
+    for strategy in strategies:
+        timings = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            df_result = anti_join(df_left, df_right, left_on, right_on, strategy)
+            timings.append(time.perf_counter() - start)
+
+        results.append({'strategy': strategy,
+                        'best_ms': round(min(timings) * 1000, 3),
+                        'rows': len(df_result),
+                        'same_result': df_result.equals(df_expected)})
+
+    return pd.DataFrame(results)
+
+
+if __name__ == '__main__':
+    import os
+    import sys
+
+    data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+    sys.path.insert(0, data_provider_path)
+    from movie_data_provider import MovieDataProviderForPandas
+
+    # Timings of the anti join strategies on the movies with no genres, all of them retrieve the same movies
+    dataframes = MovieDataProviderForPandas.load_all(["movies", "movie_genre"])
+    print(benchmark_anti_join_strategies(dataframes["movies"], dataframes["movie_genre"], 'movie_id'))
@@ -0,0 +1,101 @@
+"""
+Vectorized aggregation of the genres of the movies, without per-group or per-row Python callbacks.
+
+`groupby(...).agg({'genre_name': lambda x: list(x)})` followed by `.apply(lambda x: ', '.join(x))` calls a Python
+function for every movie. The `aggregate_genres_by_movie` function below produces the same result in a few
+vectorized steps:
+1. a stable sort of the rows by movie_id, which keeps the original order of the genres within a movie,
+2. the group offsets, i.e. the positions where the movie_id changes in the sorted key array,
+3. an Arrow list array built from the sorted genre names and the group offsets (no data is copied per group),
+4. the concatenated genres computed by Arrow's `binary_join` kernel.
+
+The generic `aggregate_to_lists` function applies the same steps to any group and string column
+(e.g. the cast of the movies or the filmography of the actors).
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Sequence, Optional
+
+
+def aggregate_genres_by_movie(df_combined: pd.DataFrame,
+                              separator: str = ', ',
+                              as_arrow_list: bool = False) -> pd.DataFrame:
+    """
+    Aggregate the joined movie-genre rows to one row per movie, with the genres as a list and as a string.
+
+    The result is identical to the one of the lambda based aggregation:
+
+    >>> df_aggregated = df_combined.groupby('movie_id').agg({'title': 'first', 'genre_name': lambda x: list(x)})
+    >>> df_aggregated['genres_concatenated'] = df_aggregated['genre_name'].apply(lambda x: ', '.join(x))
+
+    i.e. the movies are sorted by movie_id, the genres keep their order of appearance and missing genre names
+    are replaced by empty strings.
+
+    :param df_combined: The joined movies and genres, `movie_id` can be either a column or the index.
+    :param separator: Separator of the concatenated genres.
+    :param as_arrow_list: Return the `genre_name` lists as an Arrow backed `list<string>` column instead of
+        Python lists. It avoids creating a Python object for every genre name.
+    :return: One row per movie with the `movie_id`, `title`, `genre_name` (list) and `genres_concatenated` columns.
+    """
+    return aggregate_to_lists(df_combined,
+                              group_column='movie_id',
+                              list_column='genre_name',
+                              first_columns=('title',),
+                              concatenated_column='genres_concatenated',
+                              separator=separator,
+                              as_arrow_list=as_arrow_list)
+
+
+def aggregate_to_lists(df_combined: pd.DataFrame,
+                       group_column: str,
+                       list_column: str,
+                       first_columns: Sequence[str] = (),
+                       concatenated_column: Optional[str] = None,
+                       separator: str = ', ',
+                       as_arrow_list: bool = False) -> pd.DataFrame:
+    """
+    Aggregate the values of a string column to one list (and optionally one concatenated string) per group.
+
+    The groups are sorted by `group_column` and the values keep their order of appearance within a group.
+    Missing values are replaced by empty strings.
+
+    :param df_combined: The DataFrame to aggregate, `group_column` can be either a column or the index.
+    :param group_column: The column identifying a group.
+    :param list_column: The string column aggregated into a list.
+    :param first_columns: Columns for which the value of the first row of each group is kept.
+    :param concatenated_column: Name of the column holding the concatenated list, None to skip the concatenation.
+    :param separator: Separator of the concatenated list.
+    :param as_arrow_list: Return the list column as an Arrow backed `list<string>` column instead of Python lists.
+    :return: One row per group with the `group_column`, the `first_columns`, the `list_column` and the
+        `concatenated_column`.
+    """
+    if group_column not in df_combined.columns:
+        df_combined = df_combined.reset_index()
+
+    keys = df_combined[group_column].to_numpy()
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    # the first row of every group in the sorted arrays, followed by the total number of rows
+    group_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]) if len(sorted_keys) \
+        else np.empty(0, dtype=np.int64)
+    offsets = np.append(group_starts, len(sorted_keys))
+
+    values = pc.fill_null(pa.array(df_combined[list_column].take(order), type=pa.string(), from_pandas=True), '')
+    value_lists = pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), values)
+
+    df_aggregated = pd.DataFrame({group_column: sorted_keys[group_starts]})
+    for column in first_columns:
+        df_aggregated[column] = df_combined[column].take(order[group_starts]).reset_index(drop=True)
+
+    if as_arrow_list:
+        df_aggregated[list_column] = pd.Series(value_lists, dtype=pd.ArrowDtype(value_lists.type))
+    else:
+        df_aggregated[list_column] = pd.Series(value_lists.to_pylist(), dtype=object)
+
+    if concatenated_column:
+        df_aggregated[concatenated_column] = pc.binary_join(value_lists, separator).to_pandas()
+
+    return df_aggregated
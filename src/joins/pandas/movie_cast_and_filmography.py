@@ -0,0 +1,62 @@
+"""
+A list of movies and a list of actors are available in JSON files. The movie-actor pairs (the cast of the movies,
+with the name of the character and the order of the actor in the cast) are also provided as a JSON file.
+Write a Python script that reads the data into Pandas DataFrames with appropriate schemas and lists
+- the cast of every movie, in cast order,
+- the filmography of every actor, in order of release.
+
+Steps:
+1. Read the JSON files into Pandas DataFrames.
+2. Downcast the keys and the small integer columns to the narrowest integer type that can hold their values.
+   The movie-actor table is the largest table of the dataset, its keys are repeated for every cast member.
+3. Perform the many-to-many joins: movies - movie_actor - actors.
+4. Aggregate the actor names for each movie and the movie titles for each actor.
+"""
+import os
+import sys
+import pandas as pd
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPandas
+from genre_aggregation import aggregate_to_lists
+
+# The JSON files are parsed in parallel (see MovieDataProviderForPandas.load_all)
+dataframes = MovieDataProviderForPandas.load_all(["movies", "movie_actor", "actors"])
+df_movies, df_movie_actor, df_actors = dataframes["movies"], dataframes["movie_actor"], dataframes["actors"]
+
+memory_usage_before = df_movie_actor.memory_usage(deep=True).sum()
+
+# Only the columns needed by the pipeline are kept, the keys are downcast to the narrowest safe integer type
+# (pd.to_numeric picks int32 for the ids and int8/int16 for the gender and the cast order).
+df_movies = df_movies[['movie_id', 'title', 'release_date']].assign(
+    movie_id=lambda df: pd.to_numeric(df['movie_id'], downcast='integer'))
+df_actors = df_actors.assign(person_id=lambda df: pd.to_numeric(df['person_id'], downcast='integer'))
+df_movie_actor = df_movie_actor.assign(**{
+    column: pd.to_numeric(df_movie_actor[column], downcast='integer')
+    for column in ['movie_id', 'person_id', 'gender_id', 'cast_order']
+})
+
+print(f"Memory usage of the movie-actor pairs: {memory_usage_before:,} bytes "
+      f"-> {df_movie_actor.memory_usage(deep=True).sum():,} bytes after downcasting the keys")
+
+# Join the cast with the movies and the actors (many-to-many between movies and actors)
+df_cast = (df_movie_actor
+           .merge(df_movies, on='movie_id', how='inner')
+           .merge(df_actors, on='person_id', how='inner'))
+
+# Cast of every movie in cast order
+df_movie_cast = aggregate_to_lists(df_cast.sort_values(['movie_id', 'cast_order']),
+                                   group_column='movie_id',
+                                   list_column='person_name',
+                                   first_columns=('title',),
+                                   concatenated_column='cast_concatenated').rename(columns={'person_name': 'cast'})
+print(df_movie_cast)
+
+# Filmography of every actor in order of release
+df_filmography = aggregate_to_lists(df_cast.sort_values(['person_id', 'release_date']),
+                                    group_column='person_id',
+                                    list_column='title',
+                                    first_columns=('person_name',)).rename(columns={'title': 'filmography'})
+df_filmography['number_of_movies'] = df_filmography['filmography'].str.len()
+print(df_filmography.sort_values(['number_of_movies', 'person_id'], ascending=[False, True]))
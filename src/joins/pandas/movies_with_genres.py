@@ -13,46 +13,38 @@ a concatenated string as well.
 """
 import os
 import sys
-import pandas as pd
 
 data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
 sys.path.insert(0, data_provider_path)
 from movie_data_provider import MovieDataProviderForPandas
-
-df_movies = (
-    MovieDataProviderForPandas.load_json_as_dataframe(json_file_name="movies.json",
-                                                      schema_provider=MovieDataProviderForPandas.get_movies_schema,
-                                                      index_column="movie_id"))
-
-df_movie_genre = (
-    MovieDataProviderForPandas.load_json_as_dataframe(json_file_name="movie_genre.json",
-                                                      schema_provider=MovieDataProviderForPandas.get_movie_genre_schema))
-
-df_genres = (
-    MovieDataProviderForPandas.load_json_as_dataframe(json_file_name="genres.json",
-                                                      schema_provider=MovieDataProviderForPandas.get_genres_schema))
-
-# Join dataframes to combine movies with their respective genres
-df_combined = df_movies.join(df_movie_genre.set_index('movie_id'), on='movie_id', how="inner").join(
+from genre_aggregation import aggregate_genres_by_movie
+from sorted_join import merge_join
+
+# The JSON files are parsed in parallel (see MovieDataProviderForPandas.load_all), the movies and the movie-genre
+# pairs are loaded sorted by movie_id: the sorted copy of the movies is cached, so they are sorted only once
+dataframes = MovieDataProviderForPandas.load_all(["movies", "movie_genre", "genres"],
+                                                 index_columns={"movies": "movie_id"},
+                                                 sorted_by="movie_id")
+df_movies, df_movie_genre, df_genres = dataframes["movies"], dataframes["movie_genre"], dataframes["genres"]
+
+# Join dataframes to combine movies with their respective genres.
+# Both sides are sorted by movie_id, so the first join is a merge join (see sorted_join.py), no hash table is built
+df_combined = merge_join(df_movies, df_movie_genre, 'movie_id').join(
     df_genres.set_index('genre_id'), on='genre_id', how="inner")
 
 # Aggregate the dataframe from the previous step.
-# select the first title from each group and
-# apply a lambda function to create a list of genre names from each group
-df_aggregated = df_combined.groupby('movie_id').agg({
-    'title': 'first',
-    'genre_name': lambda x: list(x),
-}).reset_index()
-
-df_aggregated['genre_name'] = df_aggregated['genre_name'].apply(
-    lambda genres: [str(genre) if not pd.isnull(genre) else '' for genre in genres]
-)
-
-# Concatenate genres into a single string
-df_aggregated['genres_concatenated'] = df_aggregated['genre_name'].apply(lambda x: ', '.join(x))
+# select the first title from each group, create a list of genre names from each group
+# and concatenate the genres into a single string.
+# The aggregation is vectorized (see genre_aggregation.py), it gives the same result as the lambda based solution:
+#
+# df_aggregated = df_combined.groupby('movie_id').agg({
+#     'title': 'first',
+#     'genre_name': lambda x: list(x),
+# }).reset_index()
+# df_aggregated['genre_name'] = df_aggregated['genre_name'].apply(
+#     lambda genres: [str(genre) if not pd.isnull(genre) else '' for genre in genres]
+# )
+# df_aggregated['genres_concatenated'] = df_aggregated['genre_name'].apply(lambda x: ', '.join(x))
+df_aggregated = aggregate_genres_by_movie(df_combined)
 
 print(df_aggregated)
-
-# if you want to have the genres as a concatenated string instead of a list see manipulation below
-# df_aggregated['genres_concatenated'] = df_aggregated['genre_name'].apply(lambda x: ', '.join(x))
-# print(df_aggregated)
@@ -12,15 +12,11 @@ import pandas as pd
 data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
 sys.path.insert(0, data_provider_path)
 from movie_data_provider import MovieDataProviderForPandas
+from anti_join import anti_join, choose_anti_join_strategy, get_keys
 
-df_movies = (
-    MovieDataProviderForPandas.load_json_as_dataframe(json_file_name="movies.json",
-                                                      schema_provider=MovieDataProviderForPandas.get_movies_schema,
-                                                      index_column="movie_id"))
-
-df_movie_genre = (
-    MovieDataProviderForPandas.load_json_as_dataframe(json_file_name="movie_genre.json",
-                                                      schema_provider=MovieDataProviderForPandas.get_movie_genre_schema))
+# The JSON files are parsed in parallel (see MovieDataProviderForPandas.load_all)
+dataframes = MovieDataProviderForPandas.load_all(["movies", "movie_genre"], index_columns={"movies": "movie_id"})
+df_movies, df_movie_genre = dataframes["movies"], dataframes["movie_genre"]
 
 df_movies['release_date'] = pd.to_datetime(df_movies['release_date'], format="%Y-%m-%d").dt.date
 
@@ -34,10 +30,18 @@ df_movies_with_no_genres_1 = df_movies[~df_movies.index.isin(df_movie_genre['mov
 merged_df = df_movies.join(df_movie_genre.set_index('movie_id'), on='movie_id', how='left')
 df_movies_with_no_genres_2 = merged_df[merged_df['genre_id'].isnull()]
 
+# Solution 3:
+# Anti join (see anti_join.py): only a boolean mask over the movie ids is computed, with the strategy chosen
+# from the keys: a binary search when both sides are sorted by movie_id, a hash set membership otherwise
+strategy = choose_anti_join_strategy(get_keys(df_movies, 'movie_id'), get_keys(df_movie_genre, 'movie_id'))
+df_movies_with_no_genres_3 = anti_join(df_movies, df_movie_genre, 'movie_id')
+
 print(f"Solution 1: shape {df_movies_with_no_genres_1.shape} {df_movies_with_no_genres_1}")
 print(f"Solution 2: shape {df_movies_with_no_genres_2.shape} {df_movies_with_no_genres_2}")
+print(f"Solution 3 ({strategy}): shape {df_movies_with_no_genres_3.shape} {df_movies_with_no_genres_3}")
 
-same_movies_retrieved = set(df_movies_with_no_genres_1.index) == set(df_movies_with_no_genres_2.index)
+same_movies_retrieved = (set(df_movies_with_no_genres_1.index) == set(df_movies_with_no_genres_2.index)
+                         and df_movies_with_no_genres_3.equals(df_movies_with_no_genres_1))
 
 # Output the result
 print(f"Do the solutions retrieve the same movies? {same_movies_retrieved}")
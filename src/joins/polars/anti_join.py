@@ -0,0 +1,131 @@
+"""
+Anti join: the rows of a DataFrame whose key has no match in another DataFrame, e.g. the movies with no genres.
+
+`anti_join` selects the rows with one of these strategies:
+- `native`: the anti join of Polars (`join(how="anti")`), a parallel hash join that never materializes joined rows,
+- `hash`: hash-set membership of the left keys in the (unique) right keys (`is_in`),
+- `merge`: binary search of the left keys in the sorted right keys (`search_sorted`), no hash table is built,
+- `duckdb`: an `ANTI JOIN` of the keys and row positions in DuckDB.
+
+The `auto` strategy takes `merge` when the keys of both sides are already sorted, `hash` when the right side has few
+distinct keys (estimated with `approx_n_unique`, the hash set is then small) and `native` otherwise.
+The selected rows keep the order of the left DataFrame. Null keys never match, as in the native anti join.
+"""
+import time
+import numpy as np
+import polars as pl
+from typing import Optional, Sequence
+
+STRATEGIES = ('native', 'hash', 'merge', 'duckdb')
+
+# Right sides with at most this many distinct keys are probed through a hash set (`is_in`)
+HASH_SET_MAX_KEYS = 1 << 16
+
+
+def choose_anti_join_strategy(left_keys: pl.Series, right_keys: pl.Series) -> str:
+    """
+    Choose the anti join strategy from the sortedness of the keys and the cardinality of the right keys.
+    """
+    if right_keys.len() and right_keys.null_count() == 0 and right_keys.is_sorted() and left_keys.is_sorted():
+        return 'merge'
+    if right_keys.approx_n_unique() <= HASH_SET_MAX_KEYS:
+        return 'hash'
+
+    return 'native'
+
+
+def anti_join(df_left: pl.DataFrame,
+              df_right: pl.DataFrame,
+              left_on: str,
+              right_on: Optional[str] = None,
+              strategy: str = 'auto') -> pl.DataFrame:
+    """
+    Return the rows of `df_left` whose key does not occur in `df_right`.
+
+    :param df_left: The DataFrame the rows are selected from.
+    :param df_right: The DataFrame holding the keys to exclude.
+    :param left_on: The key column of `df_left`.
+    :param right_on: The key column of `df_right`, defaults to `left_on`.
+    :param strategy: One of `STRATEGIES`, or `auto` to choose it from the keys (see `choose_anti_join_strategy`).
+    :return: The rows of `df_left` without a match, in their original order.
+
+    Examples:
+        >>> df_movies_with_no_genres = anti_join(df_movies, df_movie_genre, "movie_id")
+    """
+    right_on = right_on or left_on
+    left_keys, right_keys = df_left[left_on], df_right[right_on]
+
+    if strategy == 'auto':
+        strategy = choose_anti_join_strategy(left_keys, right_keys)
+
+    if strategy == 'native':
+        return df_left.join(df_right.select(right_on), left_on=left_on, right_on=right_on, how='anti',
+                            maintain_order='left')
+
+    if strategy == 'hash':
+        return df_left.filter(~pl.col(left_on).is_in(right_keys.drop_nulls().unique().implode()).fill_null(False))
+
+    if strategy == 'merge':
+        right_keys = right_keys.drop_nulls()
+        if not right_keys.is_sorted():
+            right_keys = right_keys.sort()
+        if right_keys.is_empty():
+            return df_left
+        positions = right_keys.search_sorted(left_keys).clip(upper_bound=right_keys.len() - 1)
+        return df_left.filter(~(right_keys.gather(positions) == left_keys).fill_null(False))
+
+    if strategy == 'duckdb':
+        import duckdb
+
+        connection = duckdb.connect()
+        connection.register('left_keys', pl.DataFrame({'position': np.arange(left_keys.len()),
+                                                       'key': left_keys}).to_arrow())
+        connection.register('right_keys', pl.DataFrame({'key': right_keys}).to_arrow())
+        positions = connection.sql("SELECT l.position FROM left_keys l ANTI JOIN right_keys r ON l.key = r.key "
+                                   "ORDER BY l.position").fetchnumpy()['position']
+        return df_left[positions]
+
+    raise ValueError(f"Unsupported anti join strategy: {strategy}. Use 'auto' or one of {STRATEGIES}")
+
+
+def benchmark_anti_join_strategies(df_left: pl.DataFrame,
+                                   df_right: pl.DataFrame,
+                                   left_on: str,
+                                   right_on: Optional[str] = None,
+                                   strategies: Sequence[str] = STRATEGIES,
+                                   repetitions: int = 5) -> pl.DataFrame:
+    """
+    Time every strategy and check that they select the same rows as the `native` strategy.
+
+    :return: One row per strategy with the best time in milliseconds, the number of rows selected and
+        whether the result equals the result of the `native` strategy.
+    """
+    df_expected = anti_join(df_left, df_right, left_on, right_on, 'native')
+
+    results = []
+    for strategy in strategies:
+        timings = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            df_result = anti_join(df_left, df_right, left_on, right_on, strategy)
+            timings.append(time.perf_counter() - start)
+
+        results.append({'strategy': strategy,
+                        'best_ms': round(min(timings) * 1000, 3),
+                        'rows': df_result.height,
+                        'same_result': df_result.equals(df_expected)})
+
+    return pl.DataFrame(results)
+
+
+if __name__ == '__main__':
+    import os
+    import sys
+
+    data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+    sys.path.insert(0, data_provider_path)
+    from movie_data_provider import MovieDataProviderForPolars
+
+    # Timings of the anti join strategies on the movies with no genres, all of them retrieve the same movies
+    dataframes = MovieDataProviderForPolars.load_all(["movies", "movie_genre"])
+    print(benchmark_anti_join_strategies(dataframes["movies"], dataframes["movie_genre"], 'movie_id'))
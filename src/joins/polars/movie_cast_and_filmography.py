@@ -0,0 +1,59 @@
+"""
+A list of movies and a list of actors are available in JSON files. The movie-actor pairs (the cast of the movies,
+with the name of the character and the order of the actor in the cast) are also provided as a JSON file.
+Write a Python script that reads the data into Polars DataFrames with appropriate schemas and lists
+- the cast of every movie, in cast order,
+- the filmography of every actor, in order of release.
+
+Steps:
+1. Read the JSON files into Polars DataFrames (only the columns needed by the pipeline).
+2. Downcast the keys and the small integer columns to the narrowest integer type that can hold their values.
+   The movie-actor table is the largest table of the dataset, its keys are repeated for every cast member.
+3. Perform the many-to-many joins: movies - movie_actor - actors.
+4. Aggregate the actor names for each movie and the movie titles for each actor.
+"""
+import os
+import sys
+import polars as pl
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+
+# The scans only read the listed columns, e.g. the wide text columns of the movies are never loaded
+df_movies = MovieDataProviderForPolars.scan_movies().select('movie_id', 'title', 'release_date').collect()
+df_movie_actor = MovieDataProviderForPolars.scan_movie_actor().collect()
+df_actors = MovieDataProviderForPolars.scan_actors().collect()
+
+memory_usage_before = df_movie_actor.estimated_size()
+
+# shrink_dtype picks the narrowest integer type that can hold the values of the column
+# (Int32 for the ids and Int8/Int16 for the gender and the cast order)
+df_movies = df_movies.with_columns(df_movies['movie_id'].shrink_dtype())
+df_actors = df_actors.with_columns(df_actors['person_id'].shrink_dtype())
+df_movie_actor = df_movie_actor.with_columns(
+    [df_movie_actor[column].shrink_dtype() for column in ['movie_id', 'person_id', 'gender_id', 'cast_order']])
+
+print(f"Memory usage of the movie-actor pairs: {memory_usage_before:,} bytes "
+      f"-> {df_movie_actor.estimated_size():,} bytes after downcasting the keys")
+
+# Join the cast with the movies and the actors (many-to-many between movies and actors)
+df_cast = (df_movie_actor
+           .join(df_movies, on='movie_id', how='inner')
+           .join(df_actors, on='person_id', how='inner'))
+
+# Cast of every movie in cast order
+df_movie_cast = (df_cast
+                 .group_by('movie_id', 'title')
+                 .agg(cast=pl.col('person_name').sort_by('cast_order'))
+                 .with_columns(cast_concatenated=pl.col('cast').list.join(', '))
+                 .sort('movie_id'))
+print(df_movie_cast)
+
+# Filmography of every actor in order of release
+df_filmography = (df_cast
+                  .group_by('person_id', 'person_name')
+                  .agg(filmography=pl.col('title').sort_by('release_date'))
+                  .with_columns(number_of_movies=pl.col('filmography').list.len())
+                  .sort('number_of_movies', 'person_id', descending=[True, False]))
+print(df_filmography)
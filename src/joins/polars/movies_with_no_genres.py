@@ -0,0 +1,48 @@
+"""
+A list of movies released is available in a JSON file.
+Additionally,  a list of genres and movie-genre pairs are also provided as JSON files.
+Find the movies with no genres associated with them.
+The detailed schema of the data can be found in the <repo root folder>/src/movie_data_provider.py file.
+"""
+
+import os
+import sys
+import polars as pl
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+from anti_join import anti_join, choose_anti_join_strategy
+
+lf_movies = MovieDataProviderForPolars.scan_movies()
+lf_movie_genre = MovieDataProviderForPolars.scan_movie_genre()
+
+# Solution 1:
+# Native anti join: keeps the movies having no movie_id match in the movie-genre pairs,
+# without materializing the joined rows
+df_movies_with_no_genres_1 = lf_movies.join(lf_movie_genre, on='movie_id', how='anti', maintain_order='left').collect()
+
+# Solution 2:
+# Join the two dataframes and find the rows where the genre_id is missing
+df_movies_with_no_genres_2 = (lf_movies
+                              .join(lf_movie_genre, on='movie_id', how='left', maintain_order='left')
+                              .filter(pl.col('genre_id').is_null())
+                              .drop('genre_id')
+                              .collect())
+
+# Solution 3:
+# Anti join (see anti_join.py) with the strategy chosen from the keys: a binary search when both sides are sorted
+# by movie_id, a hash set membership when there are few genre pairs, the native anti join otherwise
+df_movies, df_movie_genre = lf_movies.collect(), lf_movie_genre.collect()
+strategy = choose_anti_join_strategy(df_movies['movie_id'], df_movie_genre['movie_id'])
+df_movies_with_no_genres_3 = anti_join(df_movies, df_movie_genre, 'movie_id')
+
+print(f"Solution 1: shape {df_movies_with_no_genres_1.shape} {df_movies_with_no_genres_1}")
+print(f"Solution 2: shape {df_movies_with_no_genres_2.shape} {df_movies_with_no_genres_2}")
+print(f"Solution 3 ({strategy}): shape {df_movies_with_no_genres_3.shape} {df_movies_with_no_genres_3}")
+
+same_movies_retrieved = (df_movies_with_no_genres_1.equals(df_movies_with_no_genres_2)
+                         and df_movies_with_no_genres_1.equals(df_movies_with_no_genres_3))
+
+# Output the result
+print(f"Do the solutions retrieve the same movies? {same_movies_retrieved}")
@@ -0,0 +1,139 @@
+"""
+Merge join of DataFrames sorted by their join key, e.g. the movies and the movie-genre pairs loaded with
+`sorted_by="movie_id"` (see `MovieDataProviderForPolars.load_json_as_dataframe`).
+
+The joins of Polars build a hash table of the keys of one side, unless both key columns carry the sorted flag:
+the join then walks the two sorted key columns side by side (a sort-merge join), without any hash table.
+The flag is only set by Polars for the columns it sorted itself, or by `set_sorted`. The provider sets it on the
+sorted key columns (recorded in the metadata of the cache file), `merge_join` sets it on the keys it verifies
+as sorted, so DataFrames loaded in key order take the merge path.
+
+The `auto` strategy takes `merge` when both keys are sorted and `hash` otherwise. Both give the same rows in the
+order of the left DataFrame.
+"""
+import time
+import polars as pl
+from typing import Sequence
+
+STRATEGIES = ('hash', 'merge')
+
+
+def is_sorted_by(df: pl.DataFrame, key: str) -> bool:
+    """
+    Whether a DataFrame is sorted by a key column, without missing values. Free for a column with the sorted flag.
+    """
+    return df[key].null_count() == 0 and df[key].is_sorted()
+
+
+def with_sorted_flag(df: pl.DataFrame, key: str, is_sorted: bool) -> pl.DataFrame:
+    """
+    Return the DataFrame with the sorted flag of the key column set (is_sorted) or cleared (not is_sorted).
+    """
+    if df[key].flags['SORTED_ASC'] == is_sorted:
+        return df
+    if is_sorted:
+        return df.with_columns(pl.col(key).set_sorted())
+
+    # A column built from the Arrow array of the values has no flags (the nulls and the dtype are kept)
+    return df.with_columns(pl.from_arrow(df[key].to_arrow()).alias(key))
+
+
+def choose_join_strategy(df_left: pl.DataFrame, df_right: pl.DataFrame, on: str) -> str:
+    """
+    Choose the join strategy: `merge` if both sides are sorted by the key, `hash` otherwise.
+    """
+    if is_sorted_by(df_left, on) and is_sorted_by(df_right, on):
+        return 'merge'
+
+    return 'hash'
+
+
+def merge_join(df_left: pl.DataFrame,
+               df_right: pl.DataFrame,
+               on: str,
+               how: str = 'inner',
+               strategy: str = 'auto',
+               suffix: str = '_right') -> pl.DataFrame:
+    """
+    Join two DataFrames on a key column, like `df_left.join(df_right, on=on, how=how, maintain_order="left")`.
+
+    :param df_left: The left DataFrame.
+    :param df_right: The right DataFrame.
+    :param on: The key column of both DataFrames.
+    :param how: `inner` or `left`.
+    :param strategy: One of `STRATEGIES`, or `auto` to choose it from the sortedness of the keys. `merge` requires
+        both sides to be sorted by the key, `hash` clears the sorted flags (e.g. for comparing the two).
+    :param suffix: The suffix of the other right columns found on both sides.
+    :return: The joined DataFrame, in the order of the left DataFrame.
+
+    Examples:
+        >>> df_movies = MovieDataProviderForPolars.load_json_as_dataframe(
+        ...     "movies.json", MovieDataProviderForPolars.get_movies_schema, sorted_by="movie_id")
+        >>> df_movie_genre = MovieDataProviderForPolars.load_json_as_dataframe(
+        ...     "movie_genre.json", MovieDataProviderForPolars.get_movie_genre_schema, sorted_by="movie_id")
+        >>> df_combined = merge_join(df_movies, df_movie_genre, "movie_id")
+    """
+    if how not in ('inner', 'left'):
+        raise ValueError(f"Unsupported join type: {how}. Use 'inner' or 'left'")
+
+    if strategy == 'auto':
+        strategy = choose_join_strategy(df_left, df_right, on)
+
+    if strategy == 'merge':
+        if not (is_sorted_by(df_left, on) and is_sorted_by(df_right, on)):
+            raise ValueError(f"The merge join requires both DataFrames to be sorted by {on}")
+    elif strategy != 'hash':
+        raise ValueError(f"Unsupported join strategy: {strategy}. Use 'auto' or one of {STRATEGIES}")
+
+    return with_sorted_flag(df_left, on, strategy == 'merge').join(
+        with_sorted_flag(df_right, on, strategy == 'merge'),
+        on=on, how=how, suffix=suffix, maintain_order='left')
+
+
+def benchmark_join_strategies(df_left: pl.DataFrame,
+                              df_right: pl.DataFrame,
+                              on: str,
+                              how: str = 'inner',
+                              strategies: Sequence[str] = STRATEGIES,
+                              repetitions: int = 5) -> pl.DataFrame:
+    """
+    Time every strategy and check that they give the same result as the `hash` strategy.
+
+    The sorted flags are set or cleared before timing, so only the joins are timed.
+
+    :return: One row per strategy with the best time in milliseconds, the number of rows joined and
+        whether the result equals the result of the `hash` strategy.
+    """
+    df_expected = merge_join(df_left, df_right, on, how, 'hash')
+
+    results = []
+    for strategy in strategies:
+        df_flagged_left = with_sorted_flag(df_left, on, strategy == 'merge')
+        df_flagged_right = with_sorted_flag(df_right, on, strategy == 'merge')
+        timings = []
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            df_result = merge_join(df_flagged_left, df_flagged_right, on, how, strategy)
+            timings.append(time.perf_counter() - start)
+
+        results.append({'strategy': strategy,
+                        'best_ms': round(min(timings) * 1000, 3),
+                        'rows': df_result.height,
+                        'same_result': df_result.equals(df_expected)})
+
+    return pl.DataFrame(results)
+
+
+if __name__ == '__main__':
+    import os
+    import sys
+
+    data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+    sys.path.insert(0, data_provider_path)
+    from movie_data_provider import MovieDataProviderForPolars
+
+    # Timings of the hash join and of the merge join of the movies and movie-genre pairs sorted by movie_id
+    # (the movie_id columns get the sorted flag when loaded)
+    dataframes = MovieDataProviderForPolars.load_all(["movies", "movie_genre"], sorted_by="movie_id")
+    print(benchmark_join_strategies(dataframes["movies"].select('movie_id', 'title'), dataframes["movie_genre"],
+                                    'movie_id'))
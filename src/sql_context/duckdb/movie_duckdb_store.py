@@ -0,0 +1,144 @@
+"""
+A persistent DuckDB store of the movie tables.
+
+The JSON files are ingested once into a local DuckDB database file (`movies.duckdb` in the data directory):
+- with proper types, e.g. `release_date` is a DATE, so `YEAR(release_date)` needs no string parsing,
+- sorted by their keys, so the min/max statistics (zonemaps) DuckDB keeps for every row group skip the row groups
+  not holding the requested keys, and with an (ART) index on the keys for point lookups.
+
+A table is ingested again only when its JSON file changed (path, size and modification time are stored along with
+the tables), so later runs query the database right away, without parsing JSON or converting DataFrames.
+The results are returned as Arrow tables, or as pandas / Polars DataFrames built from them.
+"""
+import os
+import sys
+import duckdb
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+from typing import Any, Dict, Optional, Sequence, Union
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+
+# The columns of every table, the first ones sort the table and are indexed
+TABLE_KEYS = {
+    "movies": ["movie_id"],
+    "genres": ["genre_id"],
+    "movie_genre": ["movie_id", "genre_id"],
+    "actors": ["person_id"],
+    "movie_actor": ["movie_id", "person_id"],
+}
+
+# Column types differing from the types of the loaded DataFrames
+COLUMN_TYPES = {
+    "movies": {"release_date": "DATE"},
+}
+
+
+class MovieDuckDBStore:
+    """
+    The movie tables in a DuckDB database file, ingested from the JSON files when they are new or changed.
+
+    Examples:
+        >>> with MovieDuckDBStore() as store:
+        ...     df_per_year = store.query("SELECT YEAR(release_date) AS release_year, COUNT(*) AS number_of_movies "
+        ...                               "FROM movies GROUP BY release_year HAVING COUNT(*) > $min_count",
+        ...                               {"min_count": 30}, engine="pandas")
+    """
+
+    def __init__(self, path_to_database: Optional[str] = None, tables: Sequence[str] = tuple(TABLE_KEYS)):
+        """
+        :param path_to_database: The DuckDB database file, `movies.duckdb` in the data directory by default.
+        :param tables: The tables to ingest, keys of `MovieDataProviderForPolars.TABLE_FILES`.
+        """
+        self.path_to_database = path_to_database or MovieDataProviderForPolars.get_data_file_path("movies.duckdb")
+        self.tables = list(tables)
+        self.connection = duckdb.connect(self.path_to_database)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                table_name VARCHAR PRIMARY KEY, path VARCHAR, size BIGINT, mtime_ns BIGINT
+            )""")
+        self.ingest()
+
+    def ingest(self, force: bool = False) -> Dict[str, bool]:
+        """
+        Ingest the tables whose JSON file is new or changed since the last ingestion.
+
+        :param force: Ingest all the tables again.
+        :return: Whether each table was ingested.
+        """
+        ingested = {}
+        for table in self.tables:
+            path_to_json_file = MovieDataProviderForPolars.get_data_file_path(
+                MovieDataProviderForPolars.TABLE_FILES[table])
+            stat = os.stat(path_to_json_file)
+            fingerprint = (path_to_json_file, stat.st_size, stat.st_mtime_ns)
+
+            stored_fingerprint = self.connection.execute(
+                "SELECT path, size, mtime_ns FROM ingested_files WHERE table_name = ?", [table]).fetchone()
+            ingested[table] = force or stored_fingerprint != fingerprint
+            if ingested[table]:
+                self._ingest_table(table, fingerprint)
+
+        return ingested
+
+    def query(self,
+              sql: str,
+              parameters: Optional[Union[Sequence[Any], Dict[str, Any]]] = None,
+              engine: str = 'polars') -> Union[pa.Table, pd.DataFrame, pl.DataFrame]:
+        """
+        Run a SQL query on the stored tables.
+
+        :param sql: The SQL query, with `?` or `$name` placeholders for the parameters.
+        :param parameters: The parameter values, a list for `?` and a dictionary for `$name` placeholders.
+        :param engine: The type of the result: `arrow`, `pandas` (with `pd.ArrowDtype` columns) or `polars`.
+        :return: The result, transferred from DuckDB as an Arrow table.
+        """
+        table = self.connection.execute(sql, parameters).to_arrow_table()
+
+        if engine == 'arrow':
+            return table
+        if engine == 'pandas':
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        if engine == 'polars':
+            return pl.from_arrow(table)
+
+        raise ValueError(f"Unsupported engine: {engine}. Use 'arrow', 'pandas' or 'polars'.")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "MovieDuckDBStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _ingest_table(self, table: str, fingerprint: tuple) -> None:
+        df = MovieDataProviderForPolars.load_json_as_dataframe(
+            MovieDataProviderForPolars.TABLE_FILES[table],
+            getattr(MovieDataProviderForPolars, f"get_{table}_schema"),
+            use_registry=False)
+        keys = TABLE_KEYS.get(table, [])
+        column_types = COLUMN_TYPES.get(table, {})
+        columns = ", ".join(f"TRY_CAST({column} AS {column_types[column]}) AS {column}" if column in column_types
+                            else column for column in df.columns)
+
+        self.connection.register("ingested_frame", df.to_arrow())
+        try:
+            self.connection.execute("BEGIN TRANSACTION")
+            self.connection.execute(f"""
+                CREATE OR REPLACE TABLE {table} AS
+                SELECT {columns} FROM ingested_frame {f"ORDER BY {', '.join(keys)}" if keys else ""}""")
+            if keys:
+                self.connection.execute(f"CREATE INDEX {table}_keys ON {table} ({', '.join(keys)})")
+            self.connection.execute("INSERT OR REPLACE INTO ingested_files VALUES (?, ?, ?, ?)",
+                                    [table, *fingerprint])
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        finally:
+            self.connection.unregister("ingested_frame")
@@ -0,0 +1,58 @@
+"""
+Running the analytic queries of the movie dataset on the persistent DuckDB store.
+
+The first run ingests the JSON files into `movies.duckdb` (see `movie_duckdb_store.py`), the following runs query
+the database directly: no JSON parsing and no DataFrame conversion before the query. The results are returned
+as pandas or Polars DataFrames through Arrow.
+
+Docs: https://duckdb.org/docs/api/python/overview
+"""
+import time
+from movie_duckdb_store import MovieDuckDBStore
+
+QUERIES = {
+    "release year histogram": ("""
+        SELECT 
+            YEAR(release_date) AS release_year, COUNT(*) AS number_of_movies
+        FROM 
+            movies
+        GROUP BY 
+            release_year
+        HAVING COUNT(*) > $min_number_of_movies
+        ORDER BY COUNT(*) DESC
+        """, {"min_number_of_movies": 30}),
+    "movies with no genres": ("""
+        SELECT
+            m.movie_id, m.title, m.release_date
+        FROM
+            movies m
+        ANTI JOIN movie_genre mg ON m.movie_id = mg.movie_id
+        ORDER BY
+            m.release_date
+        """, None),
+    "genre counts": ("""
+        SELECT
+            g.genre_name, COUNT(*) AS number_of_movies
+        FROM
+            movie_genre mg
+        JOIN genres g ON mg.genre_id = g.genre_id
+        GROUP BY
+            g.genre_name
+        ORDER BY
+            number_of_movies DESC
+        """, None),
+}
+
+start = time.perf_counter()
+store = MovieDuckDBStore()
+print(f"Opening the store (ingesting the new or changed JSON files): {(time.perf_counter() - start) * 1000:.1f} ms")
+
+with store:
+    for name, (query, parameters) in QUERIES.items():
+        print(store.query(query, parameters, engine="pandas"))
+        print(store.query(query, parameters, engine="polars"))
+
+        start = time.perf_counter()
+        for _ in range(20):
+            store.query(query, parameters, engine="polars")
+        print(f"Repeated query ({name}): {(time.perf_counter() - start) * 1000 / 20:.2f} ms per call")
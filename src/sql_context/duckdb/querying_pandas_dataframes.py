@@ -40,5 +40,5 @@ query = """
         ORDER BY COUNT(*) DESC    
         """
 
-df_movie_stats = duckdb.sql(query).df(index=False)
+df_movie_stats = duckdb.sql(query).df()
 print(df_movie_stats)
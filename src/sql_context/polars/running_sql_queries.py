@@ -1,33 +1,14 @@
 """
 Running SQL queries directly on Polars dataframes
-"""
-import os
-import sys
-import polars as pl
-
-data_provider_path = os.path.abspath(
-    os.path.join(os.getcwd(), "../../", "data_providers")
-)
-sys.path.insert(0, data_provider_path)
-
-movies_parquet_file_path = os.path.abspath(
-    os.path.join(data_provider_path, "../data", "movies.parquet")
-)
-
-df_movies = pl.read_parquet(movies_parquet_file_path)
 
-movie_genre_parquet_file_path = os.path.abspath(
-    os.path.join(data_provider_path, "../data", "movie_genre.parquet")
-)
-
-df_movie_genre = pl.read_parquet(movie_genre_parquet_file_path)
+The tables are registered once in the SQL context of `SQLQueryService`, as LazyFrames scanning the data files.
+Repeated queries reuse the cached result, as long as the data files are unchanged.
+"""
+from sql_query_service import SQLQueryService
 
-sql_context = pl.SQLContext()
-sql_context.register("movies", df_movies)
-sql_context.register("movie_genre", df_movie_genre)
+query_service = SQLQueryService()
 
-df_movies_with_no_genre = sql_context.execute(
-    """
+movies_with_no_genre_query = """
     SELECT 
         m.movie_id, m.title, m.release_date
     FROM
@@ -37,5 +18,27 @@ df_movies_with_no_genre = sql_context.execute(
         mg.genre_id IS NULL
     ORDER BY
         m.release_date    
-    """).collect()
-print(df_movies_with_no_genre)
\ No newline at end of file
+    """
+
+release_year_histogram_query = """
+    SELECT 
+        CAST(SUBSTR(release_date, 1, 4) AS INTEGER) AS release_year, COUNT(*) AS number_of_movies
+    FROM
+        movies
+    GROUP BY
+        release_year
+    HAVING
+        COUNT(*) > :min_number_of_movies
+    ORDER BY
+        number_of_movies DESC
+    """
+
+df_movies_with_no_genre = query_service.execute(movies_with_no_genre_query)
+print(df_movies_with_no_genre)
+
+df_release_year_histogram = query_service.execute(release_year_histogram_query, {"min_number_of_movies": 30})
+print(df_release_year_histogram)
+
+# The results in batches, e.g. to send them over the network
+for df_batch in query_service.iter_batches(movies_with_no_genre_query, batch_size=10):
+    print(df_batch.shape)
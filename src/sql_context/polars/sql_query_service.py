@@ -0,0 +1,222 @@
+"""
+A reusable SQL query service over a Polars `SQLContext`.
+
+`SQLQueryService` registers the tables once, as LazyFrames scanning the data files (see
+`MovieDataProviderForPolars.scan_json_as_lazyframe`), so a query reads only the columns and row groups it needs.
+The result of a query is cached by its rendered SQL text (the query with its parameter values) and by the
+fingerprint of the data files (path, size and modification time), so a repeated call returns a clone of the cached
+DataFrame until a data file changes (a clone shares the data of the columns, so a caller renaming or dropping
+columns does not alter the cache).
+
+The plans are not cached: the SQL of Polars has no bind parameters, so a plan holds the values of its parameters
+and would only be reused by the same rendered query, which the result cache already serves. Building a plan
+(`SQLContext.execute(eager=False)`) is cheap next to running it.
+
+Queries take named parameters (`:name`), rendered as SQL literals, and results can be consumed in batches.
+"""
+import os
+import re
+import sys
+import math
+import datetime
+import polars as pl
+from collections import OrderedDict
+from typing import Any, Iterator, Mapping, Optional, Sequence, Tuple
+
+data_provider_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../', 'data_providers'))
+sys.path.insert(0, data_provider_path)
+from movie_data_provider import MovieDataProviderForPolars
+
+DEFAULT_TABLES = ('movies', 'movie_genre', 'genres', 'actors')
+
+# `:name` outside of string literals, quoted identifiers and comments, `::` casts are left alone
+PARAMETER_PATTERN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/|(?<![:\w]):([A-Za-z_]\w*)",
+                               re.DOTALL)
+
+
+class SQLQueryService:
+    """
+    Runs SQL queries on the movie tables, with the results of repeated queries cached.
+
+    Examples:
+        >>> query_service = SQLQueryService()
+        >>> query_service.execute("SELECT title FROM movies WHERE vote_average >= :min_vote", {"min_vote": 8.0})
+        >>> for df_batch in query_service.iter_batches("SELECT * FROM movies", batch_size=1000):
+        ...     print(df_batch.height)
+    """
+
+    def __init__(self,
+                 tables: Sequence[str] = DEFAULT_TABLES,
+                 max_cached_results: int = 64):
+        """
+        :param tables: The tables registered in the SQL context, keys of `MovieDataProviderForPolars.TABLE_FILES`.
+        :param max_cached_results: The number of query results kept, the least recently used ones are dropped
+            first, 0 disables the result cache.
+        """
+        self.table_files = {table: MovieDataProviderForPolars.TABLE_FILES[table] for table in tables}
+        self.max_cached_results = max_cached_results
+        self.statistics = {'result_hits': 0, 'result_misses': 0}
+
+        self._results: OrderedDict[str, pl.DataFrame] = OrderedDict()
+        self._fingerprint: Optional[Tuple] = None
+        self._sql_context: Optional[pl.SQLContext] = None
+        self._refresh()
+
+    def execute(self, sql: str, parameters: Optional[Mapping[str, Any]] = None) -> pl.DataFrame:
+        """
+        Run a query, or return the cached result of the same query on unchanged data files.
+
+        :param sql: The SQL query, with `:name` placeholders for the parameters.
+        :param parameters: The parameter values by name.
+        :return: The result of the query.
+        """
+        self._refresh()
+        query = render_query(sql, parameters)
+
+        if query in self._results:
+            self.statistics['result_hits'] += 1
+            self._results.move_to_end(query)
+            return self._results[query].clone()
+
+        self.statistics['result_misses'] += 1
+        df_result = self.get_plan(query).collect()
+        if self.max_cached_results:
+            self._results[query] = df_result
+            if len(self._results) > self.max_cached_results:
+                self._results.popitem(last=False)
+            return df_result.clone()
+
+        return df_result
+
+    def iter_batches(self,
+                     sql: str,
+                     parameters: Optional[Mapping[str, Any]] = None,
+                     batch_size: int = 10_000) -> Iterator[pl.DataFrame]:
+        """
+        Return the result of a query in batches of at most `batch_size` rows.
+
+        A cached result is sliced without copying its data, every batch is a new DataFrame. Otherwise the query is run by the streaming engine, which
+        produces the batches one after the other, and the result is not cached.
+        """
+        self._refresh()
+        query = render_query(sql, parameters)
+
+        if query in self._results:
+            self.statistics['result_hits'] += 1
+            yield from self._results[query].iter_slices(batch_size)
+            return
+
+        for df_batch in self.get_plan(query).collect_batches(chunk_size=batch_size, engine='streaming'):
+            yield from df_batch.iter_slices(batch_size)
+
+    def explain(self, sql: str, parameters: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Return the optimized plan of a query, e.g. to check the pushdown of its projections and filters.
+        """
+        self._refresh()
+        return self.get_plan(render_query(sql, parameters)).explain()
+
+    def get_plan(self, query: str) -> pl.LazyFrame:
+        """
+        Return the plan (LazyFrame) of a rendered query, built by the SQL context.
+        """
+        return self._sql_context.execute(query, eager=False)
+
+    def clear_cache(self) -> None:
+        self._results.clear()
+
+    def _refresh(self) -> None:
+        """
+        Register the tables, again after a data file changed, in which case the cached results are dropped.
+        """
+        fingerprint = tuple(_get_file_fingerprint(MovieDataProviderForPolars.get_data_file_path(file_name))
+                            for file_name in self.table_files.values())
+        if fingerprint == self._fingerprint:
+            return
+
+        self.clear_cache()
+        self._sql_context = pl.SQLContext(
+            {table: MovieDataProviderForPolars.scan_json_as_lazyframe(
+                file_name, getattr(MovieDataProviderForPolars, f"get_{table}_schema"))
+             for table, file_name in self.table_files.items()})
+        self._fingerprint = fingerprint
+
+
+def render_query(sql: str, parameters: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Replace the `:name` placeholders of a query by the SQL literals of the parameter values.
+
+    Examples:
+        >>> render_query("SELECT * FROM movies WHERE title = :title", {"title": "Don't Look Up"})
+        "SELECT * FROM movies WHERE title = 'Don''t Look Up'"
+    """
+    parameters = parameters or {}
+
+    def render_parameter(match: re.Match) -> str:
+        name = match.group(1)
+        if name is None:
+            return match.group(0)
+        if name not in parameters:
+            raise KeyError(f"Missing value of the query parameter :{name}")
+
+        return to_sql_literal(parameters[name])
+
+    return PARAMETER_PATTERN.sub(render_parameter, sql)
+
+
+def to_sql_literal(value: Any) -> str:
+    """
+    Render a Python value as a SQL literal, a list or tuple as a parenthesized list (for `IN`).
+    """
+    if value is None:
+        return 'NULL'
+    if isinstance(value, bool):
+        return 'TRUE' if value else 'FALSE'
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"Unsupported non-finite query parameter value: {value}")
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return f"({', '.join(to_sql_literal(element) for element in value)})"
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        value = value.isoformat()
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+
+    raise TypeError(f"Unsupported query parameter type: {type(value).__name__}")
+
+
+def _get_file_fingerprint(path_to_file: str) -> Tuple:
+    stat = os.stat(path_to_file)
+    return path_to_file, stat.st_size, stat.st_mtime_ns
+
+
+if __name__ == '__main__':
+    import time
+
+    query_service = SQLQueryService()
+    query = "SELECT title, release_date FROM movies WHERE vote_average >= :min_vote AND movie_status IN :statuses"
+    parameters = {"min_vote": 8.0, "statuses": ["Released", "Post Production"]}
+
+    # Same results as a fresh SQL context, cached (execute) or streamed in batches (iter_batches)
+    for min_vote in (7.5, 8.0, 8.5):
+        parameters = {"min_vote": min_vote, "statuses": ["Released", "Post Production"]}
+        df_expected = pl.SQLContext(movies=MovieDataProviderForPolars.scan_movies()).execute(
+            render_query(query, parameters), eager=True)
+        assert pl.concat(query_service.iter_batches(query, parameters, batch_size=50)).equals(df_expected)
+        assert query_service.execute(query, parameters).equals(df_expected)
+        assert query_service.execute(query, parameters).equals(df_expected)
+
+    # Repeated calls are served by the result cache
+    start = time.perf_counter()
+    for _ in range(200):
+        query_service.execute(query, parameters)
+    print(f"Repeated parameterized query: {(time.perf_counter() - start) * 1000 / 200:.4f} ms per call")
+    print(query_service.statistics)
+
+    # The same query in a fresh SQL context, registering the table and planning the query on every call
+    start = time.perf_counter()
+    for _ in range(10):
+        pl.SQLContext(movies=MovieDataProviderForPolars.scan_movies()).execute(
+            render_query(query, parameters), eager=True)
+    print(f"Fresh SQL context: {(time.perf_counter() - start) * 1000 / 10:.4f} ms per call")